@@ -0,0 +1,81 @@
+"""
+Benchmark UDPipe analysis of texts one by one, in batches and by a pool of processes.
+"""
+
+import time
+
+from admin_utils.benchmarks.utils import get_parser
+from config.console_logging import get_child_logger
+from core_utils.annotation_pool import AnnotationPool
+from lab_6_pipeline.pipeline import UDPipeAnalyzer
+
+logger = get_child_logger(__file__)
+
+
+def count_tokens(conllu: str) -> int:
+    """
+    Count tokens of CoNLL-U markup.
+
+    Args:
+        conllu (str): CoNLL-U markup
+
+    Returns:
+        int: Number of token lines
+    """
+    return sum(1 for line in conllu.splitlines() if line and not line.startswith("#"))
+
+
+def main(count: int, batch_size: int, n_process: int, workers: list[int]) -> None:
+    """
+    Analyze a synthetic corpus one text at a time, in batches and in worker pools.
+
+    Args:
+        count (int): Number of articles
+        batch_size (int): Number of texts spaCy processes at once
+        n_process (int): Number of processes spaCy analyzes texts in
+        workers (list[int]): Sizes of annotation pools to measure
+    """
+    texts = [
+        f"Статья номер {article_id}. Мама мыла раму, а папа читал газету. " * 20
+        for article_id in range(1, count + 1)
+    ]
+    measurements: dict[str, UDPipeAnalyzer | AnnotationPool] = {
+        "one by one": UDPipeAnalyzer(batch_size=1),
+        f"batches of {batch_size}": UDPipeAnalyzer(batch_size=batch_size),
+    }
+    if n_process > 1:
+        measurements[f"batches of {batch_size}, {n_process} processes"] = UDPipeAnalyzer(
+            batch_size=batch_size, n_process=n_process
+        )
+    for max_workers in workers:
+        measurements[f"pool of {max_workers} workers"] = AnnotationPool(
+            UDPipeAnalyzer(batch_size=batch_size), max_workers, batch_size
+        )
+
+    reference = None
+    for name, analyzer in measurements.items():
+        start = time.perf_counter()
+        if reference is None:
+            conllu = [str(analyzer.analyze([text])[0]) for text in texts]
+        else:
+            conllu = [str(markup) for markup in analyzer.analyze(texts)]
+        elapsed = time.perf_counter() - start
+        tokens = sum(count_tokens(markup) for markup in conllu)
+        logger.info("%s: %.1f articles/s, %.0f tokens/s", name, count / elapsed, tokens / elapsed)
+        if reference is None:
+            reference = conllu
+        elif conllu != reference:
+            logger.error("%s: markup differs from the one produced text by text", name)
+        if isinstance(analyzer, AnnotationPool):
+            analyzer.close()
+
+
+if __name__ == "__main__":
+    parser = get_parser(500, "Number of articles")
+    parser.add_argument("--batch-size", type=int, default=64, help="Texts processed at once")
+    parser.add_argument("--processes", type=int, default=1, help="Number of spaCy processes")
+    parser.add_argument(
+        "--workers", type=int, nargs="*", default=[], help="Sizes of annotation pools"
+    )
+    args = parser.parse_args()
+    main(args.count, args.batch_size, args.processes, args.workers)
@@ -0,0 +1,64 @@
+"""
+Benchmark deduplication of artifacts in the blob store.
+"""
+
+import random
+import time
+
+from admin_utils.benchmarks.utils import get_parser, temporary_dataset
+from config.console_logging import get_child_logger
+from core_utils.article.article import Article
+from core_utils.article.blob_store import BlobStore, get_blob_store_path
+from core_utils.article.io import to_cleaned
+
+logger = get_child_logger(__file__)
+
+
+def main(count: int, duplicates: float, reruns: int) -> None:
+    """
+    Write cleaned texts of a corpus with duplicates several times.
+
+    Args:
+        count (int): Number of articles
+        duplicates (float): Share of articles duplicating another one
+        reruns (int): Number of pipeline reruns
+    """
+    words = [f"слово{index}" for index in range(2000)]
+    articles = []
+    for article_id in range(1, count + 1):
+        sample = Article(url=None, article_id=article_id)
+        if articles and random.random() < duplicates:
+            sample.text = random.choice(articles).text
+        else:
+            sample.text = " ".join(random.choices(words, k=500))
+        articles.append(sample)
+
+    with temporary_dataset() as path:
+        for writer in (None, BlobStore(get_blob_store_path(path))):
+            start = time.perf_counter()
+            for _ in range(reruns):
+                for sample in articles:
+                    to_cleaned(sample, writer=writer)
+            elapsed = time.perf_counter() - start
+            if writer is None:
+                logger.info("direct writes: %.2fs", elapsed)
+                continue
+            stats = writer.stats
+            logger.info(
+                "blob store: %.2fs, dedup ratio %.1f, %.1f MB written of %.1f MB requested, "
+                "%d of %d writes skipped",
+                elapsed,
+                stats.dedup_ratio,
+                stats.written_bytes / 2**20,
+                stats.requested_bytes / 2**20,
+                stats.skipped,
+                stats.writes,
+            )
+
+
+if __name__ == "__main__":
+    parser = get_parser(10_000, "Number of articles")
+    parser.add_argument("--duplicates", type=float, default=0.2, help="Share of duplicates")
+    parser.add_argument("--reruns", type=int, default=3, help="Number of pipeline reruns")
+    args = parser.parse_args()
+    main(args.count, args.duplicates, args.reruns)
@@ -0,0 +1,48 @@
+"""
+Benchmark loading corpus meta information from JSON files and from columns.
+"""
+
+import random
+
+from admin_utils.benchmarks.utils import get_parser, log_elapsed, temporary_dataset
+from config.console_logging import get_child_logger
+from core_utils.article.article import Article
+from core_utils.article.columns import ColumnStore, get_columns_path
+from core_utils.article.io import bulk_from_meta, from_meta, to_meta
+
+logger = get_child_logger(__file__)
+
+
+def main(count: int) -> None:
+    """
+    Store meta information of a synthetic corpus and load it back.
+
+    Args:
+        count (int): Number of articles
+    """
+    tags = ["NOUN", "VERB", "ADJ", "ADV", "PRON", "ADP", "CCONJ", "PUNCT"]
+    with temporary_dataset() as path:
+        articles = []
+        for article_id in range(1, count + 1):
+            sample = Article(url=f"https://example.com/{article_id}", article_id=article_id)
+            sample.title = f"Статья номер {article_id}"
+            sample.author = ["Красивая Мама"]
+            sample.topics = ["политика"]
+            sample.text = "Мама мыла раму. " * 100
+            sample.pos_frequencies = {tag: random.randint(0, 100) for tag in tags}
+            to_meta(sample)
+            articles.append(sample)
+        ColumnStore(get_columns_path(path)).append(articles)
+
+        paths = [sample.get_meta_file_path() for sample in articles]
+        with log_elapsed(logger, "from_meta"):
+            for meta_path in paths:
+                from_meta(meta_path)
+        with log_elapsed(logger, "bulk_from_meta"):
+            bulk_from_meta(paths)
+        with log_elapsed(logger, "columns"):
+            ColumnStore(get_columns_path(path)).load()
+
+
+if __name__ == "__main__":
+    main(get_parser(10_000, "Number of articles").parse_args().count)
@@ -0,0 +1,65 @@
+"""
+Benchmark disk usage and read throughput of compressed artifacts.
+"""
+
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from admin_utils.benchmarks.utils import get_parser
+from admin_utils.test_params import PIPE_TEST_FILES_FOLDER
+from config.console_logging import get_child_logger
+from core_utils.article import codecs
+from core_utils.article.codecs import Codec, open_text_reader, write_text
+
+logger = get_child_logger(__file__)
+
+
+def main(count: int, copies: int) -> None:
+    """
+    Compare plain and compressed CONLL-U artifacts.
+
+    Args:
+        count (int): Number of artifacts
+        copies (int): Number of reference document copies in each artifact
+    """
+    with open(PIPE_TEST_FILES_FOLDER / "reference_udpipe_test.conllu", encoding="utf-8") as file:
+        content = file.read() * copies
+
+    available = [codec for codec in Codec if codec is not Codec.ZSTD or codecs.zstandard]
+    plain_size = 0
+    for codec in available:
+        path = Path(tempfile.mkdtemp())
+        try:
+            stored = [
+                write_text(path / f"{article_id}_udpipe_conllu.conllu", content, codec)
+                for article_id in range(1, count + 1)
+            ]
+            size = sum(artifact.stat().st_size for artifact in stored)
+            plain_size = plain_size or size
+
+            start = time.perf_counter()
+            lines = 0
+            for artifact in stored:
+                with open_text_reader(artifact) as file:
+                    lines += sum(1 for _ in file)
+            elapsed = time.perf_counter() - start
+
+            logger.info(
+                "codec=%s: %.1f MB on disk (%.1f%% of plain), read %.1f MB/s of text, %d lines",
+                codec.name,
+                size / 2**20,
+                100 * size / plain_size,
+                len(content.encode("utf-8")) * count / 2**20 / elapsed,
+                lines,
+            )
+        finally:
+            shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    parser = get_parser(1000, "Number of artifacts")
+    parser.add_argument("--copies", type=int, default=100, help="Document copies per artifact")
+    args = parser.parse_args()
+    main(args.count, args.copies)
@@ -0,0 +1,104 @@
+"""
+Benchmark memory of unified document words and sentences per million tokens.
+"""
+
+import tracemalloc
+from typing import Any, Callable
+
+from admin_utils.benchmarks.utils import get_parser
+from config.console_logging import get_child_logger
+from core_utils.article.conllu import parse_conllu
+from core_utils.pipeline import CompactConLLUSentence, CompactConLLUWord, ConLLUSentence, ConLLUWord
+
+logger = get_child_logger(__file__)
+
+#: Sentence repeated to make the corpus
+SENTENCE = (
+    "# sent_id = 1\n"
+    "# text = Мама мыла раму, а папа читал газету.\n"
+    "1\tМама\tмама\tNOUN\t_\t_\t2\tnsubj\t_\t_\n"
+    "2\tмыла\tмыть\tVERB\t_\t_\t0\tROOT\t_\t_\n"
+    "3\tраму\tрама\tNOUN\t_\t_\t2\tobj\t_\tSpaceAfter=No\n"
+    "4\t,\t,\tPUNCT\t_\t_\t7\tpunct\t_\t_\n"
+    "5\tа\tа\tCCONJ\t_\t_\t7\tcc\t_\t_\n"
+    "6\tпапа\tпапа\tNOUN\t_\t_\t7\tnsubj\t_\t_\n"
+    "7\tчитал\tчитать\tVERB\t_\t_\t2\tconj\t_\t_\n"
+    "8\tгазету\tгазета\tNOUN\t_\t_\t7\tobj\t_\tSpaceAfter=No\n"
+    "9\t.\t.\tPUNCT\t_\t_\t2\tpunct\t_\t_\n"
+    "\n"
+)
+
+
+def read_words(conllu: str) -> list[list[ConLLUWord]]:
+    """
+    Read markup into words of the unified document, as analyzer wrappers do.
+
+    Args:
+        conllu (str): CONLL-U markup
+
+    Returns:
+        list[list[ConLLUWord]]: Words of every sentence
+    """
+    sentences: list[list[ConLLUWord]] = [[]]
+    for line in conllu.splitlines():
+        if not line:
+            sentences.append([])
+        elif not line.startswith("#"):
+            fields = line.split("\t")
+            sentences[-1].append(
+                ConLLUWord(
+                    id=fields[0], upos=fields[3], head=fields[6], deprel=fields[7], text=fields[1]
+                )
+            )
+    return [words for words in sentences if words]
+
+
+def measure(name: str, build: Callable[[], Any], tokens: int) -> None:
+    """
+    Measure memory taken by a representation of the corpus.
+
+    Args:
+        name (str): Name of the representation
+        build (Callable[[], Any]): Function building the representation
+        tokens (int): Number of tokens in the corpus
+    """
+    tracemalloc.start()
+    representation = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del representation
+    logger.info("%s: %.1f MB per million tokens", name, size / tokens * 1e6 / 2**20)
+
+
+def main(count: int) -> None:
+    """
+    Build every representation of a synthetic corpus.
+
+    Args:
+        count (int): Number of sentences
+    """
+    conllu = SENTENCE * count
+    tokens = len(parse_conllu(conllu).columns)
+    measure(
+        "ConLLUSentence of ConLLUWord",
+        lambda: [ConLLUSentence(words) for words in read_words(conllu)],
+        tokens,
+    )
+    measure(
+        "lists of CompactConLLUWord",
+        lambda: [
+            [CompactConLLUWord.from_word(word) for word in words] for words in read_words(conllu)
+        ],
+        tokens,
+    )
+    measure(
+        "CompactConLLUSentence",
+        lambda: [CompactConLLUSentence(words) for words in read_words(conllu)],
+        tokens,
+    )
+    measure("ConlluDocument columns", lambda: parse_conllu(conllu), tokens)
+
+
+if __name__ == "__main__":
+    parser = get_parser(100000, "Number of sentences")
+    main(parser.parse_args().count)
@@ -0,0 +1,67 @@
+"""
+Benchmark reading CONLL-U markup into spaCy documents and into columns.
+"""
+
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from spacy_conll.parser import ConllParser
+
+from admin_utils.benchmarks.utils import get_parser
+from config.console_logging import get_child_logger
+from core_utils.article.conllu import parse_conllu
+from lab_6_pipeline.pipeline import UDPipeAnalyzer
+
+logger = get_child_logger(__file__)
+
+
+def measure(name: str, read: Callable[[str], Any], conllu: str, tokens: int) -> None:
+    """
+    Measure speed and memory of reading markup.
+
+    Args:
+        name (str): Name of the reader
+        read (Callable[[str], Any]): Function reading markup into a document
+        conllu (str): CONLL-U markup
+        tokens (int): Number of tokens in the markup
+    """
+    start = time.perf_counter()
+    read(conllu)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    document = read(conllu)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del document
+    logger.info(
+        "%s: %.0f tokens/s, %.1f MB per million tokens",
+        name,
+        tokens / elapsed,
+        size / tokens * 1e6 / 2**20,
+    )
+
+
+def main(count: int) -> None:
+    """
+    Annotate a synthetic text and read its markup back in both ways.
+
+    Args:
+        count (int): Number of sentences
+    """
+    analyzer = UDPipeAnalyzer()
+    conllu = str(analyzer.analyze(["Мама мыла раму, а папа читал газету. " * count])[0])
+    tokens = len(parse_conllu(conllu).columns)
+    parser = ConllParser(analyzer._analyzer)  # pylint: disable=protected-access
+    measure(
+        "spaCy documents",
+        lambda markup: parser.parse_conll_text_as_spacy(markup.strip("\n")),
+        conllu,
+        tokens,
+    )
+    measure("columns", parse_conllu, conllu, tokens)
+
+
+if __name__ == "__main__":
+    arg_parser = get_parser(10000, "Number of sentences")
+    main(arg_parser.parse_args().count)
@@ -0,0 +1,53 @@
+"""
+Benchmark date parsing against strptime.
+"""
+
+import datetime
+import time
+from typing import Callable
+
+from admin_utils.benchmarks.utils import get_parser
+from config.console_logging import get_child_logger
+from core_utils.article.dates import parse_date, parse_iso_datetime, parse_meta_date
+
+logger = get_child_logger(__file__)
+
+
+def main(count: int, unique: int) -> None:
+    """
+    Compare date parsers.
+
+    Args:
+        count (int): Number of dates to parse
+        unique (int): Number of distinct dates
+    """
+    start_date = datetime.datetime(2000, 1, 1)
+    distinct = [
+        f"{start_date + datetime.timedelta(minutes=17 * index):%Y-%m-%d %H:%M:%S}"
+        for index in range(unique)
+    ]
+    dates = [distinct[index % unique] for index in range(count)]
+    russian = [f"{index % 28 + 1} мая 2025, {index % 24}:30" for index in range(count)]
+
+    parsers: dict[str, Callable[[str], datetime.datetime]] = {
+        "strptime": lambda date_txt: datetime.datetime.strptime(date_txt, "%Y-%m-%d %H:%M:%S"),
+        "parse_iso_datetime": parse_iso_datetime,
+        "parse_meta_date (cached)": parse_meta_date,
+    }
+    for name, parse in parsers.items():
+        start = time.perf_counter()
+        for date_txt in dates:
+            parse(date_txt)
+        logger.info("%s: %.2fs for %d dates", name, time.perf_counter() - start, count)
+
+    start = time.perf_counter()
+    for date_txt in russian:
+        parse_date(date_txt)
+    logger.info("parse_date (Russian): %.2fs for %d dates", time.perf_counter() - start, count)
+
+
+if __name__ == "__main__":
+    parser = get_parser(1_000_000, "Number of dates")
+    parser.add_argument("--unique", type=int, default=10_000, help="Number of distinct dates")
+    args = parser.parse_args()
+    main(args.count, args.unique)
@@ -0,0 +1,89 @@
+"""
+Benchmark durable writing of artifacts with and without group commit.
+"""
+
+# pylint: disable=too-few-public-methods
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Sequence
+
+from admin_utils.benchmarks.utils import get_parser, log_elapsed
+from config.console_logging import get_child_logger
+from core_utils.article import article
+from core_utils.article.article import Article
+from core_utils.article.group_commit import GroupCommitWriter
+from core_utils.article.io import to_meta, to_raw
+
+logger = get_child_logger(__file__)
+
+
+class FsyncWriter:
+    """
+    Writer making every artifact durable on its own.
+    """
+
+    def write(self, path: Path, data: bytes, obsolete: Sequence[Path] = ()) -> None:
+        """
+        Write artifact to a temporary file, fsync it and rename.
+
+        Args:
+            path (Path): Path to the artifact
+            data (bytes): Content
+            obsolete (Sequence[Path]): Files removed once the artifact is durable
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.tmp")
+        with open(temp_path, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+        for obsolete_path in obsolete:
+            obsolete_path.unlink(missing_ok=True)
+        descriptor = os.open(path.parent, os.O_RDONLY)
+        os.fsync(descriptor)
+        os.close(descriptor)
+
+
+def main(count: int, max_files: int) -> None:
+    """
+    Write raw texts and meta files of a corpus in several ways.
+
+    Args:
+        count (int): Number of articles
+        max_files (int): Number of files committed together
+    """
+    articles = []
+    for article_id in range(1, count + 1):
+        sample = Article(url=f"https://example.com/{article_id}", article_id=article_id)
+        sample.text = "Мама мыла раму. " * 200
+        articles.append(sample)
+
+    root = Path(tempfile.mkdtemp())
+    assets_path = article.ASSETS_PATH
+    try:
+        for name in ("direct", "fsync per file", "group commit"):
+            article.ASSETS_PATH = root / name.replace(" ", "_")
+            writer = {
+                "direct": None,
+                "fsync per file": FsyncWriter(),
+                "group commit": GroupCommitWriter(max_files=max_files),
+            }[name]
+            with log_elapsed(logger, name):
+                for sample in articles:
+                    to_raw(sample, writer=writer)
+                    to_meta(sample, writer=writer)
+                if isinstance(writer, GroupCommitWriter):
+                    writer.close()
+    finally:
+        article.ASSETS_PATH = assets_path
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    parser = get_parser(2000, "Number of articles")
+    parser.add_argument("--max-files", type=int, default=256, help="Files per commit")
+    args = parser.parse_args()
+    main(args.count, args.max_files)
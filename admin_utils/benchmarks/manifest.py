@@ -0,0 +1,78 @@
+"""
+Benchmark building the dataset manifest with and without the cached one.
+"""
+
+import time
+from pathlib import Path
+
+from admin_utils.benchmarks.utils import get_parser, temporary_dataset
+from config.console_logging import get_child_logger
+from core_utils.article import article
+from core_utils.article.article import Article
+from core_utils.article.io import to_meta, to_raw
+from core_utils.article.manifest import build_manifest, load_manifest, RACY_WINDOW_NS, save_manifest
+
+logger = get_child_logger(__file__)
+
+
+def measure(name: str, path: Path) -> None:
+    """
+    Build the manifest from the cached one, request hashes of raw texts and save it.
+
+    Hashes are requested the way the freshness check of the pipeline does.
+
+    Args:
+        name (str): Name of the measurement
+        path (Path): Dataset root
+    """
+    start = time.perf_counter()
+    manifest = build_manifest(path, load_manifest(path))
+    built = time.perf_counter() - start
+    hashed = sum(1 for files in manifest.entries.values() if not files.raw_hash)
+    for files in manifest.entries.values():
+        files.get_raw_hash()
+    elapsed = time.perf_counter() - start
+    save_manifest(path, manifest)
+    logger.info(
+        "%s: %.2fs to build, %.2fs with hashes, %d directories listed, %d files hashed",
+        name,
+        built,
+        elapsed,
+        manifest.listed,
+        hashed,
+    )
+
+
+def main(count: int, depth: int) -> None:
+    """
+    Build manifests of a synthetic dataset in several states.
+
+    Args:
+        count (int): Number of articles
+        depth (int): Number of shard levels
+    """
+    article.ASSETS_SHARD_DEPTH = depth
+    with temporary_dataset() as path:
+        for article_id in range(1, count + 1):
+            sample = Article(url=None, article_id=article_id)
+            sample.text = "Мама мыла раму. " * 100
+            to_raw(sample)
+            to_meta(sample)
+
+        measure("no cache", path)
+        time.sleep(RACY_WINDOW_NS / 1e9)
+        measure("racy directories", path)
+        measure("unchanged", path)
+
+        sample = Article(url=None, article_id=1)
+        sample.text = "Папа мыл раму."
+        to_raw(sample)
+        time.sleep(RACY_WINDOW_NS / 1e9)
+        measure("one article changed", path)
+
+
+if __name__ == "__main__":
+    parser = get_parser(100_000, "Number of articles")
+    parser.add_argument("--depth", type=int, default=0, help="Number of shard levels")
+    args = parser.parse_args()
+    main(args.count, args.depth)
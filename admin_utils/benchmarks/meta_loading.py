@@ -0,0 +1,68 @@
+"""
+Benchmark loading of meta files with different serializers.
+"""
+
+from pathlib import Path
+
+from admin_utils.benchmarks.utils import get_parser, log_elapsed, temporary_dataset
+from config.console_logging import get_child_logger
+from core_utils.article.article import Article
+from core_utils.article.io import bulk_from_meta, from_meta, to_meta
+from core_utils.article.serialization import get_serializer
+
+logger = get_child_logger(__file__)
+
+
+def generate_dataset(count: int, compact: bool) -> list[Path]:
+    """
+    Create meta files in the current dataset.
+
+    Args:
+        count (int): Number of meta files
+        compact (bool): Whether to save meta files without indentation
+
+    Returns:
+        list[Path]: Paths to generated meta files
+    """
+    paths = []
+    for article_id in range(1, count + 1):
+        sample = Article(url=f"https://example.com/{article_id}", article_id=article_id)
+        sample.title = "Заголовок статьи"
+        sample.author = ["Красивая Мама"]
+        sample.topics = ["Новости"]
+        sample.pos_frequencies = {"NOUN": 6, "VERB": 1, "ADJ": 2, "PUNCT": 1}
+        to_meta(sample, compact=compact)
+        paths.append(sample.get_meta_file_path())
+    return paths
+
+
+def main(count: int, workers: int) -> None:
+    """
+    Compare sequential and bulk loading of meta files.
+
+    Args:
+        count (int): Number of meta files
+        workers (int): Number of threads for bulk loading
+    """
+    for compact in (False, True):
+        with temporary_dataset():
+            paths = generate_dataset(count, compact)
+            for name in ("json", "orjson"):
+                try:
+                    serializer = get_serializer(name)
+                except ValueError:
+                    logger.info("Serializer %s is not available, skipping", name)
+                    continue
+
+                with log_elapsed(logger, f"compact={compact} serializer={name}: from_meta"):
+                    for meta_path in paths:
+                        from_meta(meta_path, serializer=serializer)
+                with log_elapsed(logger, f"compact={compact} serializer={name}: bulk_from_meta"):
+                    bulk_from_meta(paths, max_workers=workers, serializer=serializer)
+
+
+if __name__ == "__main__":
+    parser = get_parser(100_000, "Number of meta files")
+    parser.add_argument("--workers", type=int, default=8, help="Number of threads")
+    args = parser.parse_args()
+    main(args.count, args.workers)
@@ -0,0 +1,60 @@
+"""
+Benchmark startup time and memory of analyzers with and without the shared model registry.
+"""
+
+import resource
+import time
+
+from admin_utils.benchmarks.utils import get_parser
+from config.console_logging import get_child_logger
+from core_utils.model_registry import MODEL_REGISTRY
+from lab_6_pipeline.pipeline import UDPipeAnalyzer
+
+logger = get_child_logger(__file__)
+
+
+def get_peak_memory() -> float:
+    """
+    Get peak resident memory of the process.
+
+    Returns:
+        float: Peak resident memory in megabytes
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(count: int, shared: bool) -> None:
+    """
+    Create analyzers and analyze a text with each, as a pipeline run and the tests do.
+
+    Every mode should be measured in a separate process, since peak memory only grows.
+
+    Args:
+        count (int): Number of analyzers
+        shared (bool): Whether analyzers share the model through the registry
+    """
+    models = []
+    start_memory = get_peak_memory()
+    start = time.perf_counter()
+    for _ in range(count):
+        if not shared:
+            # every analyzer loading and keeping its own model, as before the registry
+            MODEL_REGISTRY.clear()
+        analyzer = UDPipeAnalyzer()
+        analyzer.analyze(["Мама мыла раму."])
+        models.append(analyzer._analyzer)  # pylint: disable=protected-access
+    logger.info(
+        "%s: %d analyzers in %.2fs, %d models loaded, peak memory grew by %.0f MB",
+        "shared" if shared else "separate",
+        count,
+        time.perf_counter() - start,
+        len({id(model) for model in models}),
+        get_peak_memory() - start_memory,
+    )
+
+
+if __name__ == "__main__":
+    parser = get_parser(10, "Number of analyzers")
+    parser.add_argument("--separate", action="store_true", help="Load a model for every analyzer")
+    args = parser.parse_args()
+    main(args.count, not args.separate)
@@ -0,0 +1,63 @@
+"""
+Benchmark loading raw texts sequentially and with a thread pool, cold and warm.
+"""
+
+import os
+from pathlib import Path
+
+from admin_utils.benchmarks.utils import get_parser, log_elapsed, temporary_dataset
+from config.console_logging import get_child_logger
+from core_utils.article.article import Article
+from core_utils.article.io import bulk_from_raw, from_raw, to_raw
+
+logger = get_child_logger(__file__)
+
+
+def evict(paths: list[Path]) -> None:
+    """
+    Drop the files from the page cache.
+
+    Args:
+        paths (list[Path]): Paths to the files
+    """
+    for path in paths:
+        descriptor = os.open(path, os.O_RDONLY)
+        os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_DONTNEED)
+        os.close(descriptor)
+
+
+def main(count: int, workers: int) -> None:
+    """
+    Load raw texts of a synthetic corpus in several ways.
+
+    Args:
+        count (int): Number of articles
+        workers (int): Number of threads
+    """
+    paths = []
+    with temporary_dataset():
+        for article_id in range(1, count + 1):
+            sample = Article(url=None, article_id=article_id)
+            sample.text = "Мама мыла раму. " * 500
+            to_raw(sample)
+            paths.append(sample.get_raw_text_path())
+        os.sync()
+
+        loaders = {
+            "sequential": lambda: [from_raw(raw_path) for raw_path in paths],
+            "threads": lambda: bulk_from_raw(paths, workers),
+            "threads + readahead": lambda: bulk_from_raw(paths, workers, prefetch=True),
+        }
+        for name, load in loaders.items():
+            for cache in ("cold", "warm"):
+                if cache == "cold":
+                    evict(paths)
+                with log_elapsed(logger, f"{name}, {cache} cache"):
+                    load()
+
+
+if __name__ == "__main__":
+    parser = get_parser(50_000, "Number of articles")
+    parser.add_argument("--workers", type=int, default=16, help="Number of threads")
+    args = parser.parse_args()
+    main(args.count, args.workers)
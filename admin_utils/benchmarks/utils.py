@@ -0,0 +1,66 @@
+"""
+Scaffolding shared by benchmarks: command line, synthetic datasets and timing.
+"""
+
+import argparse
+import contextlib
+import shutil
+import tempfile
+import time
+from logging import Logger
+from pathlib import Path
+from typing import Iterator
+
+from core_utils.article import article
+from core_utils.article.sidecars import remove_sidecars
+
+
+def get_parser(count: int, count_help: str) -> argparse.ArgumentParser:
+    """
+    Get a parser of benchmark options with the size of the benchmark already added.
+
+    Args:
+        count (int): Default value of --count
+        count_help (str): Help of --count, e.g. "Number of articles"
+
+    Returns:
+        argparse.ArgumentParser: Parser to add other options to
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=count, help=count_help)
+    return parser
+
+
+@contextlib.contextmanager
+def temporary_dataset() -> Iterator[Path]:
+    """
+    Use a temporary directory as the dataset, removing it with its derived files on exit.
+
+    Returns:
+        Iterator[Path]: Dataset root, set as article.ASSETS_PATH until exit
+    """
+    path = Path(tempfile.mkdtemp()) / "articles"
+    assets_path, article.ASSETS_PATH = article.ASSETS_PATH, path
+    try:
+        yield path
+    finally:
+        article.ASSETS_PATH = assets_path
+        remove_sidecars(path)
+        shutil.rmtree(path.parent)
+
+
+@contextlib.contextmanager
+def log_elapsed(logger: Logger, name: str) -> Iterator[None]:
+    """
+    Log the time the block took.
+
+    Args:
+        logger (Logger): Logger of the benchmark
+        name (str): Name of the measurement
+
+    Returns:
+        Iterator[None]: Nothing, the time is logged on exit
+    """
+    start = time.perf_counter()
+    yield
+    logger.info("%s: %.2fs", name, time.perf_counter() - start)
@@ -0,0 +1,244 @@
+"""
+Benchmark dataset validation with multiple directory passes and with a single one.
+"""
+
+import contextlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Iterator
+
+from admin_utils.benchmarks.utils import get_parser
+from config.console_logging import get_child_logger
+from core_utils.article.manifest import build_manifest, load_manifest, save_manifest
+from core_utils.article.sidecars import remove_sidecars
+
+logger = get_child_logger(__file__)
+
+#: Numbers of directory listings, stat calls and opened files since the last reset
+COUNTS = dict.fromkeys(("listings", "stats", "opens"), 0)
+
+
+def count_audit_events(event: str, *_: object) -> None:
+    """
+    Count directory listings and opened files.
+
+    Args:
+        event (str): Audit event name
+        *_ (object): Audit event arguments, not needed
+    """
+    if event in ("os.scandir", "os.listdir"):
+        COUNTS["listings"] += 1
+    elif event == "open":
+        COUNTS["opens"] += 1
+
+
+class CountedEntry:
+    """
+    Directory entry counting the stat call its first stat() makes.
+
+    os.DirEntry caches the result of the call, so later calls are free.
+    """
+
+    def __init__(self, entry: os.DirEntry[str]) -> None:
+        """
+        Initialize an instance of the CountedEntry class.
+
+        Args:
+            entry (os.DirEntry[str]): Entry of os.scandir()
+        """
+        self._entry = entry
+        self._stated = False
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Get an attribute of the wrapped entry.
+
+        Args:
+            name (str): Attribute name
+
+        Returns:
+            Any: Attribute value
+        """
+        return getattr(self._entry, name)
+
+    def __fspath__(self) -> str:
+        """
+        Get the path of the entry.
+
+        Returns:
+            str: Path
+        """
+        return self._entry.path
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        """
+        Get the state of the file, counting the call that is not cached yet.
+
+        Args:
+            follow_symlinks (bool): Whether to follow a symbolic link
+
+        Returns:
+            os.stat_result: State of the file
+        """
+        if not self._stated:
+            self._stated = True
+            COUNTS["stats"] += 1
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+
+class CountedScandir:
+    """
+    Iterator of os.scandir() yielding entries that count their stat calls.
+    """
+
+    def __init__(self, entries: Iterator[os.DirEntry[str]]) -> None:
+        """
+        Initialize an instance of the CountedScandir class.
+
+        Args:
+            entries (Iterator[os.DirEntry[str]]): Iterator of os.scandir()
+        """
+        self._entries = entries
+
+    def __enter__(self) -> "CountedScandir":
+        """
+        Enter the runtime context.
+
+        Returns:
+            CountedScandir: The iterator itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Close the directory on exit from the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def __iter__(self) -> Iterator[CountedEntry]:
+        """
+        Iterate over entries of the directory.
+
+        Yields:
+            CountedEntry: Next entry
+        """
+        for entry in self._entries:
+            yield CountedEntry(entry)
+
+    def close(self) -> None:
+        """
+        Close the directory.
+        """
+        self._entries.close()  # type: ignore[attr-defined]
+
+
+@contextlib.contextmanager
+def count_stat_calls() -> Iterator[None]:
+    """
+    Count calls of os.stat() and first calls of stat() of directory entries.
+
+    There is no audit event for stat calls, so both functions are replaced
+    while the context is active. pathlib calls os.stat() as well.
+
+    Yields:
+        None: Nothing, counts are added to COUNTS
+    """
+    stat, scandir = os.stat, os.scandir
+
+    def counted_stat(*args: Any, **kwargs: Any) -> os.stat_result:
+        COUNTS["stats"] += 1
+        return stat(*args, **kwargs)
+
+    os.stat = counted_stat  # type: ignore[assignment]
+    os.scandir = lambda *args: CountedScandir(scandir(*args))  # type: ignore[assignment]
+    try:
+        yield
+    finally:
+        os.stat, os.scandir = stat, scandir
+
+
+def validate_with_passes(path: Path) -> int:
+    """
+    Validate the dataset the way CorpusManager did before the manifest.
+
+    Args:
+        path (Path): Dataset root
+
+    Returns:
+        int: Number of raw files
+    """
+    assert any(path.iterdir())
+    raw = [f.name for f in path.iterdir() if f.is_file() and f.name.endswith("_raw.txt")]
+    meta = [f.name for f in path.iterdir() if f.is_file() and f.name.endswith("_meta.json")]
+    assert len(raw) == len(meta)
+    for file_raw in path.glob("*_raw.txt"):
+        assert file_raw.stat().st_size
+    for file_meta in path.glob("*_meta.json"):
+        assert file_meta.stat().st_size
+    return len(list(path.glob("*_raw.txt")))
+
+
+def validate_with_manifest(path: Path) -> int:
+    """
+    Validate the dataset with a single directory pass, reusing the manifest saved by the last one.
+
+    Args:
+        path (Path): Dataset root
+
+    Returns:
+        int: Number of raw files
+    """
+    manifest = build_manifest(path, load_manifest(path))
+    assert manifest.raw_count == manifest.meta_count
+    for files in manifest.entries.values():
+        assert files.raw_size and files.meta_size
+    save_manifest(path, manifest)
+    return len(manifest.get_raw_ids())
+
+
+def main(count: int) -> None:
+    """
+    Validate a flat dataset of the given size in both ways.
+
+    Args:
+        count (int): Number of files, half of them raw texts
+    """
+    path = Path(tempfile.mkdtemp())
+    try:
+        for article_id in range(1, count // 2 + 1):
+            (path / f"{article_id}_raw.txt").write_text("text", encoding="utf-8")
+            (path / f"{article_id}_meta.json").write_text("{}", encoding="utf-8")
+        sys.addaudithook(count_audit_events)
+
+        for name, validate in (
+            ("multiple passes", validate_with_passes),
+            ("manifest", validate_with_manifest),
+            ("saved manifest", validate_with_manifest),
+        ):
+            COUNTS.update(dict.fromkeys(COUNTS, 0))
+            start = time.perf_counter()
+            with count_stat_calls():
+                validate(path)
+            logger.info(
+                "%s: %.2fs, %d directory listings, %d stat calls, %d files opened",
+                name,
+                time.perf_counter() - start,
+                COUNTS["listings"],
+                COUNTS["stats"],
+                COUNTS["opens"],
+            )
+    finally:
+        remove_sidecars(path)
+        shutil.rmtree(path)
+
+
+if __name__ == "__main__":
+    parser = get_parser(200_000, "Number of files")
+    main(parser.parse_args().count)
@@ -0,0 +1,18 @@
+"""
+Rebuild the meta index of the articles dataset.
+"""
+
+import argparse
+import pathlib
+
+from config.console_logging import get_child_logger
+from core_utils.article.meta_index import get_index_path, rebuild_index
+from core_utils.constants import ASSETS_PATH
+
+logger = get_child_logger(__file__)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", type=pathlib.Path, default=ASSETS_PATH, help="Dataset root")
+    args = parser.parse_args()
+    logger.info("Indexed %d articles in %s", rebuild_index(args.path), get_index_path(args.path))
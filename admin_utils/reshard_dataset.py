@@ -0,0 +1,82 @@
+"""
+Move articles dataset files to another directory layout.
+"""
+
+import argparse
+import os
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+
+from config.console_logging import get_child_logger
+from core_utils.article.article import get_article_id_from_filepath
+from core_utils.article.layout import get_article_dir, is_shard_dir, iter_dataset_files
+from core_utils.constants import ASSETS_PATH
+
+logger = get_child_logger(__file__)
+
+
+def move_file(path: pathlib.Path, base: pathlib.Path, depth: int) -> bool:
+    """
+    Move a dataset file to its place in the requested layout.
+
+    Args:
+        path (pathlib.Path): Path to a dataset file
+        base (pathlib.Path): Dataset root
+        depth (int): Number of shard levels, 0 stands for the flat layout
+
+    Returns:
+        bool: True if the file was moved
+    """
+    try:
+        article_id = get_article_id_from_filepath(path)
+    except ValueError:
+        return False
+    target_dir = get_article_dir(base, article_id, depth)
+    if path.parent == target_dir:
+        return False
+    target_dir.mkdir(parents=True, exist_ok=True)
+    os.replace(path, target_dir / path.name)
+    return True
+
+
+def remove_empty_shards(path: pathlib.Path) -> None:
+    """
+    Remove shard directories left empty after moving files.
+
+    Args:
+        path (pathlib.Path): Directory to clean up
+    """
+    with os.scandir(path) as entries:
+        shards = [pathlib.Path(entry.path) for entry in entries if is_shard_dir(entry)]
+    for shard in shards:
+        remove_empty_shards(shard)
+        if not any(shard.iterdir()):
+            shard.rmdir()
+
+
+def reshard(base: pathlib.Path, depth: int, max_workers: int | None = None) -> int:
+    """
+    Move dataset files to the layout with the given number of shard levels.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        depth (int): Number of shard levels, 0 stands for the flat layout
+        max_workers (int | None): Number of threads, chosen by the executor by default
+
+    Returns:
+        int: Number of moved files
+    """
+    files = list(iter_dataset_files(base))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        moved = sum(executor.map(lambda path: move_file(path, base, depth), files))
+    remove_empty_shards(base)
+    return moved
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("depth", type=int, help="Number of shard levels, 0 for the flat layout")
+    parser.add_argument("--path", type=pathlib.Path, default=ASSETS_PATH, help="Dataset root")
+    parser.add_argument("--workers", type=int, default=None, help="Number of threads")
+    args = parser.parse_args()
+    logger.info("Moved %d files", reshard(args.path, args.depth, args.workers))
@@ -0,0 +1,152 @@
+"""
+Run a pipeline over one shard of the articles dataset or merge results of all shards.
+
+Every worker plans the shards from the same dataset, so processes on different
+machines sharing the dataset directory get the same plan without coordination:
+
+    python admin_utils/run_pipeline_shard.py --shards 4 run text --index 0
+    ...
+    python admin_utils/run_pipeline_shard.py --shards 4 run text --index 3
+    python admin_utils/run_pipeline_shard.py --shards 4 merge
+"""
+
+import argparse
+import contextlib
+import pathlib
+from typing import Optional
+
+from config.console_logging import get_child_logger
+from core_utils.annotation_cache import AnnotationCache, get_annotation_cache_path
+from core_utils.article import article
+from core_utils.article.sharding import (
+    collect_shard,
+    get_merged_result_path,
+    merge_shards,
+    plan_shards,
+    save_shard_result,
+    ShardStrategy,
+)
+from core_utils.constants import ASSETS_PATH
+from core_utils.pipeline import PipelineProtocol
+from lab_6_pipeline.pipeline import CorpusManager, TextProcessingPipeline, UDPipeAnalyzer
+
+logger = get_child_logger(__file__)
+
+#: Pipelines that can be run over a shard, the POS frequency and pattern search
+#: pipelines are added once they are implemented
+PIPELINES = ("text",)
+
+
+def make_pipeline(
+    name: str,
+    corpus_manager: CorpusManager,
+    force: bool = False,
+    cache: Optional[AnnotationCache] = None,
+) -> PipelineProtocol:
+    """
+    Create a pipeline over the corpus.
+
+    Args:
+        name (str): Name of the pipeline, see PIPELINES
+        corpus_manager (CorpusManager): Corpus to process
+        force (bool): Whether the text pipeline rebuilds up-to-date artifacts
+        cache (Optional[AnnotationCache]): Markup of texts annotated before
+
+    Returns:
+        PipelineProtocol: Pipeline ready to run
+
+    Raises:
+        ValueError: If the pipeline cannot be run over a shard
+    """
+    if name not in PIPELINES:
+        raise ValueError(f"Pipeline {name} cannot be run over a shard, choose one of {PIPELINES}")
+    analyzer = UDPipeAnalyzer(cache=cache)
+    return TextProcessingPipeline(corpus_manager, analyzer, force=force, incremental=True)
+
+
+def run_shard(  # pylint: disable=too-many-arguments
+    path: pathlib.Path,
+    pipeline: str,
+    count: int,
+    index: int,
+    strategy: ShardStrategy,
+    force: bool = False,
+    cache: bool = False,
+) -> pathlib.Path:
+    """
+    Run a pipeline over one shard and save corpus-level outputs of the shard.
+
+    Args:
+        path (pathlib.Path): Dataset root
+        pipeline (str): Name of the pipeline, see PIPELINES
+        count (int): Number of shards
+        index (int): Position of the shard to process
+        strategy (ShardStrategy): Way to split the ids
+        force (bool): Whether the text pipeline rebuilds up-to-date artifacts
+        cache (bool): Whether to reuse markup from the annotation cache of the dataset,
+            shared by the shards
+
+    Returns:
+        pathlib.Path: Path to the result of the shard
+    """
+    # artifacts of the articles are written to the processed dataset, in its layout
+    article.ASSETS_PATH = path
+    corpus_manager = CorpusManager(path, lazy=True)
+    article.ASSETS_SHARD_DEPTH = corpus_manager.get_manifest().get_shard_depth()
+    article_ids = plan_shards(corpus_manager.get_raw_sizes(), count, strategy)[index]
+    corpus_manager.restrict(article_ids)
+    with (
+        AnnotationCache(get_annotation_cache_path(path)) if cache else contextlib.nullcontext()
+    ) as annotation_cache:
+        make_pipeline(pipeline, corpus_manager, force, annotation_cache).run()
+        if annotation_cache is not None:
+            logger.info(
+                "Annotation cache: %d hits, %d misses",
+                annotation_cache.hits,
+                annotation_cache.misses,
+            )
+    corpus_manager.save_manifest()
+    return save_shard_result(path, collect_shard(path, index, count, article_ids))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--path", type=pathlib.Path, default=ASSETS_PATH, help="Dataset root")
+    parser.add_argument("--shards", type=int, required=True, help="Number of shards")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Process one shard")
+    run_parser.add_argument("pipeline", choices=PIPELINES, help="Pipeline to run")
+    run_parser.add_argument("--index", type=int, required=True, help="Shard to process")
+    run_parser.add_argument(
+        "--strategy",
+        choices=[strategy.value for strategy in ShardStrategy],
+        default=ShardStrategy.RANGE.value,
+        help="Way to split article ids",
+    )
+    run_parser.add_argument("--force", action="store_true", help="Rebuild up-to-date artifacts")
+    run_parser.add_argument(
+        "--cache", action="store_true", help="Reuse markup of texts annotated before"
+    )
+    commands.add_parser("merge", help="Combine results of all shards")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        result_path = run_shard(
+            args.path,
+            args.pipeline,
+            args.shards,
+            args.index,
+            ShardStrategy(args.strategy),
+            args.force,
+            args.cache,
+        )
+        logger.info("Saved shard %d of %d to %s", args.index, args.shards, result_path)
+    else:
+        corpus_ids = CorpusManager(args.path, lazy=True).get_raw_sizes()
+        merged = merge_shards(args.path, args.shards, corpus_ids)
+        logger.info(
+            "Merged %d shards covering %d articles to %s",
+            args.shards,
+            len(merged.article_ids),
+            get_merged_result_path(args.path),
+        )
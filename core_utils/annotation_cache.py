@@ -0,0 +1,245 @@
+"""
+Persistent cache of CONLL-U markup produced by analyzers.
+"""
+
+import hashlib
+import json
+import os
+import pathlib
+import sqlite3
+import time
+import zlib
+from typing import Iterable
+
+from core_utils.article.manifest import hash_file
+from core_utils.article.sidecars import get_sidecar_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS annotations (
+    key TEXT PRIMARY KEY,
+    conllu BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    used INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS annotations_used ON annotations (used);
+"""
+
+#: Name of the cache among files derived from the dataset
+CACHE_NAME = "annotations.sqlite"
+
+#: Compression level of stored markup, favours speed
+ZLIB_LEVEL = 1
+
+#: Default limit of the compressed size of stored markup
+DEFAULT_MAX_BYTES = 1 << 30
+
+#: Number of keys looked up with one query, stays below the SQLite parameter limit
+LOOKUP_CHUNK_SIZE = 500
+
+#: Hashes of model files by path, size and modification time
+_model_hashes: dict[tuple[str, int, int], str] = {}
+
+
+def get_annotation_cache_path(dataset_path: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the annotation cache for the dataset.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the cache database
+    """
+    return get_sidecar_path(dataset_path, CACHE_NAME)
+
+
+def get_model_hash(path: pathlib.Path) -> str:
+    """
+    Get content hash of a model file, hashing it once per process while it is unchanged.
+
+    Args:
+        path (pathlib.Path): Path to the model
+
+    Returns:
+        str: Hex digest
+    """
+    stat = os.stat(path)
+    state = (str(path), stat.st_size, stat.st_mtime_ns)
+    if state not in _model_hashes:
+        _model_hashes[state] = hash_file(str(path))
+    return _model_hashes[state]
+
+
+def get_annotation_keys(
+    texts: Iterable[str], analyzer: str, model_hash: str, config: dict
+) -> list[str]:
+    """
+    Get cache keys of texts.
+
+    Texts are hashed exactly as they are given to the model, since the markup
+    quotes them.
+
+    Args:
+        texts (Iterable[str]): Texts to analyze
+        analyzer (str): Kind of the analyzer
+        model_hash (str): Content hash of the model file
+        config (dict): Configuration the markup depends on, e.g. of the markup formatter
+
+    Returns:
+        list[str]: Keys in the order of the texts
+    """
+    prefix = hashlib.blake2b(
+        json.dumps([analyzer, model_hash, config], sort_keys=True).encode("utf-8"),
+        digest_size=16,
+    )
+    keys = []
+    for text in texts:
+        digest = prefix.copy()
+        digest.update(text.encode("utf-8"))
+        keys.append(digest.hexdigest())
+    return keys
+
+
+class AnnotationCache:
+    """
+    Markup of analyzed texts stored in SQLite.
+
+    Markup is zlib-compressed. Once the compressed size exceeds the limit,
+    the least recently used markup is evicted.
+    """
+
+    def __init__(self, path: pathlib.Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Initialize an instance of the AnnotationCache class.
+
+        Args:
+            path (pathlib.Path): Path to the cache database
+            max_bytes (int): Limit of the compressed size of stored markup
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._pid = os.getpid()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path)
+        self._db.executescript(SCHEMA)
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get the database connection of the current process.
+
+        A connection must not be used across fork, so a forked process,
+        e.g. an annotation worker, opens its own one.
+
+        Returns:
+            sqlite3.Connection: Database connection
+        """
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._db = sqlite3.connect(self.path)
+        return self._db
+
+    def __enter__(self) -> "AnnotationCache":
+        """
+        Enter the runtime context.
+
+        Returns:
+            AnnotationCache: The cache itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Close the database on exit from the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Commit changes and close the database.
+        """
+        self._connection.commit()
+        self._connection.close()
+
+    def get_many(self, keys: list[str]) -> dict[str, str]:
+        """
+        Get stored markup, marking it as recently used.
+
+        Args:
+            keys (list[str]): Cache keys, see get_annotation_keys()
+
+        Returns:
+            dict[str, str]: Markup by key, missing keys are skipped
+        """
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for start in range(0, len(unique), LOOKUP_CHUNK_SIZE):
+            chunk = unique[start : start + LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._connection.execute(
+                f"SELECT key, conllu FROM annotations WHERE key IN ({placeholders})", chunk
+            )
+            for key, conllu in rows:
+                found[key] = zlib.decompress(conllu).decode("utf-8")
+        if found:
+            now = time.time_ns()
+            self._connection.executemany(
+                "UPDATE annotations SET used = ? WHERE key = ?", [(now, key) for key in found]
+            )
+            self._connection.commit()
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, annotations: dict[str, str]) -> None:
+        """
+        Store markup, evicting the least recently used one if the cache is full.
+
+        Args:
+            annotations (dict[str, str]): Markup by key
+        """
+        now = time.time_ns()
+        rows = []
+        for key, conllu in annotations.items():
+            blob = zlib.compress(conllu.encode("utf-8"), ZLIB_LEVEL)
+            rows.append((key, blob, len(blob), now))
+        self._connection.executemany(
+            "INSERT OR REPLACE INTO annotations (key, conllu, size, used) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        self._evict()
+        self._connection.commit()
+
+    def get_size(self) -> int:
+        """
+        Get compressed size of stored markup.
+
+        Returns:
+            int: Size in bytes
+        """
+        size: int = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM annotations"
+        ).fetchone()[0]
+        return size
+
+    def _evict(self) -> None:
+        """
+        Remove the least recently used markup until the cache fits its limit.
+        """
+        excess = self.get_size() - self.max_bytes
+        if excess <= 0:
+            return
+        evicted = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM annotations ORDER BY used"
+        ):
+            evicted.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._connection.executemany("DELETE FROM annotations WHERE key = ?", evicted)
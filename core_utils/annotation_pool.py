@@ -0,0 +1,235 @@
+"""
+Annotation of texts by a pool of worker processes.
+"""
+
+import multiprocessing
+from concurrent.futures import as_completed, CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterable, Iterator, Optional
+
+from core_utils.pipeline import LibraryWrapper
+
+#: Number of times the pool is recreated while annotating texts before giving up
+MAX_POOL_RESTARTS = 2
+
+#: Number of texts a worker annotates at once by default
+DEFAULT_BATCH_SIZE = 32
+
+#: Analyzer of the current worker process
+_worker_analyzer: Optional[LibraryWrapper] = None
+
+
+def _init_worker(analyzer: LibraryWrapper) -> None:
+    """
+    Keep the analyzer of a worker process and load its model.
+
+    Args:
+        analyzer (LibraryWrapper): Analyzer to use in the worker
+    """
+    global _worker_analyzer  # pylint: disable=global-statement
+    _worker_analyzer = analyzer
+    # the model is loaded once per worker, before the first text arrives
+    _ = analyzer._analyzer  # pylint: disable=protected-access
+
+
+def _annotate(texts: list[str]) -> list[str]:
+    """
+    Annotate a batch of texts in a worker process.
+
+    Args:
+        texts (list[str]): Texts to analyze
+
+    Returns:
+        list[str]: CoNLL-U markup in the order of the texts
+    """
+    if _worker_analyzer is None:
+        raise RuntimeError("Annotation worker is not initialized")
+    return [str(conllu) for conllu in _worker_analyzer.analyze(texts)]
+
+
+class AnnotationPool:
+    """
+    Pool of processes annotating texts with their own copy of an analyzer.
+
+    Every worker loads the model once when it starts. Where processes are
+    forked, the analyzer is inherited rather than pickled, and a model the
+    parent has already loaded is shared copy-on-write. Texts are sent to
+    workers in batches, so the model still processes them together. Batches
+    are scheduled longest texts first, so a long text does not finish alone
+    at the end of a window, while results are returned in the order of the
+    texts. If a worker crashes, the pool is recreated and unfinished batches
+    are submitted again.
+    """
+
+    def __init__(
+        self, analyzer: LibraryWrapper, max_workers: int, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> None:
+        """
+        Initialize an instance of the AnnotationPool class.
+
+        Args:
+            analyzer (LibraryWrapper): Analyzer to copy into the workers
+            max_workers (int): Number of worker processes
+            batch_size (int): Number of texts a worker annotates at once
+        """
+        self._analyzer = analyzer
+        self._max_workers = max_workers
+        self._batch_size = batch_size
+        #: Number of times the pool was recreated after a worker crash
+        self.restarts = 0
+        self._generation = 0
+        self._executor = self._start()
+
+    def _start(self) -> ProcessPoolExecutor:
+        """
+        Start worker processes.
+
+        Returns:
+            ProcessPoolExecutor: Executor of the workers
+        """
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in methods else None)
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._analyzer,),
+        )
+
+    def __enter__(self) -> "AnnotationPool":
+        """
+        Enter the runtime context.
+
+        Returns:
+            AnnotationPool: The pool itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Stop the workers on exit from the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def _restart(self) -> None:
+        """
+        Replace the workers of a broken pool.
+        """
+        self.restarts += 1
+        self._generation += 1
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = self._start()
+
+    def _submit(self, texts: list[str], batch: list[int]) -> tuple[Future, list[int], int]:
+        """
+        Submit a batch of texts to the workers.
+
+        Args:
+            texts (list[str]): Texts of the window
+            batch (list[int]): Indices of the texts to annotate
+
+        Returns:
+            tuple[Future, list[int], int]: Future of the markup, the indices
+                and the generation of the pool the batch is submitted to
+        """
+        future: Future = Future()
+        try:
+            future = self._executor.submit(_annotate, [texts[index] for index in batch])
+        except BrokenProcessPool as error:
+            # the pool broke before the batch was submitted, it is handled on collection
+            future.set_exception(error)
+        return future, batch, self._generation
+
+    def _submit_window(self, texts: list[str]) -> list[tuple[Future, list[int], int]]:
+        """
+        Submit texts in batches, longest texts first.
+
+        Args:
+            texts (list[str]): Texts to analyze
+
+        Returns:
+            list[tuple[Future, list[int], int]]: Submitted batches, see _submit()
+        """
+        order = sorted(range(len(texts)), key=lambda index: -len(texts[index]))
+        return [
+            self._submit(texts, order[start : start + self._batch_size])
+            for start in range(0, len(order), self._batch_size)
+        ]
+
+    def _collect(
+        self, texts: list[str], submitted: list[tuple[Future, list[int], int]]
+    ) -> list[str]:
+        """
+        Wait for markup of submitted texts, submitting batches of crashed workers again.
+
+        The pool is recreated only if it is the one that broke, batches submitted
+        to an earlier pool are just submitted again.
+
+        Args:
+            texts (list[str]): Texts of the window
+            submitted (list[tuple[Future, list[int], int]]): Submitted batches
+
+        Returns:
+            list[str]: CoNLL-U markup in the order of the texts
+        """
+        results: dict[int, str] = {}
+        restarts = 0
+        pending = {future: (batch, generation) for future, batch, generation in submitted}
+        while pending:
+            for future in as_completed(pending):
+                batch, generation = pending.pop(future)
+                try:
+                    results.update(zip(batch, future.result()))
+                except (BrokenProcessPool, CancelledError):
+                    if generation == self._generation:
+                        if restarts == MAX_POOL_RESTARTS:
+                            raise
+                        restarts += 1
+                        self._restart()
+                    future, batch, generation = self._submit(texts, batch)
+                    pending[future] = (batch, generation)
+                    break
+        return [results[index] for index in range(len(texts))]
+
+    def analyze(self, texts: list[str]) -> list[str]:
+        """
+        Annotate texts in the worker processes.
+
+        Args:
+            texts (list[str]): Texts to analyze
+
+        Returns:
+            list[str]: CoNLL-U markup in the order of the texts
+        """
+        return self._collect(texts, self._submit_window(texts))
+
+    def imap(self, windows: Iterable[list[str]]) -> Iterator[list[str]]:
+        """
+        Annotate windows of texts, keeping the next window queued while results are consumed.
+
+        The workers annotate the next window while the caller handles markup
+        of the current one, e.g. writes it to disk.
+
+        Args:
+            windows (Iterable[list[str]]): Texts to analyze, window by window
+
+        Yields:
+            list[str]: CoNLL-U markup of a window in the order of its texts
+        """
+        previous = None
+        for texts in windows:
+            submitted = self._submit_window(texts)
+            if previous is not None:
+                yield self._collect(*previous)
+            previous = (texts, submitted)
+        if previous is not None:
+            yield self._collect(*previous)
+
+    def close(self) -> None:
+        """
+        Stop the workers.
+        """
+        self._executor.shutdown()
@@ -9,8 +9,14 @@ import enum
 import pathlib
 import re
 import string
+from typing import Iterator
 
-from core_utils.constants import ASSETS_PATH
+from core_utils.article.dates import META_DATE_FORMAT, parse_meta_date
+from core_utils.article.layout import get_article_dir
+from core_utils.article.sentences import iter_conllu_sentences, iter_sentences, SentenceView
+from core_utils.constants import ASSETS_PATH, ASSETS_SHARD_DEPTH
+
+PUNCTUATION_PATTERN = re.compile(f"[{re.escape(string.punctuation)}]+")
 
 
 def date_from_meta(date_txt: str) -> datetime.datetime:
@@ -25,7 +31,7 @@ def date_from_meta(date_txt: str) -> datetime.datetime:
     """
     if not date_txt:
         return datetime.datetime.now()
-    return datetime.datetime.strptime(date_txt, "%Y-%m-%d %H:%M:%S")
+    return parse_meta_date(date_txt)
 
 
 def get_article_id_from_filepath(path: pathlib.Path) -> int:
@@ -41,6 +47,19 @@ def get_article_id_from_filepath(path: pathlib.Path) -> int:
     return int(path.stem.split("_")[0])
 
 
+def clean_text(text: str) -> str:
+    """
+    Lowercase the text and remove punctuation from it.
+
+    Args:
+        text (str): Text to clean
+
+    Returns:
+        str: Cleaned text
+    """
+    return PUNCTUATION_PATTERN.sub("", text.lower())
+
+
 def split_by_sentence(text: str) -> list[str]:
     """
     Splits the given text by sentence separators.
@@ -148,6 +167,24 @@ class Article:
         """
         return self.text
 
+    def iter_sentences(self) -> Iterator[SentenceView]:
+        """
+        Iterate over sentences of the raw text without copying them.
+
+        Returns:
+            Iterator[SentenceView]: Views of sentences
+        """
+        return iter_sentences(self.text)
+
+    def iter_conllu_sentences(self) -> Iterator[SentenceView]:
+        """
+        Iterate over sentence blocks of the CONLL-U information without copying them.
+
+        Returns:
+            Iterator[SentenceView]: Views of sentence blocks
+        """
+        return iter_conllu_sentences(self._conllu_info)
+
     def get_conllu_text(self, include_morphological_tags: bool) -> str:
         """
         Get the text in the CONLL-U format.
@@ -190,7 +227,7 @@ class Article:
         Returns:
             str: Cleaned text.
         """
-        return self.text.lower().translate(str.maketrans("", "", string.punctuation))
+        return clean_text(self.text)
 
     def _date_to_text(self) -> str:
         """
@@ -199,7 +236,16 @@ class Article:
         Returns:
             str: Datetime object
         """
-        return self.date.strftime("%Y-%m-%d %H:%M:%S") if self.date else ""
+        return self.date.strftime(META_DATE_FORMAT) if self.date else ""
+
+    def _get_dir(self) -> pathlib.Path:
+        """
+        Get directory that stores the article files.
+
+        Returns:
+            pathlib.Path: Directory for the article files
+        """
+        return get_article_dir(ASSETS_PATH, self.article_id, ASSETS_SHARD_DEPTH)
 
     def get_raw_text_path(self) -> pathlib.Path:
         """
@@ -209,7 +255,7 @@ class Article:
             pathlib.Path: Path to requested raw article
         """
         article_txt_name = f"{self.article_id}_raw.txt"
-        return ASSETS_PATH / article_txt_name
+        return self._get_dir() / article_txt_name
 
     def get_meta_file_path(self) -> pathlib.Path:
         """
@@ -219,7 +265,7 @@ class Article:
             pathlib.Path: Path to requested article's meta info
         """
         meta_file_name = f"{self.article_id}_meta.json"
-        return ASSETS_PATH / meta_file_name
+        return self._get_dir() / meta_file_name
 
     def get_file_path(self, kind: ArtifactType) -> pathlib.Path:
         """
@@ -236,7 +282,7 @@ class Article:
         extension = ".conllu" if conllu else ".txt"
         article_name = f"{self.article_id}_{kind.value}{extension}"
 
-        return ASSETS_PATH / article_name
+        return self._get_dir() / article_name
 
     def get_pos_freq(self) -> dict:
         """
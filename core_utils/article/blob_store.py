@@ -0,0 +1,145 @@
+"""
+Content-addressed store of article artifacts.
+"""
+
+import hashlib
+import os
+import pathlib
+import tempfile
+from dataclasses import dataclass
+from typing import Sequence
+
+from core_utils.article.sidecars import get_sidecar_path
+
+#: Name of the blob store directory among files derived from the dataset
+BLOB_STORE_NAME = "blobs"
+
+
+def get_blob_store_path(dataset_path: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the blob store for the dataset.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the blob store directory
+    """
+    return get_sidecar_path(dataset_path, BLOB_STORE_NAME)
+
+
+@dataclass
+class BlobStoreStats:
+    """
+    Counters of the blob store activity.
+    """
+
+    #: Number of write requests
+    writes: int = 0
+
+    #: Number of write requests with unchanged content
+    skipped: int = 0
+
+    #: Size of all requested writes
+    requested_bytes: int = 0
+
+    #: Size of data actually written to disk
+    written_bytes: int = 0
+
+    @property
+    def dedup_ratio(self) -> float:
+        """
+        Get ratio of requested to written bytes.
+
+        Returns:
+            float: Deduplication ratio, 1.0 means no savings
+        """
+        return self.requested_bytes / self.written_bytes if self.written_bytes else 1.0
+
+
+class BlobStore:
+    """
+    Store of artifacts addressed by the hash of their content.
+
+    Every distinct content is stored once, artifact paths are hard links to the blobs.
+    """
+
+    def __init__(self, root: pathlib.Path) -> None:
+        """
+        Initialize an instance of the BlobStore class.
+
+        Args:
+            root (pathlib.Path): Directory to store blobs in
+        """
+        self.root = root
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.stats = BlobStoreStats()
+
+    def get_blob_path(self, digest: str) -> pathlib.Path:
+        """
+        Get path of the blob with the given digest.
+
+        Args:
+            digest (str): Hex digest of the content
+
+        Returns:
+            pathlib.Path: Path to the blob
+        """
+        return self.root / digest[:2] / digest[2:]
+
+    def put(self, data: bytes) -> str:
+        """
+        Store content unless it is already stored.
+
+        Args:
+            data (bytes): Content
+
+        Returns:
+            str: Hex digest of the content
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.get_blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(exist_ok=True)
+            descriptor, temp_path = tempfile.mkstemp(dir=blob.parent)
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, blob)
+            self.stats.written_bytes += len(data)
+        return digest
+
+    def write(self, path: pathlib.Path, data: bytes, obsolete: Sequence[pathlib.Path] = ()) -> None:
+        """
+        Make the artifact path refer to the stored content.
+
+        Writing content the path already refers to only removes obsolete files.
+
+        Args:
+            path (pathlib.Path): Path to the artifact
+            data (bytes): Content
+            obsolete (Sequence[pathlib.Path]): Files removed once the artifact is stored
+        """
+        self.stats.writes += 1
+        self.stats.requested_bytes += len(data)
+        blob = self.get_blob_path(self.put(data))
+        try:
+            linked = os.path.samefile(blob, path)
+        except FileNotFoundError:
+            linked = False
+
+        if linked:
+            self.stats.skipped += 1
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            link_path = path.with_name(f".{path.name}.link")
+            link_path.unlink(missing_ok=True)
+            try:
+                os.link(blob, link_path)
+            except OSError:
+                # file systems without hard links get a private copy
+                with open(link_path, "wb") as file:
+                    file.write(data)
+                self.stats.written_bytes += len(data)
+            os.replace(link_path, path)
+        for obsolete_path in obsolete:
+            obsolete_path.unlink(missing_ok=True)
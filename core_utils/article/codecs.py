@@ -0,0 +1,239 @@
+"""
+Compression codecs for article artifacts.
+"""
+
+import enum
+import gzip
+import io
+import pathlib
+from typing import BinaryIO, TextIO
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None  # type: ignore
+
+#: Magic bytes of a gzip stream
+GZIP_MAGIC = b"\x1f\x8b"
+
+#: Magic bytes of a zstd frame
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+#: Compression level used for gzip artifacts
+GZIP_LEVEL = 6
+
+#: Compression level used for zstd artifacts
+ZSTD_LEVEL = 3
+
+
+class Codec(enum.Enum):
+    """
+    Compression codecs for artifacts, values are file name suffixes.
+    """
+
+    PLAIN = ""
+    GZIP = ".gz"
+    ZSTD = ".zst"
+
+
+def get_codec_path(path: pathlib.Path, codec: Codec) -> pathlib.Path:
+    """
+    Get path of the artifact stored with the given codec.
+
+    Args:
+        path (pathlib.Path): Path to the plain artifact
+        codec (Codec): Compression codec
+
+    Returns:
+        pathlib.Path: Path with the codec suffix
+    """
+    return path.with_name(f"{path.name}{codec.value}")
+
+
+def strip_codec_suffix(name: str) -> str:
+    """
+    Remove compression suffix from the artifact file name.
+
+    Args:
+        name (str): File name
+
+    Returns:
+        str: File name of the plain artifact
+    """
+    for codec in (Codec.GZIP, Codec.ZSTD):
+        if name.endswith(codec.value):
+            return name[: -len(codec.value)]
+    return name
+
+
+def detect_codec(path: pathlib.Path, head: bytes = b"") -> Codec:
+    """
+    Detect artifact codec by the file extension or magic bytes.
+
+    Args:
+        path (pathlib.Path): Path to the artifact
+        head (bytes): First bytes of the artifact
+
+    Returns:
+        Codec: Compression codec
+    """
+    for codec in (Codec.GZIP, Codec.ZSTD):
+        if path.name.endswith(codec.value):
+            return codec
+    if head.startswith(GZIP_MAGIC):
+        return Codec.GZIP
+    if head.startswith(ZSTD_MAGIC):
+        return Codec.ZSTD
+    return Codec.PLAIN
+
+
+def resolve_artifact(path: pathlib.Path) -> pathlib.Path:
+    """
+    Find the stored variant of the artifact.
+
+    Args:
+        path (pathlib.Path): Path to the plain artifact
+
+    Returns:
+        pathlib.Path: Path to the existing artifact, the plain path if none is found
+    """
+    for codec in Codec:
+        candidate = get_codec_path(path, codec)
+        if candidate.exists():
+            return candidate
+    return path
+
+
+def _check_zstd() -> None:
+    """
+    Ensure that zstd support is installed.
+    """
+    if zstandard is None:
+        raise ValueError("zstd codec requested, but zstandard is not installed")
+
+
+def open_text_reader(path: pathlib.Path) -> TextIO:
+    """
+    Open artifact for streaming reading, decompressing it on the fly.
+
+    Args:
+        path (pathlib.Path): Path to the artifact
+
+    Returns:
+        TextIO: Text stream
+    """
+    raw = open(path, "rb")  # pylint: disable=consider-using-with
+    codec = detect_codec(path, raw.peek(len(ZSTD_MAGIC)))
+    stream: BinaryIO = raw
+    if codec is Codec.GZIP:
+        raw.close()
+        stream = gzip.open(path, "rb")  # type: ignore
+    elif codec is Codec.ZSTD:
+        _check_zstd()
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+    return io.TextIOWrapper(stream, encoding="utf-8")
+
+
+def encode_text(text: str, codec: Codec = Codec.PLAIN) -> bytes:
+    """
+    Encode artifact text with the given codec.
+
+    Args:
+        text (str): Artifact content
+        codec (Codec): Compression codec
+
+    Returns:
+        bytes: Encoded artifact
+    """
+    data = text.encode("utf-8")
+    if codec is Codec.GZIP:
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if codec is Codec.ZSTD:
+        _check_zstd()
+        return bytes(zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data))
+    return data
+
+
+def get_other_variants(path: pathlib.Path, codec: Codec) -> list[pathlib.Path]:
+    """
+    Get paths of the artifact stored with other codecs.
+
+    Args:
+        path (pathlib.Path): Path to the plain artifact
+        codec (Codec): Codec of the variant to exclude
+
+    Returns:
+        list[pathlib.Path]: Paths of the other variants
+    """
+    return [get_codec_path(path, other) for other in Codec if other is not codec]
+
+
+def remove_other_variants(path: pathlib.Path, codec: Codec) -> None:
+    """
+    Remove variants of the artifact stored with other codecs.
+
+    Args:
+        path (pathlib.Path): Path to the plain artifact
+        codec (Codec): Codec of the variant to keep
+    """
+    for other_path in get_other_variants(path, codec):
+        other_path.unlink(missing_ok=True)
+
+
+def write_text(path: pathlib.Path, text: str, codec: Codec = Codec.PLAIN) -> pathlib.Path:
+    """
+    Save artifact text with the given codec.
+
+    Other stored variants of the same artifact are removed. An existing file is
+    unlinked rather than truncated, so files hard linked to it stay intact.
+
+    Args:
+        path (pathlib.Path): Path to the plain artifact
+        text (str): Artifact content
+        codec (Codec): Compression codec
+
+    Returns:
+        pathlib.Path: Path to the saved artifact
+    """
+    target = get_codec_path(path, codec)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.unlink(missing_ok=True)
+    if codec is Codec.PLAIN:
+        with open(target, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+    else:
+        with open(target, "wb") as file:
+            file.write(encode_text(text, codec))
+    remove_other_variants(path, codec)
+    return target
+
+
+def open_text_writer(path: pathlib.Path, codec: Codec = Codec.PLAIN) -> TextIO:
+    """
+    Open artifact for streaming writing, compressing it on the fly.
+
+    Text written to the stream is stored the same way write_text() stores it.
+    Other stored variants of the artifact are removed.
+
+    Args:
+        path (pathlib.Path): Path to the plain artifact
+        codec (Codec): Compression codec
+
+    Returns:
+        TextIO: Text stream
+    """
+    target = get_codec_path(path, codec)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.unlink(missing_ok=True)
+    remove_other_variants(path, codec)
+    if codec is Codec.PLAIN:
+        # pylint: disable-next=consider-using-with
+        return open(target, "w", encoding="utf-8", newline="")
+    stream: BinaryIO
+    if codec is Codec.GZIP:
+        stream = gzip.GzipFile(target, "wb", compresslevel=GZIP_LEVEL, mtime=0)  # type: ignore
+    else:
+        _check_zstd()
+        raw = open(target, "wb")  # pylint: disable=consider-using-with
+        stream = zstandard.ZstdCompressor(level=ZSTD_LEVEL).stream_writer(raw, closefd=True)
+    return io.TextIOWrapper(stream, encoding="utf-8", newline="")
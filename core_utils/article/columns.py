@@ -0,0 +1,484 @@
+"""
+Columnar export of the corpus for analytics.
+"""
+
+import datetime
+import json
+import os
+import pathlib
+import shutil
+from array import array
+from typing import Any, Iterable, Optional
+
+from core_utils.article.article import Article
+from core_utils.article.sidecars import get_sidecar_path
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore
+
+try:
+    import pandas
+except ImportError:  # pragma: no cover
+    pandas = None  # type: ignore
+
+#: Array type code of ids, dates and offsets, 8 byte integers
+OFFSET_TYPE = "q"
+
+#: Array type code of part of speech frequencies, 4 byte integers
+COUNT_TYPE = "i"
+
+#: Date stored for articles without a date, NaT when viewed as numpy datetime64[s]
+MISSING_DATE = -(2**63)
+
+#: Name of the columns directory among files derived from the dataset
+COLUMNS_NAME = "columns"
+
+#: Name of the file describing stored columns
+HEADER_NAME = "header.json"
+
+#: Beginning of the Unix epoch, dates are stored as seconds since it
+EPOCH = datetime.datetime(1970, 1, 1)
+
+#: Columns holding a list of strings per article
+LIST_COLUMNS = ("author", "topics")
+
+
+def get_columns_path(dataset_path: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the columnar export of the dataset.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the columns directory
+    """
+    return get_sidecar_path(dataset_path, COLUMNS_NAME)
+
+
+class ColumnStore:
+    """
+    Corpus stored column by column, one binary file per column.
+
+    Integer columns are raw native-endian arrays, so numpy.memmap reads them
+    without parsing. String columns are a utf-8 buffer plus offsets of every
+    value, list columns add offsets of every article's first item, as in
+    Apache Arrow. Part of speech frequencies are a column per tag. The header
+    lists stored rows, file sizes and the size, modification time and content
+    hash of meta files the rows were exported from, it is replaced last on
+    append, so bytes of an interrupted append are dropped on the next one.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        Initialize an instance of the ColumnStore class.
+
+        Args:
+            path (pathlib.Path): Directory of the columns
+        """
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        header_path = self.path / HEADER_NAME
+        if header_path.exists():
+            self._header = json.loads(header_path.read_text(encoding="utf-8"))
+        else:
+            self._header = {"rows": 0, "pos_tags": [], "sizes": {}}
+        # headers written before states were kept have hashes only
+        hashes = self._header.pop("meta_hashes", {})
+        self._header.setdefault(
+            "meta_states", {article_id: [-1, -1, digest] for article_id, digest in hashes.items()}
+        )
+
+    @property
+    def rows(self) -> int:
+        """
+        Get number of stored articles.
+
+        Returns:
+            int: Number of rows
+        """
+        return int(self._header["rows"])
+
+    @property
+    def pos_tags(self) -> list[str]:
+        """
+        Get parts of speech with a frequency column.
+
+        Returns:
+            list[str]: Part of speech tags
+        """
+        return list(self._header["pos_tags"])
+
+    def _get_file(self, name: str) -> pathlib.Path:
+        """
+        Get path of a column file.
+
+        Args:
+            name (str): File name
+
+        Returns:
+            pathlib.Path: Path to the file
+        """
+        return self.path / name
+
+    def _count(self, name: str, typecode: str = OFFSET_TYPE) -> int:
+        """
+        Get number of values stored in a column file.
+
+        Args:
+            name (str): File name
+            typecode (str): Array type code of the values
+
+        Returns:
+            int: Number of values
+        """
+        size: int = self._header["sizes"].get(name, 0)
+        return size // array(typecode).itemsize
+
+    def _append_array(self, name: str, values: array) -> None:
+        """
+        Append values to a column file.
+
+        Args:
+            name (str): File name
+            values (array): Values to append
+        """
+        path = self._get_file(name)
+        size = self._header["sizes"].get(name, 0)
+        with open(path, "ab") as column_file:
+            column_file.truncate(size)
+            values.tofile(column_file)
+        self._header["sizes"][name] = size + len(values) * values.itemsize
+
+    def _append_strings(self, name: str, values: Iterable[str]) -> None:
+        """
+        Append values to a string column.
+
+        Args:
+            name (str): Column name
+            values (Iterable[str]): Values to append
+        """
+        end = self._header["sizes"].get(f"{name}.data", 0)
+        offsets = array(OFFSET_TYPE, [] if self._header["sizes"].get(f"{name}.offsets") else [0])
+        encoded = []
+        for value in values:
+            data = value.encode("utf-8")
+            encoded.append(data)
+            end += len(data)
+            offsets.append(end)
+        self._append_array(f"{name}.offsets", offsets)
+        self._append_array(f"{name}.data", array("B", b"".join(encoded)))
+
+    def _append_lists(self, name: str, values: Iterable[list[str]]) -> None:
+        """
+        Append values to a column of string lists.
+
+        Args:
+            name (str): Column name
+            values (Iterable[list[str]]): Values to append
+        """
+        end = max(self._count(f"{name}.offsets") - 1, 0)
+        starts = array(OFFSET_TYPE, [] if self._header["sizes"].get(f"{name}.lists") else [0])
+        items = []
+        for value in values:
+            items.extend(value)
+            end += len(value)
+            starts.append(end)
+        self._append_array(f"{name}.lists", starts)
+        self._append_strings(name, items)
+
+    def _write_header(self) -> None:
+        """
+        Replace the header, making appended rows visible.
+        """
+        temp_path = self._get_file(f".{HEADER_NAME}")
+        temp_path.write_text(json.dumps(self._header, ensure_ascii=False), encoding="utf-8")
+        os.replace(temp_path, self._get_file(HEADER_NAME))
+
+    def get_ids(self) -> set[int]:
+        """
+        Get ids of stored articles.
+
+        Returns:
+            set[int]: Article ids
+        """
+        return set(self.read_array("id").tolist())
+
+    def get_meta_states(self) -> dict[int, tuple[int, int, str]]:
+        """
+        Get states of meta files stored articles were exported from.
+
+        Returns:
+            dict[int, tuple[int, int, str]]: Size, modification time and content hash
+                by article id, articles appended without a state are omitted
+        """
+        return {
+            int(article_id): (size, mtime_ns, digest)
+            for article_id, (size, mtime_ns, digest) in self._header["meta_states"].items()
+        }
+
+    def update_meta_states(self, meta_states: dict[int, tuple[int, int, str]]) -> None:
+        """
+        Record new states of meta files whose content did not change, e.g. touched ones.
+
+        Args:
+            meta_states (dict[int, tuple[int, int, str]]): Size, modification time
+                and content hash of meta files by article id
+        """
+        if not meta_states:
+            return
+        for article_id, state in meta_states.items():
+            self._header["meta_states"][str(article_id)] = list(state)
+        self._write_header()
+
+    def append(
+        self,
+        articles: Iterable[Article],
+        meta_states: Optional[dict[int, tuple[int, int, str]]] = None,
+    ) -> int:
+        """
+        Append articles that are not stored yet.
+
+        Args:
+            articles (Iterable[Article]): Articles with meta information and texts
+            meta_states (Optional[dict[int, tuple[int, int, str]]]): Size, modification time
+                and content hash of meta files by article id, see get_meta_states()
+
+        Returns:
+            int: Number of appended articles
+        """
+        stored = self.get_ids()
+        new = sorted(
+            (article for article in articles if article.article_id not in stored),
+            key=lambda article: article.article_id,
+        )
+        if not new:
+            return 0
+
+        self._append_array("id", array(OFFSET_TYPE, [article.article_id for article in new]))
+        self._append_array(
+            "date",
+            array(
+                OFFSET_TYPE,
+                [
+                    int((article.date - EPOCH).total_seconds()) if article.date else MISSING_DATE
+                    for article in new
+                ],
+            ),
+        )
+        self._append_strings("url", (article.url or "" for article in new))
+        self._append_strings("title", (article.title or "" for article in new))
+        self._append_strings("text", (article.text for article in new))
+        self._append_lists("author", (article.author or [] for article in new))
+        self._append_lists("topics", (article.topics or [] for article in new))
+
+        tags = self._header["pos_tags"]
+        for article in new:
+            tags.extend(sorted(set(article.pos_frequencies or {}) - set(tags)))
+        for tag in tags:
+            # columns of new tags are filled with zeros for stored rows
+            missing = self.rows - self._count(f"pos.{tag}", COUNT_TYPE)
+            frequencies = array(COUNT_TYPE, [0]) * missing
+            frequencies.extend((article.pos_frequencies or {}).get(tag, 0) for article in new)
+            self._append_array(f"pos.{tag}", frequencies)
+
+        for article in new:
+            if meta_states and article.article_id in meta_states:
+                self._header["meta_states"][str(article.article_id)] = list(
+                    meta_states[article.article_id]
+                )
+        self._header["rows"] = self.rows + len(new)
+        self._write_header()
+        return len(new)
+
+    def remove(self, article_ids: Iterable[int]) -> int:
+        """
+        Remove stored articles, e.g. to append them again after their meta files changed.
+
+        Columns are append-only, so the kept rows are copied into a new store
+        that then replaces this one.
+
+        Args:
+            article_ids (Iterable[int]): Ids of articles to remove
+
+        Returns:
+            int: Number of removed articles
+        """
+        ids = self.read_array("id").tolist()
+        removed = set(article_ids) & set(ids)
+        if not removed:
+            return 0
+
+        columns = self.load()
+        texts = self.read_strings("text")
+        kept = []
+        for row, article_id in enumerate(ids):
+            if article_id in removed:
+                continue
+            article = Article(url=columns["url"][row] or None, article_id=article_id)
+            article.title = columns["title"][row]
+            article.date = get_date(columns["date"][row])
+            article.author = columns["author"][row]
+            article.topics = columns["topics"][row]
+            article.text = texts[row]
+            article.pos_frequencies = {
+                tag: int(columns[f"pos.{tag}"][row])
+                for tag in self.pos_tags
+                if columns[f"pos.{tag}"][row]
+            }
+            kept.append(article)
+        del columns
+
+        temp_path = self.path.with_name(f".{self.path.name}.rewrite")
+        old_path = self.path.with_name(f".{self.path.name}.old")
+        shutil.rmtree(temp_path, ignore_errors=True)
+        shutil.rmtree(old_path, ignore_errors=True)
+        rewritten = ColumnStore(temp_path)
+        rewritten.append(kept, self.get_meta_states())
+        os.replace(self.path, old_path)
+        os.replace(temp_path, self.path)
+        shutil.rmtree(old_path)
+        self._header = rewritten._header  # pylint: disable=protected-access
+        return len(removed)
+
+    def read_array(self, name: str) -> Any:
+        """
+        Read an integer column in one call.
+
+        The column is memory-mapped if numpy is installed.
+
+        Args:
+            name (str): File name
+
+        Returns:
+            Any: numpy.ndarray or array of the column values
+        """
+        typecode = COUNT_TYPE if name.startswith("pos.") else OFFSET_TYPE
+        count = self._count(name, typecode)
+        if numpy is not None:
+            if not count:
+                return numpy.empty(0, dtype=typecode)
+            return numpy.memmap(self._get_file(name), dtype=typecode, mode="r", shape=(count,))
+        values = array(typecode)
+        if count:
+            with open(self._get_file(name), "rb") as column_file:
+                values.fromfile(column_file, count)
+        return values
+
+    def _read_data(self, name: str) -> bytes:
+        """
+        Read the utf-8 buffer of a string column.
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            bytes: Buffer
+        """
+        size = self._header["sizes"].get(f"{name}.data", 0)
+        if not size:
+            return b""
+        with open(self._get_file(f"{name}.data"), "rb") as column_file:
+            return column_file.read(size)
+
+    def read_strings(self, name: str) -> list[str]:
+        """
+        Read a string column.
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            list[str]: Column values
+        """
+        offsets = self.read_array(f"{name}.offsets")
+        data = self._read_data(name)
+        return [data[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
+
+    def read_lists(self, name: str) -> list[list[str]]:
+        """
+        Read a column of string lists.
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            list[list[str]]: Column values
+        """
+        starts = self.read_array(f"{name}.lists")
+        items = self.read_strings(name)
+        return [items[start:end] for start, end in zip(starts[:-1], starts[1:])]
+
+    def get_text(self, row: int) -> str:
+        """
+        Read the text of one article without loading the others.
+
+        Args:
+            row (int): Row number
+
+        Returns:
+            str: Text of the article
+        """
+        offsets = self.read_array("text.offsets")
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        with open(self._get_file("text.data"), "rb") as column_file:
+            column_file.seek(start)
+            return column_file.read(end - start).decode("utf-8")
+
+    def load(self) -> dict[str, Any]:
+        """
+        Read all columns except texts.
+
+        Texts are represented by their offsets in the text buffer, see get_text().
+
+        Returns:
+            dict[str, Any]: Column values by column name, frequencies are named pos.<TAG>
+        """
+        columns: dict[str, Any] = {
+            "id": self.read_array("id"),
+            "date": self.read_array("date"),
+            "text_offsets": self.read_array("text.offsets"),
+        }
+        for name in ("url", "title"):
+            columns[name] = self.read_strings(name)
+        for name in LIST_COLUMNS:
+            columns[name] = self.read_lists(name)
+        for tag in self.pos_tags:
+            columns[f"pos.{tag}"] = self.read_array(f"pos.{tag}")
+        return columns
+
+    def to_dataframe(self) -> Any:
+        """
+        Read all columns except texts into a pandas data frame.
+
+        Returns:
+            Any: pandas.DataFrame indexed by article id
+        """
+        if pandas is None:
+            raise ValueError("pandas is not installed")
+        columns = self.load()
+        offsets = columns.pop("text_offsets")
+        columns["date"] = pandas.to_datetime(
+            [float("nan") if date == MISSING_DATE else float(date) for date in columns["date"]],
+            unit="s",
+        )
+        columns["text_start"] = offsets[:-1]
+        columns["text_end"] = offsets[1:]
+        return pandas.DataFrame(columns).set_index("id")
+
+
+def get_date(seconds: int) -> Optional[datetime.datetime]:
+    """
+    Convert a stored date to a datetime object.
+
+    Args:
+        seconds (int): Stored date
+
+    Returns:
+        Optional[datetime.datetime]: Date or None if the article has no date
+    """
+    if seconds == MISSING_DATE:
+        return None
+    return EPOCH + datetime.timedelta(seconds=int(seconds))
@@ -0,0 +1,327 @@
+"""
+Columnar reader of CONLL-U artifacts.
+"""
+
+import pathlib
+from array import array
+from typing import Iterable
+
+from core_utils.article.codecs import open_text_reader
+from core_utils.pipeline import (
+    CODE_TYPE,
+    ConLLUSentence,
+    ConLLUWord,
+    INDEX_TYPE,
+    NO_HEAD,
+    OFFSET_TYPE,
+    TagVocabulary,
+    UnifiedCoNLLUDocument,
+)
+
+
+class ConlluColumns:
+    """
+    Tokens of a CONLL-U document stored column by column.
+
+    Ids and heads are integer arrays, parts of speech and relations are codes
+    of a TagVocabulary of the document shared by both columns, forms and
+    lemmas are concatenated into one string each. Sentences are ranges of
+    tokens given by offsets.
+    Multiword tokens and empty nodes are skipped, as spaCy and Stanza words
+    do not include them either.
+    """
+
+    __slots__ = (
+        "ids",
+        "heads",
+        "upos",
+        "deprels",
+        "vocabulary",
+        "forms",
+        "form_offsets",
+        "lemmas",
+        "lemma_offsets",
+        "sentence_offsets",
+    )
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        """
+        Initialize an instance of the ConlluColumns class.
+
+        Args:
+            lines (Iterable[str]): Lines of CONLL-U markup
+        """
+        self.ids = array(INDEX_TYPE)
+        self.heads = array(INDEX_TYPE)
+        self.upos = array(CODE_TYPE)
+        self.deprels = array(CODE_TYPE)
+        self.vocabulary = TagVocabulary()
+        self.form_offsets = array(OFFSET_TYPE, [0])
+        self.lemma_offsets = array(OFFSET_TYPE, [0])
+        self.sentence_offsets = array(OFFSET_TYPE, [0])
+        self.forms, self.lemmas = self._parse(lines)
+
+    def _parse(self, lines: Iterable[str]) -> tuple[str, str]:
+        """
+        Fill the columns in a single pass over the markup.
+
+        Args:
+            lines (Iterable[str]): Lines of CONLL-U markup
+
+        Returns:
+            tuple[str, str]: Concatenated forms and lemmas
+        """
+        forms: list[str] = []
+        lemmas: list[str] = []
+        form_end = lemma_end = 0
+        for line in lines:
+            if line.startswith("#"):
+                continue
+            if not line.strip():
+                if len(self.ids) > self.sentence_offsets[-1]:
+                    self.sentence_offsets.append(len(self.ids))
+                continue
+            token_id, form, lemma, upos, _, _, head, deprel = line.split("\t", 8)[:8]
+            if not token_id.isdigit():
+                continue
+            self.ids.append(int(token_id))
+            self.heads.append(int(head) if head.isdigit() else NO_HEAD)
+            self.upos.append(self.vocabulary.encode(upos))
+            self.deprels.append(self.vocabulary.encode(deprel))
+            forms.append(form)
+            form_end += len(form)
+            self.form_offsets.append(form_end)
+            lemmas.append(lemma)
+            lemma_end += len(lemma)
+            self.lemma_offsets.append(lemma_end)
+        if len(self.ids) > self.sentence_offsets[-1]:
+            self.sentence_offsets.append(len(self.ids))
+        return "".join(forms), "".join(lemmas)
+
+    def __len__(self) -> int:
+        """
+        Get the number of tokens.
+
+        Returns:
+            int: Number of tokens
+        """
+        return len(self.ids)
+
+    def get_form(self, index: int) -> str:
+        """
+        Get the form of a token.
+
+        Args:
+            index (int): Position of the token in the document
+
+        Returns:
+            str: Form
+        """
+        return self.forms[self.form_offsets[index] : self.form_offsets[index + 1]]
+
+    def get_lemma(self, index: int) -> str:
+        """
+        Get the lemma of a token.
+
+        Args:
+            index (int): Position of the token in the document
+
+        Returns:
+            str: Lemma
+        """
+        return self.lemmas[self.lemma_offsets[index] : self.lemma_offsets[index + 1]]
+
+
+class ConlluWordView(ConLLUWord):
+    """
+    Word of a columnar document, its attributes are read from the columns on access.
+    """
+
+    __slots__ = ("_columns", "_index")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, columns: ConlluColumns, index: int
+    ) -> None:
+        """
+        Initialize an instance of the ConlluWordView class.
+
+        Args:
+            columns (ConlluColumns): Columns of the document
+            index (int): Position of the token in the document
+        """
+        self._columns = columns
+        self._index = index
+
+    @property  # type: ignore[override]
+    def id(self) -> str:
+        """
+        Get the token id within its sentence.
+
+        Returns:
+            str: Token id
+        """
+        return str(self._columns.ids[self._index])
+
+    @property  # type: ignore[override]
+    def upos(self) -> str:
+        """
+        Get the universal part of speech.
+
+        Returns:
+            str: Part of speech
+        """
+        return self._columns.vocabulary.decode(self._columns.upos[self._index])
+
+    @property  # type: ignore[override]
+    def head(self) -> str:
+        """
+        Get the id of the head token, 0 for the root.
+
+        Returns:
+            str: Head id, _ if the token has no syntactic annotation
+        """
+        head = self._columns.heads[self._index]
+        return "_" if head == NO_HEAD else str(head)
+
+    @property  # type: ignore[override]
+    def deprel(self) -> str:
+        """
+        Get the dependency relation to the head.
+
+        Returns:
+            str: Relation
+        """
+        return self._columns.vocabulary.decode(self._columns.deprels[self._index])
+
+    @property  # type: ignore[override]
+    def text(self) -> str:
+        """
+        Get the word form.
+
+        Returns:
+            str: Form
+        """
+        return self._columns.get_form(self._index)
+
+    @property
+    def lemma(self) -> str:
+        """
+        Get the lemma.
+
+        Returns:
+            str: Lemma
+        """
+        return self._columns.get_lemma(self._index)
+
+
+class ConlluSentenceView(ConLLUSentence):
+    """
+    Sentence of a columnar document, word views are created on access.
+    """
+
+    __slots__ = ("_columns", "_start", "_end")
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, columns: ConlluColumns, start: int, end: int
+    ) -> None:
+        """
+        Initialize an instance of the ConlluSentenceView class.
+
+        Args:
+            columns (ConlluColumns): Columns of the document
+            start (int): Position of the first token in the document
+            end (int): Position after the last token
+        """
+        self._columns = columns
+        self._start = start
+        self._end = end
+
+    @property  # type: ignore[override]
+    def words(self) -> list[ConLLUWord]:
+        """
+        Get views of the words.
+
+        Returns:
+            list[ConLLUWord]: Words in the order of the sentence
+        """
+        return [ConlluWordView(self._columns, index) for index in range(self._start, self._end)]
+
+    def __len__(self) -> int:
+        """
+        Get the number of words.
+
+        Returns:
+            int: Number of words
+        """
+        return self._end - self._start
+
+
+class ConlluDocument(UnifiedCoNLLUDocument):
+    """
+    Document read from CONLL-U markup into columns, sentence views are created on access.
+    """
+
+    __slots__ = ("columns",)
+
+    def __init__(self, columns: ConlluColumns) -> None:  # pylint: disable=super-init-not-called
+        """
+        Initialize an instance of the ConlluDocument class.
+
+        Args:
+            columns (ConlluColumns): Columns of the document
+        """
+        self.columns = columns
+
+    @property  # type: ignore[override]
+    def sentences(self) -> list[ConLLUSentence]:
+        """
+        Get views of the sentences.
+
+        Returns:
+            list[ConLLUSentence]: Sentences in the order of the document
+        """
+        offsets = self.columns.sentence_offsets
+        return [
+            ConlluSentenceView(self.columns, offsets[index], offsets[index + 1])
+            for index in range(len(offsets) - 1)
+        ]
+
+    def get_pos_frequencies(self) -> dict[str, int]:
+        """
+        Count parts of speech of the document without creating word views.
+
+        Returns:
+            dict[str, int]: Number of words by part of speech
+        """
+        tags = self.columns.vocabulary.tags
+        counts = [0] * len(tags)
+        for code in self.columns.upos:
+            counts[code] += 1
+        return {upos: count for upos, count in zip(tags, counts) if count}
+
+
+def parse_conllu(conllu: str) -> ConlluDocument:
+    """
+    Read CONLL-U markup into a columnar document.
+
+    Args:
+        conllu (str): CONLL-U markup
+
+    Returns:
+        ConlluDocument: Document
+    """
+    return ConlluDocument(ConlluColumns(conllu.splitlines()))
+
+
+def read_conllu(path: pathlib.Path) -> ConlluDocument:
+    """
+    Read a CONLL-U artifact into a columnar document line by line.
+
+    Args:
+        path (pathlib.Path): Path to the artifact, possibly compressed
+
+    Returns:
+        ConlluDocument: Document
+    """
+    with open_text_reader(path) as conllu_file:
+        return ConlluDocument(ConlluColumns(conllu_file))
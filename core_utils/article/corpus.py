@@ -0,0 +1,239 @@
+"""
+Queries over a dataset of articles: meta information, texts and columnar export.
+"""
+
+import datetime
+import pathlib
+from typing import Iterator, Protocol
+
+from core_utils.article.article import Article
+from core_utils.article.columns import ColumnStore, get_columns_path
+from core_utils.article.io import bulk_from_meta
+from core_utils.article.manifest import (
+    build_manifest,
+    DatasetManifest,
+    load_manifest,
+    ManifestEntry,
+    refresh_manifest,
+)
+from core_utils.article.meta_index import get_index_path, MetaIndex, UNKNOWN_STATE
+from core_utils.article.text_index import get_text_index_path, InvertedIndex
+from core_utils.article.watcher import CorpusWatcher
+
+#: Number of raw texts read at once when articles are streamed
+BATCH_SIZE = 64
+
+
+def _get_changed_meta(
+    store: ColumnStore, entries: dict[int, ManifestEntry]
+) -> tuple[set[int], dict[int, tuple[int, int, str]]]:
+    """
+    Find articles whose meta files changed since they were exported.
+
+    Only meta files with a size or modification time other than the exported
+    one are hashed. Touched files with the same content get their new state
+    recorded in the export and are not reported.
+
+    Args:
+        store (ColumnStore): Columnar export
+        entries (dict[int, ManifestEntry]): Dataset files of articles with a meta file
+
+    Returns:
+        tuple[set[int], dict[int, tuple[int, int, str]]]: Ids of articles with changed
+            meta files and current states of all meta files known to the export
+    """
+    exported = store.get_meta_states()
+    states = {
+        article_id: (files.meta_size, files.meta_mtime_ns, files.get_meta_hash())
+        for article_id, files in entries.items()
+        if exported.get(article_id, UNKNOWN_STATE)[:2] != (files.meta_size, files.meta_mtime_ns)
+    }
+    touched = {
+        article_id: state
+        for article_id, state in states.items()
+        if article_id in exported and exported[article_id][2] == state[2]
+    }
+    store.update_meta_states(touched)
+    return states.keys() - touched.keys(), exported | states
+
+
+class CorpusQueries(Protocol):
+    """
+    Queries over the articles of a corpus manager.
+
+    Implementations register articles found in the dataset and read their raw texts,
+    see _iter_by_ids().
+    """
+
+    #: Dataset root
+    path: pathlib.Path
+
+    #: Articles read or registered so far by id
+    _storage: dict[int, Article]
+
+    #: Paths to raw texts of the dataset articles by id
+    _raw_paths: dict[int, str]
+
+    #: Files of the dataset found by the validation
+    _manifest: DatasetManifest
+
+    def _iter_by_ids(self, article_ids: list[int], batch_size: int) -> Iterator[Article]:
+        """
+        Yield articles, reading raw texts of unregistered ones batch by batch.
+
+        Args:
+            article_ids (list[int]): Ids of articles in the order to yield them
+            batch_size (int): Number of raw texts read at once
+
+        Returns:
+            Iterator[Article]: Articles in the order of the ids
+        """
+
+    def watch(self, poll_interval: float = 0.5, idle_timeout: float | None = None) -> CorpusWatcher:
+        """
+        Follow the dataset, registering articles as soon as both their files are written.
+
+        Args:
+            poll_interval (float): Seconds between polls or inotify wake-ups
+            idle_timeout (float | None): Seconds without new articles before iteration
+                stops, None to follow the dataset until the watcher is stopped
+
+        Returns:
+            CorpusWatcher: Blocking and asynchronous iterator over new articles
+        """
+        return CorpusWatcher(self.path, self._storage, poll_interval, idle_timeout)
+
+    def query(  # pylint: disable=too-many-arguments
+        self,
+        date: datetime.date | None = None,
+        author: str | None = None,
+        topic: str | None = None,
+        url: str | None = None,
+        pos: str | None = None,
+        min_frequency: int = 1,
+    ) -> set[int]:
+        """
+        Find articles by meta information without reading meta files.
+
+        The meta index is built on the first query. Before every query the
+        manifest found by the validation is refreshed, so meta files saved since
+        then are found as well, and the index is brought in line with it: only
+        meta files added or changed since they were indexed are read.
+
+        Args:
+            date (datetime.date | None): Day of publication
+            author (str | None): Author of the article
+            topic (str | None): Topic of the article
+            url (str | None): Url of the article
+            pos (str | None): Part of speech the article contains
+            min_frequency (int): Minimal frequency of the part of speech
+
+        Returns:
+            set[int]: Ids of matching articles
+        """
+        with MetaIndex(get_index_path(self.path)) as index:
+            if self._manifest.entries:
+                self._manifest = refresh_manifest(self.path, self._manifest)
+                manifest = self._manifest
+            else:
+                # in the live mode articles are registered by watch(), the dataset is listed anew
+                manifest = build_manifest(self.path, load_manifest(self.path))
+            index.sync(manifest)
+            return index.find_ids(date, author, topic, url, pos, min_frequency)
+
+    def search(self, query: str, phrase: bool = False) -> set[int]:
+        """
+        Find articles by their text.
+
+        Articles missing from the full-text index are added to it first.
+        Articles whose raw texts changed since they were indexed are indexed
+        again, articles gone from the dataset are removed. Only raw texts with
+        a size or modification time other than the indexed one are hashed.
+
+        Args:
+            query (str): Terms that must all occur in the article
+            phrase (bool): Whether the terms must occur in a row
+
+        Returns:
+            set[int]: Ids of matching articles
+        """
+        entries = {
+            article_id: files
+            for article_id, files in self._manifest.entries.items()
+            if files.raw_path
+        }
+        known = self._raw_paths.keys() | self._storage.keys()
+        with InvertedIndex(get_text_index_path(self.path)) as index:
+            indexed = index.get_raw_states()
+            states = {
+                article_id: (files.raw_size, files.raw_mtime_ns, files.get_raw_hash())
+                for article_id, files in entries.items()
+                if article_id in indexed
+                and indexed[article_id][:2] != (files.raw_size, files.raw_mtime_ns)
+            }
+            # touched raw texts with the same content are not indexed again
+            touched = {
+                article_id: state
+                for article_id, state in states.items()
+                if indexed[article_id][2] == state[2]
+            }
+            index.update_raw_states(touched)
+            changed = (states.keys() - touched.keys()) & known
+            index.remove(sorted(changed | (indexed.keys() - known - entries.keys())))
+            missing = (known - indexed.keys()) | changed
+            index.add(
+                self._iter_by_ids(sorted(missing), BATCH_SIZE),
+                {
+                    article_id: (
+                        entries[article_id].raw_size,
+                        entries[article_id].raw_mtime_ns,
+                        entries[article_id].get_raw_hash(),
+                    )
+                    for article_id in missing
+                    if article_id in entries
+                },
+            )
+            return index.search_phrase(query) if phrase else index.search(query)
+
+    def export_columns(self) -> ColumnStore:
+        """
+        Bring the columnar export of the corpus in line with the dataset.
+
+        Articles that are gone or whose meta files changed since the export
+        are removed, then articles missing from the export are appended.
+        Only meta files with a size or modification time other than the
+        exported one are hashed, as in MetaIndex.sync(). Meta files are read
+        from the paths found by the validation, articles registered by watch()
+        already carry their meta information.
+
+        Returns:
+            ColumnStore: Columnar export, see ColumnStore.load() and to_dataframe()
+        """
+        entries = {
+            article_id: files
+            for article_id, files in self._manifest.entries.items()
+            if files.meta_path
+        }
+        meta_paths = {article_id: str(files.meta_path) for article_id, files in entries.items()}
+        store = ColumnStore(get_columns_path(self.path))
+        stored = store.get_ids()
+        known = self._raw_paths.keys() | self._storage.keys()
+        changed, meta_states = _get_changed_meta(store, entries)
+        store.remove((stored - known) | (changed & stored))
+        missing = sorted(known - store.get_ids())
+        for start in range(0, len(missing), BATCH_SIZE):
+            batch = list(self._iter_by_ids(missing[start : start + BATCH_SIZE], BATCH_SIZE))
+            read = iter(
+                bulk_from_meta(
+                    meta_paths[loaded.article_id]
+                    for loaded in batch
+                    if loaded.article_id in meta_paths
+                )
+            )
+            articles = [
+                next(read) if loaded.article_id in meta_paths else loaded for loaded in batch
+            ]
+            for article, loaded in zip(articles, batch):
+                article.text = loaded.text
+            store.append(articles, meta_states)
+        return store
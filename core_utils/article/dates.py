@@ -0,0 +1,166 @@
+"""
+Fast parsing of dates met in meta files and on news sites.
+"""
+
+import datetime
+import re
+from functools import lru_cache
+
+#: Format of dates in meta files
+META_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+#: Separators of dates in meta files by their positions
+META_DATE_SEPARATORS = {4: "-", 7: "-", 10: " ", 13: ":", 16: ":"}
+
+#: Number of parsed strings kept in memory
+CACHE_SIZE = 65536
+
+#: Month numbers by the first letters of Russian month names
+RUSSIAN_MONTHS = {
+    "янв": 1,
+    "фев": 2,
+    "мар": 3,
+    "апр": 4,
+    "мая": 5,
+    "май": 5,
+    "июн": 6,
+    "июл": 7,
+    "авг": 8,
+    "сен": 9,
+    "окт": 10,
+    "ноя": 11,
+    "дек": 12,
+}
+
+RUSSIAN_DATE_PATTERN = re.compile(
+    r"(?P<day>\d{1,2})\s+(?P<month>[а-яё]+)\.?\s+(?P<year>\d{4})"
+    r"(?:\s*(?:г\.|года|г))?"
+    r"(?:\s*[,в]?\s*(?:в\s+)?(?P<hour>\d{1,2}):(?P<minute>\d{2}))?",
+    re.IGNORECASE,
+)
+
+NUMERIC_DATE_PATTERN = re.compile(
+    r"(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{4})"
+    r"(?:\s*,?\s*(?P<hour>\d{1,2}):(?P<minute>\d{2}))?"
+)
+
+
+def _has_meta_shape(date_txt: str) -> bool:
+    """
+    Check whether the date looks like one in the meta file format.
+
+    Digits are left to the parser.
+
+    Args:
+        date_txt (str): Date in text format
+
+    Returns:
+        bool: Whether the length and separators match the format
+    """
+    return len(date_txt) == 19 and all(
+        date_txt[position] == separator for position, separator in META_DATE_SEPARATORS.items()
+    )
+
+
+def parse_iso_datetime(date_txt: str) -> datetime.datetime:
+    """
+    Parse a date in the meta file format, i.e. YYYY-MM-DD HH:MM:SS.
+
+    Strings of exactly this shape are parsed by the C implementation of
+    datetime.fromisoformat, strptime is only called for anything else.
+
+    Args:
+        date_txt (str): Date in text format
+
+    Returns:
+        datetime.datetime: Datetime object
+    """
+    if _has_meta_shape(date_txt):
+        try:
+            return datetime.datetime.fromisoformat(date_txt)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(date_txt, META_DATE_FORMAT)
+
+
+def _from_match(match: re.Match, month: int) -> datetime.datetime:
+    """
+    Build a datetime object from a matched date.
+
+    Args:
+        match (re.Match): Match of a date pattern
+        month (int): Month number
+
+    Returns:
+        datetime.datetime: Datetime object
+    """
+    return datetime.datetime(
+        int(match["year"]),
+        month,
+        int(match["day"]),
+        int(match["hour"] or 0),
+        int(match["minute"] or 0),
+    )
+
+
+def parse_russian_date(date_txt: str) -> datetime.datetime:
+    """
+    Parse a date written with a Russian month name or in the DD.MM.YYYY form.
+
+    Examples of supported dates: "16 мая 2025, 14:30", "1 января 2024 г.",
+    "3 авг. 2023 в 09:05", "16.05.2025 14:30".
+
+    Args:
+        date_txt (str): Date in text format
+
+    Returns:
+        datetime.datetime: Datetime object
+    """
+    match = RUSSIAN_DATE_PATTERN.search(date_txt)
+    if match:
+        month = RUSSIAN_MONTHS.get(match["month"][:3].lower())
+        if month:
+            return _from_match(match, month)
+
+    match = NUMERIC_DATE_PATTERN.search(date_txt)
+    if match:
+        return _from_match(match, int(match["month"]))
+
+    raise ValueError(f"Unknown date format: {date_txt}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_date(date_txt: str) -> datetime.datetime:
+    """
+    Parse a date in any supported format, remembering recent results.
+
+    Args:
+        date_txt (str): Date in text format
+
+    Returns:
+        datetime.datetime: Datetime object
+    """
+    date_txt = date_txt.strip()
+    try:
+        return parse_iso_datetime(date_txt)
+    except ValueError:
+        pass
+    try:
+        # e.g. the datetime attribute of <time> tags
+        return datetime.datetime.fromisoformat(date_txt).replace(tzinfo=None)
+    except ValueError:
+        return parse_russian_date(date_txt)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_meta_date(date_txt: str) -> datetime.datetime:
+    """
+    Parse a date in the meta file format, remembering recent results.
+
+    Args:
+        date_txt (str): Date in text format
+
+    Returns:
+        datetime.datetime: Datetime object
+    """
+    return parse_iso_datetime(date_txt)
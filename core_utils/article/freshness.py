@@ -0,0 +1,152 @@
+"""
+Tracking which artifacts are built from the current raw texts.
+"""
+
+import os
+import pathlib
+from typing import Iterable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.codecs import resolve_artifact
+from core_utils.article.manifest import ManifestEntry
+from core_utils.article.serialization import get_serializer
+from core_utils.article.sidecars import get_sidecar_path
+
+#: Name of the file with raw text states artifacts were built from,
+#: among files derived from the dataset
+STATE_NAME = "artifacts.json"
+
+#: Version of the state file format
+STATE_VERSION = 1
+
+
+def get_state_path(base: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the artifact state file of the dataset.
+
+    Args:
+        base (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the state file
+    """
+    return get_sidecar_path(base, STATE_NAME)
+
+
+class ArtifactState:
+    """
+    Raw text states every artifact was built from.
+
+    An artifact is fresh if it exists and was built from a raw text with the
+    same modification time as the current one or, if the time changed, with
+    the same content hash. Both come from the dataset manifest, so only raw
+    texts with a changed modification time are read to check freshness.
+    """
+
+    def __init__(self, base: pathlib.Path) -> None:
+        """
+        Initialize an instance of the ArtifactState class.
+
+        Args:
+            base (pathlib.Path): Dataset root
+        """
+        self.path = get_state_path(base)
+        self._base = base
+        self._built: dict[str, dict[str, list]] = self._load()
+        self._changes: dict[str, dict[str, list]] = {}
+
+    def _load(self) -> dict[str, dict[str, list]]:
+        """
+        Load recorded states.
+
+        Returns:
+            dict[str, dict[str, list]]: Raw text states by artifact type and article id
+        """
+        try:
+            with open(self.path, "rb") as state_file:
+                content = get_serializer().loads(state_file.read())
+        except (OSError, ValueError):
+            return {}
+        if content.get("version") != STATE_VERSION:
+            return {}
+        built: dict[str, dict[str, list]] = content["artifacts"]
+        return built
+
+    def is_fresh(
+        self, entry: ManifestEntry, article_id: int, kinds: Iterable[ArtifactType]
+    ) -> bool:
+        """
+        Check whether all artifacts of an article are built from its current raw text.
+
+        Args:
+            entry (ManifestEntry): Current files of the article
+            article_id (int): Article id
+            kinds (Iterable[ArtifactType]): Artifacts to check
+
+        Returns:
+            bool: True if no artifact has to be rebuilt
+        """
+        article = Article(url=None, article_id=article_id)
+        for kind in kinds:
+            built = self._built.get(kind.value, {}).get(str(article_id))
+            if built is None:
+                return False
+            mtime_ns, digest = built
+            # a touched raw text with the same content does not make artifacts stale
+            if mtime_ns != entry.raw_mtime_ns and digest != entry.get_raw_hash():
+                return False
+            if not resolve_artifact(article.get_file_path(kind)).exists():
+                return False
+        return True
+
+    def record(self, entry: ManifestEntry, article_id: int, kinds: Iterable[ArtifactType]) -> None:
+        """
+        Record that artifacts of an article are built from its current raw text.
+
+        Args:
+            entry (ManifestEntry): Current files of the article
+            article_id (int): Article id
+            kinds (Iterable[ArtifactType]): Built artifacts
+        """
+        for kind in kinds:
+            state = [entry.raw_mtime_ns, entry.get_raw_hash()]
+            self._built.setdefault(kind.value, {})[str(article_id)] = state
+            self._changes.setdefault(kind.value, {})[str(article_id)] = state
+
+    def save(self) -> None:
+        """
+        Save recorded states.
+
+        Several pipelines may share the dataset, so the file is reloaded under
+        a lock where it is supported and only the states recorded by this
+        instance are replaced.
+        """
+        if not self._changes:
+            return
+        # the dataset directory itself is locked, so no lock file is left behind
+        lock = os.open(self._base, os.O_RDONLY) if fcntl is not None else None
+        try:
+            if lock is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            built = self._load()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            for kind, states in self._changes.items():
+                built.setdefault(kind, {}).update(states)
+            temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}")
+            with open(temp_path, "wb") as state_file:
+                state_file.write(
+                    get_serializer().dumps(
+                        {"version": STATE_VERSION, "artifacts": built}, compact=True
+                    )
+                )
+            os.replace(temp_path, self.path)
+        finally:
+            if lock is not None:
+                os.close(lock)
+        self._built = built
+        self._changes = {}
@@ -0,0 +1,264 @@
+"""
+Atomic writer of artifacts with batched fsync calls.
+"""
+
+import itertools
+import os
+import pathlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+#: Suffix of files that are not committed yet
+TEMP_SUFFIX = ".uncommitted"
+
+#: Seconds a temporary file stays untouched before it is considered left by an interrupted writer
+UNCOMMITTED_MAX_AGE = 3600.0
+
+
+@dataclass
+class PendingFile:
+    """
+    Artifact written to a temporary file and waiting for commit.
+    """
+
+    #: Final path of the artifact
+    path: pathlib.Path
+
+    #: Path of the temporary file
+    temp_path: pathlib.Path
+
+    #: Descriptor of the temporary file
+    descriptor: int
+
+    #: Files removed once the artifact is committed
+    obsolete: tuple[pathlib.Path, ...] = field(default=())
+
+
+def get_temp_path(path: pathlib.Path, number: int) -> pathlib.Path:
+    """
+    Get path of a temporary file for the artifact.
+
+    Every write gets its own temporary file, so a write of the artifact never
+    truncates a file that a commit in another thread is syncing or renaming.
+
+    Args:
+        path (pathlib.Path): Final path of the artifact
+        number (int): Number of the write, unique within the process
+
+    Returns:
+        pathlib.Path: Path of the temporary file
+    """
+    return path.with_name(f".{path.name}.{os.getpid()}.{number}{TEMP_SUFFIX}")
+
+
+def remove_uncommitted(base: pathlib.Path, max_age: float = UNCOMMITTED_MAX_AGE) -> int:
+    """
+    Remove temporary files left by an interrupted writer.
+
+    Files of a writer still running are modified recently, so only files
+    untouched for max_age seconds are removed.
+
+    Args:
+        base (pathlib.Path): Directory to clean up, searched recursively
+        max_age (float): Seconds since the last modification of a removed file
+
+    Returns:
+        int: Number of removed files
+    """
+    removed = 0
+    deadline = time.time() - max_age
+    for temp_path in base.rglob(f".*{TEMP_SUFFIX}"):
+        try:
+            if temp_path.stat().st_mtime > deadline:
+                continue
+        except FileNotFoundError:
+            continue
+        temp_path.unlink(missing_ok=True)
+        removed += 1
+    return removed
+
+
+class GroupCommitWriter:
+    """
+    Writer that makes artifacts durable in batches.
+
+    Every artifact is written to a temporary file next to its final path. Once
+    max_files artifacts are pending or the oldest one has waited for max_delay
+    seconds, all of them are fsynced concurrently, renamed to their final paths,
+    and every affected directory is fsynced once. After a crash each artifact is
+    therefore either the old complete file or the new complete file, never a
+    truncated one. Artifacts become visible at their final paths only after commit,
+    and files they replace are removed only then as well.
+    A commit that fails in the background is reported by the next write or close.
+    """
+
+    def __init__(
+        self, max_files: int = 256, max_delay: float = 0.05, sync_workers: int = 8
+    ) -> None:
+        """
+        Initialize an instance of the GroupCommitWriter class.
+
+        Args:
+            max_files (int): Number of pending artifacts that triggers a commit
+            max_delay (float): Seconds an artifact may stay pending
+            sync_workers (int): Number of threads issuing fsync calls concurrently
+        """
+        self.max_files = max_files
+        self.max_delay = max_delay
+        self.commits = 0
+        self._pending: dict[pathlib.Path, PendingFile] = {}
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._executor = ThreadPoolExecutor(max_workers=sync_workers)
+        self._numbers = itertools.count()
+        self._error: Optional[BaseException] = None
+
+    def __enter__(self) -> "GroupCommitWriter":
+        """
+        Enter the runtime context.
+
+        Returns:
+            GroupCommitWriter: The writer itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Commit pending artifacts on exit from the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def write(self, path: pathlib.Path, data: bytes, obsolete: Sequence[pathlib.Path] = ()) -> None:
+        """
+        Write artifact content to a temporary file and schedule its commit.
+
+        A pending artifact at the final path or at an obsolete path is replaced.
+
+        Args:
+            path (pathlib.Path): Final path of the artifact
+            data (bytes): Content
+            obsolete (Sequence[pathlib.Path]): Files removed once the artifact is committed
+
+        Raises:
+            OSError: If a commit in the background failed since the last call
+        """
+        self._raise_error()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = get_temp_path(path, next(self._numbers))
+        descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(descriptor, view) :]
+        except OSError:
+            os.close(descriptor)
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        with self._lock:
+            for stale_path in (path, *obsolete):
+                replaced = self._pending.pop(stale_path, None)
+                if replaced:
+                    os.close(replaced.descriptor)
+                    replaced.temp_path.unlink(missing_ok=True)
+            self._pending[path] = PendingFile(path, temp_path, descriptor, tuple(obsolete))
+            if len(self._pending) >= self.max_files:
+                self.commit()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.max_delay, self._commit_in_background)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _commit_in_background(self) -> None:
+        """
+        Commit pending artifacts by timer, keeping the error for the next call.
+        """
+        try:
+            self.commit()
+        except OSError as error:
+            with self._lock:
+                self._error = error
+
+    def _raise_error(self) -> None:
+        """
+        Raise the error of a failed background commit once.
+
+        Raises:
+            OSError: If a commit in the background failed
+        """
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def commit(self) -> None:
+        """
+        Make all pending artifacts durable, move them to their final paths
+        and remove the files they replace.
+
+        Artifacts of a failed commit are dropped along with their temporary files.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = list(self._pending.values())
+            self._pending.clear()
+            if not pending:
+                return
+
+            try:
+                try:
+                    list(self._executor.map(lambda item: os.fsync(item.descriptor), pending))
+                finally:
+                    for item in pending:
+                        os.close(item.descriptor)
+                directories = set()
+                for item in pending:
+                    os.replace(item.temp_path, item.path)
+                    directories.add(item.path.parent)
+            except OSError:
+                for item in pending:
+                    item.temp_path.unlink(missing_ok=True)
+                raise
+            for item in pending:
+                for obsolete_path in item.obsolete:
+                    obsolete_path.unlink(missing_ok=True)
+            for directory in directories:
+                _fsync_directory(directory)
+            self.commits += 1
+
+    def close(self) -> None:
+        """
+        Commit pending artifacts and release resources.
+
+        Raises:
+            OSError: If a commit in the background failed since the last write
+        """
+        try:
+            self.commit()
+        finally:
+            self._executor.shutdown()
+        self._raise_error()
+
+
+def _fsync_directory(directory: pathlib.Path) -> None:
+    """
+    Make renames in the directory durable.
+
+    Args:
+        directory (pathlib.Path): Directory to sync
+    """
+    if os.name == "nt":  # pragma: no cover
+        return
+    descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
@@ -2,10 +2,13 @@
 I/O operations for Article.
 """
 
-import json
+# pylint: disable=too-few-public-methods
+import io
+import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Iterable, Optional, Protocol, Sequence, TextIO, TypeVar, Union
 
 from core_utils.article.article import (
     Article,
@@ -13,17 +16,73 @@ from core_utils.article.article import (
     date_from_meta,
     get_article_id_from_filepath,
 )
+from core_utils.article.codecs import (
+    Codec,
+    encode_text,
+    get_codec_path,
+    get_other_variants,
+    open_text_reader,
+    open_text_writer,
+    resolve_artifact,
+    write_text,
+)
+from core_utils.article.serialization import get_serializer, MetaSerializer
+
+_Item = TypeVar("_Item")
+_Result = TypeVar("_Result")
 
 
-def to_raw(article: Article) -> None:
+class ArtifactWriter(Protocol):
+    """
+    Interface definition for alternative ways of storing artifacts.
+    """
+
+    def write(self, path: pathlib.Path, data: bytes, obsolete: Sequence[pathlib.Path] = ()) -> None:
+        """
+        Store artifact content at the given path.
+
+        Obsolete files are removed only once the content is stored, so an
+        interrupted write never leaves the artifact without any variant.
+
+        Args:
+            path (pathlib.Path): Path to the artifact
+            data (bytes): Content
+            obsolete (Sequence[pathlib.Path]): Files the artifact replaces
+        """
+
+
+def _write_artifact(
+    path: pathlib.Path, text: str, codec: Codec, writer: Optional[ArtifactWriter]
+) -> None:
+    """
+    Save artifact text directly or with the given writer.
+
+    Args:
+        path (pathlib.Path): Path to the plain artifact
+        text (str): Artifact content
+        codec (Codec): Compression codec
+        writer (Optional[ArtifactWriter]): Writer to use, the file is written directly by default
+    """
+    if writer is None:
+        write_text(path, text, codec)
+        return
+    writer.write(
+        get_codec_path(path, codec), encode_text(text, codec), get_other_variants(path, codec)
+    )
+
+
+def to_raw(
+    article: Article, codec: Codec = Codec.PLAIN, writer: Optional[ArtifactWriter] = None
+) -> None:
     """
     Save raw text.
 
     Args:
         article (Article): Article instance
+        codec (Codec): Compression codec
+        writer (Optional[ArtifactWriter]): Writer to use, the file is written directly by default
     """
-    with open(article.get_raw_text_path(), "w", encoding="utf-8") as file:
-        file.write(article.text)
+    _write_artifact(article.get_raw_text_path(), article.text, codec, writer)
 
 
 def from_raw(path: Union[pathlib.Path, str], article: Optional[Article] = None) -> Article:
@@ -39,7 +98,7 @@ def from_raw(path: Union[pathlib.Path, str], article: Optional[Article] = None)
     """
     article_id = get_article_id_from_filepath(Path(path))
 
-    with open(file=path, mode="r", encoding="utf-8") as article_file:
+    with open_text_reader(Path(path)) as article_file:
         text = article_file.read()
 
     article = article if article else Article(url=None, article_id=article_id)
@@ -47,44 +106,151 @@ def from_raw(path: Union[pathlib.Path, str], article: Optional[Article] = None)
     return article
 
 
-def to_cleaned(article: Article) -> None:
+def to_cleaned(
+    article: Article, codec: Codec = Codec.PLAIN, writer: Optional[ArtifactWriter] = None
+) -> None:
     """
     Save cleaned text.
 
     Args:
         article (Article): Article instance
+        codec (Codec): Compression codec
+        writer (Optional[ArtifactWriter]): Writer to use, the file is written directly by default
+    """
+    path = article.get_file_path(ArtifactType.CLEANED)
+    _write_artifact(path, article.get_cleaned_text(), codec, writer)
+
+
+def to_artifact(
+    article: Article,
+    kind: ArtifactType,
+    codec: Codec = Codec.PLAIN,
+    writer: Optional[ArtifactWriter] = None,
+) -> None:
+    """
+    Save CONLL-U information of the article as an artifact.
+
+    Args:
+        article (Article): Article instance
+        kind (ArtifactType): A variant of a file
+        codec (Codec): Compression codec
+        writer (Optional[ArtifactWriter]): Writer to use, the file is written directly by default
+    """
+    _write_artifact(article.get_file_path(kind), article.get_conllu_info(), codec, writer)
+
+
+def open_artifact(article: Article, kind: ArtifactType) -> TextIO:
+    """
+    Open a stored artifact of the article for streaming reading.
+
+    Args:
+        article (Article): Article instance
+        kind (ArtifactType): A variant of a file
+
+    Returns:
+        TextIO: Text stream, decompressed on the fly
     """
-    with open(article.get_file_path(ArtifactType.CLEANED), "w", encoding="utf-8") as file:
-        file.write(article.get_cleaned_text())
+    return open_text_reader(resolve_artifact(article.get_file_path(kind)))
 
 
-def to_meta(article: Article) -> None:
+class _BufferedArtifact(io.StringIO):
+    """
+    Text stream handing its content over to an artifact writer when closed.
+    """
+
+    def __init__(self, path: pathlib.Path, codec: Codec, writer: ArtifactWriter) -> None:
+        """
+        Initialize an instance of the _BufferedArtifact class.
+
+        Args:
+            path (pathlib.Path): Path to the plain artifact
+            codec (Codec): Compression codec
+            writer (ArtifactWriter): Writer to store the content with
+        """
+        super().__init__()
+        self._path = path
+        self._codec = codec
+        self._writer = writer
+
+    def close(self) -> None:
+        """
+        Store the content and close the stream.
+        """
+        if not self.closed:
+            _write_artifact(self._path, self.getvalue(), self._codec, self._writer)
+        super().close()
+
+
+def open_artifact_writer(
+    article: Article,
+    kind: ArtifactType,
+    codec: Codec = Codec.PLAIN,
+    writer: Optional[ArtifactWriter] = None,
+) -> TextIO:
+    """
+    Open an artifact of the article for streaming writing.
+
+    The artifact is stored the same way as by to_artifact(). A writer stores
+    whole artifacts, so with a writer the content is collected in memory
+    and stored when the stream is closed.
+
+    Args:
+        article (Article): Article instance
+        kind (ArtifactType): A variant of a file
+        codec (Codec): Compression codec
+        writer (Optional[ArtifactWriter]): Writer to use, the file is written directly by default
+
+    Returns:
+        TextIO: Text stream
+    """
+    if writer is None:
+        return open_text_writer(article.get_file_path(kind), codec)
+    return _BufferedArtifact(article.get_file_path(kind), codec, writer)
+
+
+def to_meta(
+    article: Article,
+    compact: bool = False,
+    serializer: Optional[MetaSerializer] = None,
+    writer: Optional[ArtifactWriter] = None,
+) -> None:
     """
     Save metafile.
 
+    The meta index is not updated here: a corpus manager refreshes its
+    manifest and syncs the index with it on the next query, see CorpusQueries.query().
+
     Args:
         article (Article): Article instance
+        compact (bool): Whether to save meta info without indentation
+        serializer (Optional[MetaSerializer]): Serializer to use, the fastest available by default
+        writer (Optional[ArtifactWriter]): Writer to use, the file is written directly by default
     """
-    with open(article.get_meta_file_path(), "w", encoding="utf-8") as meta_file:
-        json.dump(
-            article.get_meta(), meta_file, indent=4, ensure_ascii=False, separators=(",", ": ")
-        )
+    serializer = serializer if serializer else get_serializer()
+    meta = article.get_meta()
+    path = article.get_meta_file_path()
+    data = serializer.dumps(meta, compact=compact)
+    if writer is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # a new file keeps hard links intact and marks the directory as changed
+        path.unlink(missing_ok=True)
+        with open(path, "wb") as meta_file:
+            meta_file.write(data)
+    else:
+        writer.write(path, data)
 
 
-def from_meta(path: Union[pathlib.Path, str], article: Optional[Article] = None) -> Article:
+def _fill_from_meta(meta: dict, article: Optional[Article] = None) -> Article:
     """
-    Load meta.json file into the Article abstraction.
+    Fill the Article abstraction with loaded meta info.
 
     Args:
-        path (Union[pathlib.Path, str]): Path to meta info
+        meta (dict): Meta info
         article (Optional[Article]): Article instance
 
     Returns:
         Article: Article instance
     """
-    with open(path, encoding="utf-8") as meta_file:
-        meta = json.load(meta_file)
-
     article = (
         article if article else Article(url=meta.get("url", None), article_id=meta.get("id", 0))
     )
@@ -100,3 +266,115 @@ def from_meta(path: Union[pathlib.Path, str], article: Optional[Article] = None)
     # intentionally leave it empty
     article.text = ""
     return article
+
+
+def from_meta(
+    path: Union[pathlib.Path, str],
+    article: Optional[Article] = None,
+    serializer: Optional[MetaSerializer] = None,
+) -> Article:
+    """
+    Load meta.json file into the Article abstraction.
+
+    Args:
+        path (Union[pathlib.Path, str]): Path to meta info
+        article (Optional[Article]): Article instance
+        serializer (Optional[MetaSerializer]): Serializer to use, the fastest available by default
+
+    Returns:
+        Article: Article instance
+    """
+    serializer = serializer if serializer else get_serializer()
+    with open(path, "rb") as meta_file:
+        meta = serializer.loads(meta_file.read())
+    return _fill_from_meta(meta, article)
+
+
+def _map_in_chunks(
+    func: Callable[[_Item], _Result], items: list[_Item], max_workers: Optional[int] = None
+) -> list[_Result]:
+    """
+    Apply a function to items in a thread pool, one chunk of items per thread.
+
+    Submitting a task per item costs more than reading a small file, so every
+    thread gets a contiguous chunk of the items.
+
+    Args:
+        func (Callable[[_Item], _Result]): Function to apply
+        items (list[_Item]): Items
+        max_workers (Optional[int]): Number of threads, chosen by the executor by default
+
+    Returns:
+        list[_Result]: Results in the order of the items
+    """
+    workers = max_workers if max_workers else min(32, (os.cpu_count() or 1) + 4)
+    chunk_size = max(1, -(-len(items) // workers))
+    chunks = [items[start : start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+    def apply(chunk: list[_Item]) -> list[_Result]:
+        return [func(item) for item in chunk]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [result for chunk in executor.map(apply, chunks) for result in chunk]
+
+
+def bulk_from_meta(
+    paths: Iterable[Union[pathlib.Path, str]],
+    max_workers: Optional[int] = None,
+    serializer: Optional[MetaSerializer] = None,
+) -> list[Article]:
+    """
+    Load many meta.json files into Article abstractions using a thread pool.
+
+    Args:
+        paths (Iterable[Union[pathlib.Path, str]]): Paths to meta info
+        max_workers (Optional[int]): Number of threads, chosen by the executor by default
+        serializer (Optional[MetaSerializer]): Serializer to use, the fastest available by default
+
+    Returns:
+        list[Article]: Article instances in the order of the given paths
+    """
+    serializer = serializer if serializer else get_serializer()
+    return _map_in_chunks(
+        lambda path: from_meta(path, serializer=serializer), list(paths), max_workers
+    )
+
+
+def readahead(path: Union[pathlib.Path, str]) -> None:
+    """
+    Ask the kernel to start reading the file into the page cache.
+
+    The hint is skipped on platforms without posix_fadvise.
+
+    Args:
+        path (Union[pathlib.Path, str]): Path to the file
+    """
+    if not hasattr(os, "posix_fadvise"):  # pragma: no cover
+        return
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+    finally:
+        os.close(descriptor)
+
+
+def bulk_from_raw(
+    paths: Iterable[Union[pathlib.Path, str]],
+    max_workers: Optional[int] = None,
+    prefetch: bool = False,
+) -> list[Article]:
+    """
+    Load many raw texts into Article abstractions using a thread pool.
+
+    Args:
+        paths (Iterable[Union[pathlib.Path, str]]): Paths to raw texts
+        max_workers (Optional[int]): Number of threads, chosen by the executor by default
+        prefetch (bool): Whether to issue readahead hints for all files before reading
+
+    Returns:
+        list[Article]: Article instances in the order of the given paths
+    """
+    paths = list(paths)
+    if prefetch:
+        _map_in_chunks(readahead, paths, max_workers)
+    return _map_in_chunks(from_raw, paths, max_workers)
@@ -0,0 +1,103 @@
+"""
+Directory layout of the articles dataset.
+"""
+
+import hashlib
+import os
+import pathlib
+from typing import Iterator
+
+#: Number of hexadecimal characters in a shard directory name
+SHARD_WIDTH = 2
+
+
+def get_shard_parts(article_id: int, depth: int) -> tuple[str, ...]:
+    """
+    Get shard directory names for the article.
+
+    Args:
+        article_id (int): Article id
+        depth (int): Number of shard levels, 0 stands for the flat layout
+
+    Returns:
+        tuple[str, ...]: Shard directory names from the outermost one
+    """
+    if depth <= 0:
+        return ()
+    digest = hashlib.md5(str(article_id).encode("utf-8")).hexdigest()
+    return tuple(digest[level * SHARD_WIDTH : (level + 1) * SHARD_WIDTH] for level in range(depth))
+
+
+def get_article_dir(base: pathlib.Path, article_id: int, depth: int) -> pathlib.Path:
+    """
+    Get directory that stores files of the article.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        article_id (int): Article id
+        depth (int): Number of shard levels, 0 stands for the flat layout
+
+    Returns:
+        pathlib.Path: Directory for article files
+    """
+    return base.joinpath(*get_shard_parts(article_id, depth))
+
+
+def is_shard_name(name: str) -> bool:
+    """
+    Check whether the name can be a shard directory name.
+
+    Args:
+        name (str): Directory name
+
+    Returns:
+        bool: True if the name consists of SHARD_WIDTH hexadecimal characters
+    """
+    return len(name) == SHARD_WIDTH and all(char in "0123456789abcdef" for char in name)
+
+
+def is_shard_dir(entry: os.DirEntry) -> bool:
+    """
+    Check whether the directory entry is a shard directory.
+
+    Args:
+        entry (os.DirEntry): Directory entry
+
+    Returns:
+        bool: True if the entry is a shard directory
+    """
+    return is_shard_name(entry.name) and entry.is_dir(follow_symlinks=False)
+
+
+def iter_dataset_entries(base: pathlib.Path | str) -> Iterator[os.DirEntry]:
+    """
+    Iterate over directory entries of dataset files in both flat and sharded layouts.
+
+    Entries cache the results of their stat calls.
+
+    Args:
+        base (pathlib.Path | str): Dataset root
+
+    Yields:
+        os.DirEntry: Entry of a dataset file
+    """
+    with os.scandir(base) as entries:
+        for entry in entries:
+            if is_shard_dir(entry):
+                yield from iter_dataset_entries(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def iter_dataset_files(base: pathlib.Path) -> Iterator[pathlib.Path]:
+    """
+    Iterate over dataset files in both flat and sharded layouts.
+
+    Args:
+        base (pathlib.Path): Dataset root
+
+    Yields:
+        pathlib.Path: Path to a dataset file
+    """
+    for entry in iter_dataset_entries(base):
+        yield pathlib.Path(entry.path)
@@ -0,0 +1,454 @@
+"""
+Manifest of dataset files collected in a single directory pass.
+"""
+
+import hashlib
+import os
+import pathlib
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from core_utils.article.codecs import strip_codec_suffix
+from core_utils.article.layout import is_shard_dir
+from core_utils.article.serialization import get_serializer
+from core_utils.article.sidecars import get_sidecar_path
+
+#: Suffix of raw text file names, compression suffixes aside
+RAW_SUFFIX = "_raw.txt"
+
+#: Suffix of meta file names
+META_SUFFIX = "_meta.json"
+
+#: Name of the cached manifest among files derived from the dataset
+MANIFEST_NAME = "manifest.json"
+
+#: Version of the cached manifest format
+MANIFEST_VERSION = 1
+
+#: Directories modified this close to the manifest save are listed again next time,
+#: their modification time may not reflect later changes made within the same tick
+RACY_WINDOW_NS = 1_000_000_000
+
+
+@dataclass
+class ManifestEntry:
+    """
+    Files of one article.
+    """
+
+    #: Path to the raw text
+    raw_path: Optional[str] = None
+
+    #: Size of the raw text file
+    raw_size: int = 0
+
+    #: Modification time of the raw text file
+    raw_mtime_ns: int = 0
+
+    #: Content hash of the raw text file, empty until get_raw_hash() is called
+    raw_hash: str = ""
+
+    #: Path to the meta file
+    meta_path: Optional[str] = None
+
+    #: Size of the meta file
+    meta_size: int = 0
+
+    #: Modification time of the meta file
+    meta_mtime_ns: int = 0
+
+    #: Content hash of the meta file, empty until get_meta_hash() is called
+    meta_hash: str = ""
+
+    def get_raw_hash(self) -> str:
+        """
+        Get content hash of the raw text file, hashing the file on the first call.
+
+        Returns:
+            str: Content hash, empty if the article has no raw text
+        """
+        if not self.raw_hash and self.raw_path:
+            self.raw_hash = hash_file(self.raw_path)
+        return self.raw_hash
+
+    def get_meta_hash(self) -> str:
+        """
+        Get content hash of the meta file, hashing the file on the first call.
+
+        Returns:
+            str: Content hash, empty if the article has no meta file
+        """
+        if not self.meta_hash and self.meta_path:
+            self.meta_hash = hash_file(self.meta_path)
+        return self.meta_hash
+
+
+@dataclass
+class DatasetManifest:
+    """
+    Raw and meta files of a dataset by article id.
+    """
+
+    #: Files by article id, in the order of the directory listing
+    entries: dict[int, ManifestEntry] = field(default_factory=dict)
+
+    #: Number of raw text files, several compressed variants are counted separately
+    raw_count: int = 0
+
+    #: Number of meta files
+    meta_count: int = 0
+
+    #: Whether the dataset root has no entries at all
+    is_empty: bool = True
+
+    #: Listings of dataset directories by their path relative to the root
+    directories: dict[str, dict] = field(default_factory=dict)
+
+    #: Number of directories listed while building the manifest
+    listed: int = 0
+
+    #: Time the manifest was built at
+    built_ns: int = 0
+
+    def add(self, name: str, path: str, state: tuple[int, int, str]) -> None:
+        """
+        Register a dataset file.
+
+        Args:
+            name (str): File name
+            path (str): Path to the file
+            state (tuple[int, int, str]): Size, modification time and content hash
+                of the file, the hash is empty if unknown
+        """
+        size, mtime_ns, digest = state
+        files = self.entries.setdefault(int(name.split("_")[0]), ManifestEntry())
+        if name.endswith(META_SUFFIX):
+            files.meta_path = path
+            files.meta_size = size
+            files.meta_mtime_ns = mtime_ns
+            files.meta_hash = digest
+            self.meta_count += 1
+        else:
+            files.raw_path = path
+            files.raw_size = size
+            files.raw_mtime_ns = mtime_ns
+            files.raw_hash = digest
+            self.raw_count += 1
+
+    def get_raw_ids(self) -> list[int]:
+        """
+        Get ids of articles with a raw text.
+
+        Returns:
+            list[int]: Article ids
+        """
+        return [article_id for article_id, files in self.entries.items() if files.raw_path]
+
+    def get_meta_ids(self) -> list[int]:
+        """
+        Get ids of articles with a meta file.
+
+        Returns:
+            list[int]: Article ids
+        """
+        return [article_id for article_id, files in self.entries.items() if files.meta_path]
+
+    def get_shard_depth(self) -> int:
+        """
+        Get number of shard levels the dataset files are stored with.
+
+        Returns:
+            int: Number of shard levels, 0 for the flat layout or a dataset without files
+
+        Raises:
+            ValueError: If files are stored at different shard levels
+        """
+        depths = {
+            len(relative.split("/")) if relative else 0
+            for relative, listing in self.directories.items()
+            if listing["files"]
+        }
+        if len(depths) > 1:
+            raise ValueError(
+                f"Dataset files are stored at shard levels {sorted(depths)}, "
+                "move them to one layout with admin_utils/reshard_dataset.py"
+            )
+        return depths.pop() if depths else 0
+
+
+def is_article_file(name: str) -> bool:
+    """
+    Check whether the file is a raw text or a meta file.
+
+    Args:
+        name (str): File name
+
+    Returns:
+        bool: True for raw texts and meta files
+    """
+    return name.endswith(META_SUFFIX) or strip_codec_suffix(name).endswith(RAW_SUFFIX)
+
+
+def hash_file(path: str) -> str:
+    """
+    Get content hash of a file.
+
+    Args:
+        path (str): Path to the file
+
+    Returns:
+        str: Hex digest
+    """
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+
+def get_manifest_path(base: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the cached manifest of the dataset.
+
+    Args:
+        base (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the manifest file
+    """
+    return get_sidecar_path(base, MANIFEST_NAME)
+
+
+def _get_file_state(stat: os.stat_result, cached: tuple) -> tuple[int, int, str]:
+    """
+    Get size, modification time and content hash of a dataset file.
+
+    The cached hash is kept only if neither the size nor the modification
+    time changed, otherwise the file is hashed when the hash is requested.
+
+    Args:
+        stat (os.stat_result): Current state of the file
+        cached (tuple): Cached size, modification time and hash of the file
+
+    Returns:
+        tuple[int, int, str]: Size, modification time and hash of the file, empty if unknown
+    """
+    size, mtime_ns, digest = cached
+    if (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+        digest = ""
+    return stat.st_size, stat.st_mtime_ns, digest
+
+
+def _restat_listing(directory: str, listing: dict) -> Optional[dict]:
+    """
+    Refresh states of the files of a cached directory listing.
+
+    Args:
+        directory (str): Path to the directory
+        listing (dict): Cached listing of the directory
+
+    Returns:
+        Optional[dict]: Listing with current file states, None if a listed file is gone
+    """
+    files = {}
+    try:
+        for name, state in listing["files"].items():
+            files[name] = _get_file_state(os.stat(os.path.join(directory, name)), state)
+    except FileNotFoundError:
+        return None
+    return dict(listing, files=files)
+
+
+def _scan_listing(directory: str, mtime_ns: int, old_files: dict) -> dict:
+    """
+    List a directory, classifying its entries into article files, shards and other entries.
+
+    Args:
+        directory (str): Path to the directory
+        mtime_ns (int): Modification time of the directory
+        old_files (dict): Cached states of the directory files
+
+    Returns:
+        dict: Listing of the directory
+    """
+    listing: dict = {"mtime_ns": mtime_ns, "files": {}, "shards": [], "other": 0}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if is_shard_dir(entry):
+                listing["shards"].append(entry.name)
+            elif entry.is_file() and is_article_file(entry.name):
+                listing["files"][entry.name] = _get_file_state(
+                    entry.stat(), old_files.get(entry.name, (-1, -1, ""))
+                )
+            else:
+                listing["other"] += 1
+    return listing
+
+
+def _list_directory(
+    manifest: DatasetManifest, directory: str, relative: str, cached: dict, saved_ns: int
+) -> None:
+    """
+    Register files of a dataset directory and its shards.
+
+    A directory whose modification time matches the cached one is not listed,
+    since creating, removing or renaming a file changes the directory. Files
+    rewritten in place do not change it, so cached files are stat-ed anyway.
+    No file is hashed, hashes of unchanged files are taken from the cache.
+
+    Args:
+        manifest (DatasetManifest): Manifest to fill
+        directory (str): Path to the directory
+        relative (str): Path to the directory relative to the dataset root
+        cached (dict): Cached listings of directories
+        saved_ns (int): Time the cached listings were saved at
+    """
+    mtime_ns = os.stat(directory).st_mtime_ns
+    cached_listing = cached.get(relative)
+    listing = None
+    if (
+        cached_listing
+        and cached_listing["mtime_ns"] == mtime_ns
+        and mtime_ns < saved_ns - RACY_WINDOW_NS
+    ):
+        listing = _restat_listing(directory, cached_listing)
+    if listing is None:
+        old_files = cached_listing["files"] if cached_listing else {}
+        listing = _scan_listing(directory, mtime_ns, old_files)
+        manifest.listed += 1
+
+    manifest.directories[relative] = listing
+    for name, state in listing["files"].items():
+        manifest.add(name, os.path.join(directory, name), state)
+    for shard in listing["shards"]:
+        _list_directory(
+            manifest,
+            os.path.join(directory, shard),
+            f"{relative}/{shard}" if relative else shard,
+            cached,
+            saved_ns,
+        )
+
+
+def build_manifest(base: pathlib.Path, cached: Optional[dict] = None) -> DatasetManifest:
+    """
+    Collect raw and meta files of the dataset with one os.scandir pass.
+
+    Only raw and meta files are stat-ed, once each. Paths are kept as strings,
+    building pathlib objects for every file would take longer than the pass itself.
+    Directories unchanged since the cached manifest was saved are not listed at all.
+    Files are hashed only on request, see ManifestEntry.get_raw_hash().
+
+    Args:
+        base (pathlib.Path): Dataset root
+        cached (Optional[dict]): Manifest loaded with load_manifest()
+
+    Returns:
+        DatasetManifest: Manifest of the dataset
+    """
+    manifest = DatasetManifest(built_ns=time.time_ns())
+    cached = cached or {}
+    _list_directory(
+        manifest, str(base), "", cached.get("directories", {}), cached.get("saved_ns", 0)
+    )
+    root = manifest.directories[""]
+    manifest.is_empty = not (root["files"] or root["shards"] or root["other"])
+    return manifest
+
+
+def load_manifest(base: pathlib.Path) -> Optional[dict]:
+    """
+    Load the cached manifest of the dataset.
+
+    Args:
+        base (pathlib.Path): Dataset root
+
+    Returns:
+        Optional[dict]: Cached manifest, None if it is missing or outdated
+    """
+    try:
+        with open(get_manifest_path(base), "rb") as manifest_file:
+            cached = get_serializer().loads(manifest_file.read())
+    except (OSError, ValueError):
+        return None
+    return cached if cached.get("version") == MANIFEST_VERSION else None
+
+
+def _get_known_hash(manifest: DatasetManifest, path: str, name: str) -> str:
+    """
+    Get content hash of a listed file if it was requested while the manifest was used.
+
+    Args:
+        manifest (DatasetManifest): Manifest of the dataset
+        path (str): Path to the file
+        name (str): File name
+
+    Returns:
+        str: Content hash, empty if unknown
+    """
+    files = manifest.entries.get(int(name.split("_")[0]))
+    if files is None:
+        return ""
+    if name.endswith(META_SUFFIX):
+        return files.meta_hash if files.meta_path == path else ""
+    return files.raw_hash if files.raw_path == path else ""
+
+
+def _keep_known_hashes(base: pathlib.Path, manifest: DatasetManifest) -> None:
+    """
+    Copy content hashes computed since the manifest was built into its directory listings.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        manifest (DatasetManifest): Manifest of the dataset
+    """
+    for relative, listing in manifest.directories.items():
+        directory = os.path.join(str(base), relative) if relative else str(base)
+        for name, (size, mtime_ns, digest) in listing["files"].items():
+            if not digest:
+                digest = _get_known_hash(manifest, os.path.join(directory, name), name)
+                listing["files"][name] = (size, mtime_ns, digest)
+
+
+def refresh_manifest(base: pathlib.Path, manifest: DatasetManifest) -> DatasetManifest:
+    """
+    Bring a manifest in line with files written to the dataset since it was built.
+
+    Only directories changed since then are listed again, files of the others
+    are stat-ed. Hashes of unchanged files are kept.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        manifest (DatasetManifest): Manifest built with build_manifest()
+
+    Returns:
+        DatasetManifest: Manifest of the dataset
+    """
+    _keep_known_hashes(base, manifest)
+    return build_manifest(
+        base, {"directories": manifest.directories, "saved_ns": manifest.built_ns}
+    )
+
+
+def save_manifest(base: pathlib.Path, manifest: DatasetManifest) -> None:
+    """
+    Save the manifest among files derived from the dataset.
+
+    Hashes computed since the manifest was built are saved as well, so they
+    are not computed again while the files stay unchanged.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        manifest (DatasetManifest): Manifest to save
+    """
+    _keep_known_hashes(base, manifest)
+    path = get_manifest_path(base)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = {
+        "version": MANIFEST_VERSION,
+        "saved_ns": time.time_ns(),
+        "directories": manifest.directories,
+    }
+    # several processes may share the dataset, each writes its own temporary file
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}")
+    with open(temp_path, "wb") as manifest_file:
+        manifest_file.write(get_serializer().dumps(content, compact=True))
+    os.replace(temp_path, path)
@@ -0,0 +1,295 @@
+"""
+SQLite index over meta information of articles.
+"""
+
+import datetime
+import pathlib
+import sqlite3
+from typing import Iterable, Optional
+
+from core_utils.article.manifest import build_manifest, DatasetManifest, load_manifest
+from core_utils.article.serialization import get_serializer
+from core_utils.article.sidecars import get_sidecar_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT,
+    title TEXT,
+    date TEXT
+);
+CREATE TABLE IF NOT EXISTS authors (id INTEGER NOT NULL, author TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS topics (id INTEGER NOT NULL, topic TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS pos_frequencies (
+    id INTEGER NOT NULL,
+    pos TEXT NOT NULL,
+    frequency INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta_files (
+    id INTEGER PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_date ON articles (date);
+CREATE INDEX IF NOT EXISTS articles_url ON articles (url);
+CREATE INDEX IF NOT EXISTS authors_author ON authors (author, id);
+CREATE INDEX IF NOT EXISTS authors_id ON authors (id);
+CREATE INDEX IF NOT EXISTS topics_topic ON topics (topic, id);
+CREATE INDEX IF NOT EXISTS topics_id ON topics (id);
+CREATE INDEX IF NOT EXISTS pos_frequencies_pos ON pos_frequencies (pos, frequency, id);
+CREATE INDEX IF NOT EXISTS pos_frequencies_id ON pos_frequencies (id);
+"""
+
+#: Name of the index among files derived from the dataset
+INDEX_NAME = "meta_index.sqlite"
+
+#: Tables holding rows of an article
+TABLES = ("articles", "authors", "topics", "pos_frequencies", "meta_files")
+
+#: Size, modification time and content hash of a meta file nothing is known about
+UNKNOWN_STATE = (-1, -1, "")
+
+
+def get_index_path(dataset_path: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the meta index for the dataset.
+
+    The index is stored among files derived from the dataset, so it is never mistaken
+    for an article.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the index database
+    """
+    return get_sidecar_path(dataset_path, INDEX_NAME)
+
+
+class MetaIndex:
+    """
+    Index of article meta information stored in SQLite.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        Initialize an instance of the MetaIndex class.
+
+        Args:
+            path (pathlib.Path): Path to the index database
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "MetaIndex":
+        """
+        Enter the runtime context.
+
+        Returns:
+            MetaIndex: The index itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Commit changes and close the database on exit from the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Commit changes and close the database.
+        """
+        self._connection.commit()
+        self._connection.close()
+
+    def update_many(
+        self, metas: Iterable[dict], states: Optional[dict[int, tuple[int, int, str]]] = None
+    ) -> None:
+        """
+        Insert or replace meta information of several articles in one transaction.
+
+        Args:
+            metas (Iterable[dict]): Meta information in the Article.get_meta() format
+            states (Optional[dict[int, tuple[int, int, str]]]): Size, modification time
+                and content hash of the meta files by article id
+        """
+        states = states or {}
+        with self._connection:
+            for meta in metas:
+                article_id = meta.get("id", 0)
+                for table in ("authors", "topics", "pos_frequencies"):
+                    self._connection.execute(f"DELETE FROM {table} WHERE id = ?", (article_id,))
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO articles (id, url, title, date) VALUES (?, ?, ?, ?)",
+                    (article_id, meta.get("url"), meta.get("title"), meta.get("date")),
+                )
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta_files (id, size, mtime_ns, hash) "
+                    "VALUES (?, ?, ?, ?)",
+                    (article_id, *states.get(article_id, UNKNOWN_STATE)),
+                )
+                self._connection.executemany(
+                    "INSERT INTO authors (id, author) VALUES (?, ?)",
+                    [(article_id, author) for author in meta.get("author") or []],
+                )
+                self._connection.executemany(
+                    "INSERT INTO topics (id, topic) VALUES (?, ?)",
+                    [(article_id, topic) for topic in meta.get("topics") or []],
+                )
+                self._connection.executemany(
+                    "INSERT INTO pos_frequencies (id, pos, frequency) VALUES (?, ?, ?)",
+                    [
+                        (article_id, pos, frequency)
+                        for pos, frequency in (meta.get("pos_frequencies") or {}).items()
+                    ],
+                )
+
+    def remove(self, article_ids: Iterable[int]) -> None:
+        """
+        Remove articles from the index.
+
+        Args:
+            article_ids (Iterable[int]): Ids of articles to remove
+        """
+        rows = [(article_id,) for article_id in article_ids]
+        with self._connection:
+            for table in TABLES:
+                self._connection.executemany(f"DELETE FROM {table} WHERE id = ?", rows)
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the index.
+        """
+        with self._connection:
+            for table in TABLES:
+                self._connection.execute(f"DELETE FROM {table}")
+
+    def get_meta_states(self) -> dict[int, tuple[int, int, str]]:
+        """
+        Get states of the indexed meta files.
+
+        Returns:
+            dict[int, tuple[int, int, str]]: Size, modification time and content hash
+                by article id
+        """
+        return {
+            article_id: (size, mtime_ns, digest)
+            for article_id, size, mtime_ns, digest in self._connection.execute(
+                "SELECT id, size, mtime_ns, hash FROM meta_files"
+            )
+        }
+
+    def sync(self, manifest: DatasetManifest) -> int:
+        """
+        Bring the index in line with meta files of the dataset.
+
+        Articles whose meta files are gone are removed, e.g. after the dataset
+        is recreated with fewer articles. Only meta files with a size or
+        modification time other than the indexed one are hashed, the ones whose
+        content changed as well are read again. Meta files saved by to_meta()
+        since the last sync are picked up the same way.
+
+        Args:
+            manifest (DatasetManifest): Manifest of the dataset
+
+        Returns:
+            int: Number of articles read again
+        """
+        indexed = self.get_meta_states()
+        entries = {
+            article_id: files for article_id, files in manifest.entries.items() if files.meta_path
+        }
+        self.remove(sorted(indexed.keys() - entries.keys()))
+        states = {
+            article_id: (files.meta_size, files.meta_mtime_ns, files.get_meta_hash())
+            for article_id, files in entries.items()
+            if indexed.get(article_id, UNKNOWN_STATE)[:2] != (files.meta_size, files.meta_mtime_ns)
+        }
+        # touched files with the same content are not read again
+        touched = {
+            article_id: state
+            for article_id, state in states.items()
+            if article_id in indexed and indexed[article_id][2] == state[2]
+        }
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE meta_files SET size = ?, mtime_ns = ? WHERE id = ?",
+                [
+                    (size, mtime_ns, article_id)
+                    for article_id, (size, mtime_ns, _) in touched.items()
+                ],
+            )
+        serializer = get_serializer()
+        metas = []
+        for article_id in states.keys() - touched.keys():
+            with open(str(entries[article_id].meta_path), "rb") as meta_file:
+                metas.append(serializer.loads(meta_file.read()))
+        self.update_many(metas, states)
+        return len(metas)
+
+    def find_ids(  # pylint: disable=too-many-arguments
+        self,
+        date: Optional[datetime.date] = None,
+        author: Optional[str] = None,
+        topic: Optional[str] = None,
+        url: Optional[str] = None,
+        pos: Optional[str] = None,
+        min_frequency: int = 1,
+    ) -> set[int]:
+        """
+        Find articles matching all the given conditions.
+
+        Args:
+            date (Optional[datetime.date]): Day of publication
+            author (Optional[str]): Author of the article
+            topic (Optional[str]): Topic of the article
+            url (Optional[str]): Url of the article
+            pos (Optional[str]): Part of speech the article contains
+            min_frequency (int): Minimal frequency of the part of speech
+
+        Returns:
+            set[int]: Ids of matching articles
+        """
+        query = "SELECT id FROM articles WHERE 1"
+        params: list = []
+        if date is not None:
+            day = datetime.datetime(date.year, date.month, date.day)
+            next_day = day + datetime.timedelta(days=1)
+            query += " AND date >= ? AND date < ?"
+            params.extend([f"{day:%Y-%m-%d %H:%M:%S}", f"{next_day:%Y-%m-%d %H:%M:%S}"])
+        if url is not None:
+            query += " AND url = ?"
+            params.append(url)
+        if author is not None:
+            query += " AND id IN (SELECT id FROM authors WHERE author = ?)"
+            params.append(author)
+        if topic is not None:
+            query += " AND id IN (SELECT id FROM topics WHERE topic = ?)"
+            params.append(topic)
+        if pos is not None:
+            query += " AND id IN (SELECT id FROM pos_frequencies WHERE pos = ? AND frequency >= ?)"
+            params.extend([pos, min_frequency])
+        return {row[0] for row in self._connection.execute(query, params)}
+
+
+def rebuild_index(dataset_path: pathlib.Path) -> int:
+    """
+    Build the meta index of the dataset from scratch.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+
+    Returns:
+        int: Number of indexed articles
+    """
+    manifest = build_manifest(dataset_path, load_manifest(dataset_path))
+    with MetaIndex(get_index_path(dataset_path)) as index:
+        index.clear()
+        return index.sync(manifest)
@@ -0,0 +1,329 @@
+"""
+Sentence views over a single text buffer.
+"""
+
+import re
+from typing import Iterable, Iterator, Optional
+
+#: Boundary between sentences inside a line, same as in split_by_sentence
+SENTENCE_BOUNDARY_PATTERN = re.compile(
+    r"(?<!\w\.\w.)(?<![А-Я][а-я]\.)((?<=\.|\?|!)|(?<=\?\"|!\"))\s(?=[А-Я])"
+)
+
+#: Line breaks, each of them ends a sentence
+LINE_BREAK_PATTERN = re.compile(r"[\n|\t]+")
+
+#: Line ends, long texts are split into chunks there first
+LINE_END_PATTERN = re.compile(r"\n+")
+
+#: Blank lines separating sentences in CONLL-U markup
+CONLLU_BOUNDARY_PATTERN = re.compile(r"\n\n+")
+
+#: Any character other than whitespace
+NON_SPACE_PATTERN = re.compile(r"\S")
+
+#: Sentence number comment of CONLL-U markup
+SENT_ID_PATTERN = re.compile(r"^# sent_id = (\d+)$", re.MULTILINE)
+
+#: Minimal length of a sentence, shorter fragments are skipped
+MIN_SENTENCE_LENGTH = 11
+
+
+class SentenceView:
+    """
+    Sentence given by its offsets in a text, the text itself is never copied.
+
+    The sentence string is only built on str() calls. Regular expressions can be
+    applied without building it at all, see search() and finditer().
+    """
+
+    __slots__ = ("buffer", "start", "end")
+
+    def __init__(self, buffer: str, start: int, end: int) -> None:
+        """
+        Initialize an instance of the SentenceView class.
+
+        Args:
+            buffer (str): Whole text
+            start (int): Offset of the first sentence character
+            end (int): Offset after the last sentence character
+        """
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        """
+        Get the sentence text.
+
+        Returns:
+            str: Sentence text
+        """
+        return self.buffer[self.start : self.end]
+
+    def __repr__(self) -> str:
+        """
+        Get the view representation.
+
+        Returns:
+            str: View representation
+        """
+        return f"SentenceView({self.start}, {self.end}, {str(self)!r})"
+
+    def __len__(self) -> int:
+        """
+        Get the sentence length.
+
+        Returns:
+            int: Number of characters
+        """
+        return self.end - self.start
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare the sentence with a string or another view.
+
+        Args:
+            other (object): Object to compare with
+
+        Returns:
+            bool: Whether the texts are equal
+        """
+        if isinstance(other, (str, SentenceView)):
+            return str(self) == str(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """
+        Get hash of the sentence text.
+
+        Returns:
+            int: Hash value
+        """
+        return hash(str(self))
+
+    def search(self, pattern: re.Pattern) -> Optional[re.Match]:
+        """
+        Find the first match of the pattern inside the sentence.
+
+        Match offsets refer to the whole text. Lookbehind assertions may see
+        characters before the sentence.
+
+        Args:
+            pattern (re.Pattern): Compiled pattern
+
+        Returns:
+            Optional[re.Match]: Match if any
+        """
+        return pattern.search(self.buffer, self.start, self.end)
+
+    def finditer(self, pattern: re.Pattern) -> Iterator[re.Match]:
+        """
+        Find all matches of the pattern inside the sentence.
+
+        Args:
+            pattern (re.Pattern): Compiled pattern
+
+        Returns:
+            Iterator[re.Match]: Matches with offsets in the whole text
+        """
+        return pattern.finditer(self.buffer, self.start, self.end)
+
+
+def _split(text: str, boundary: re.Pattern, start: int, end: int) -> Iterator[tuple[int, int]]:
+    """
+    Get offsets of text parts between boundaries.
+
+    Args:
+        text (str): Whole text
+        boundary (re.Pattern): Boundary pattern
+        start (int): Offset to start from
+        end (int): Offset to stop at
+
+    Returns:
+        Iterator[tuple[int, int]]: Start and end offsets of the parts
+    """
+    for match in boundary.finditer(text, start, end):
+        yield start, match.start()
+        start = match.end()
+    yield start, end
+
+
+def iter_sentence_spans(text: str) -> Iterator[tuple[int, int]]:
+    """
+    Get offsets of sentences in the text.
+
+    Sentences are found as in split_by_sentence, except that a line break always
+    ends a sentence and no period is added in its place.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        Iterator[tuple[int, int]]: Start and end offsets of sentences
+    """
+    for line_start, line_end in _split(text, LINE_BREAK_PATTERN, 0, len(text)):
+        for start, end in _split(text, SENTENCE_BOUNDARY_PATTERN, line_start, line_end):
+            if end - start >= MIN_SENTENCE_LENGTH and NON_SPACE_PATTERN.search(text, start, end):
+                yield start, end
+
+
+def iter_sentences(text: str) -> Iterator[SentenceView]:
+    """
+    Get views of sentences in the text.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        Iterator[SentenceView]: Sentence views
+    """
+    for start, end in iter_sentence_spans(text):
+        yield SentenceView(text, start, end)
+
+
+def iter_conllu_sentences(conllu: str) -> Iterator[SentenceView]:
+    """
+    Get views of sentence blocks in CONLL-U markup.
+
+    Args:
+        conllu (str): CONLL-U markup
+
+    Returns:
+        Iterator[SentenceView]: Views of sentence blocks without separating blank lines
+    """
+    for start, end in _split(conllu, CONLLU_BOUNDARY_PATTERN, 0, len(conllu)):
+        if NON_SPACE_PATTERN.search(conllu, start, end):
+            yield SentenceView(conllu, start, end)
+
+
+def _iter_cuts(text: str, start: int, end: int, max_length: int) -> Iterator[int]:
+    """
+    Get offsets cutting a part of the text into pieces of bounded length.
+
+    A piece ends after the last space that fits the limit, or right at the limit
+    if there is no space.
+
+    Args:
+        text (str): Whole text
+        start (int): Offset of the part
+        end (int): Offset after the part
+        max_length (int): Maximal length of a piece
+
+    Returns:
+        Iterator[int]: Ascending end offsets of the pieces
+    """
+    while end - start > max_length:
+        space = text.rfind(" ", start, start + max_length)
+        start = space + 1 if space >= start else start + max_length
+        yield start
+    yield end
+
+
+def _iter_chunk_boundaries(text: str, max_length: int) -> Iterator[int]:
+    """
+    Get offsets the text may be split at.
+
+    Line ends are taken first. A line longer than max_length is split at
+    sentence boundaries, a sentence longer than max_length is cut.
+
+    Args:
+        text (str): Text to split
+        max_length (int): Maximal length of a chunk
+
+    Returns:
+        Iterator[int]: Ascending offsets, no further than max_length apart
+    """
+    line_start = 0
+    for line_end in [*(match.end() for match in LINE_END_PATTERN.finditer(text)), len(text)]:
+        if line_end - line_start <= max_length:
+            yield line_end
+        else:
+            start = line_start
+            for match in SENTENCE_BOUNDARY_PATTERN.finditer(text, line_start, line_end):
+                yield from _iter_cuts(text, start, match.end(), max_length)
+                start = match.end()
+            yield from _iter_cuts(text, start, line_end, max_length)
+        line_start = line_end
+
+
+def split_into_chunks(text: str, max_length: int) -> list[str]:
+    """
+    Split text into chunks of bounded length, preferably at line ends.
+
+    Sentences are left to the model, a period is no reliable boundary in texts
+    like "А. С. Пушкин родился в г. Москве". So lines are only split at sentence
+    boundaries if they are longer than max_length, and sentences longer than
+    max_length are cut at a space or anywhere if there is none. Chunks cover
+    the whole text, each of them ends with the line breaks that follow its last line.
+
+    Args:
+        text (str): Text to split
+        max_length (int): Maximal length of a chunk
+
+    Returns:
+        list[str]: Chunks in the order of the text
+    """
+    if len(text) <= max_length:
+        return [text]
+    chunks = []
+    start = last = 0
+    for boundary in _iter_chunk_boundaries(text, max_length):
+        if boundary - start > max_length and last > start:
+            chunks.append(text[start:last])
+            start = last
+        last = boundary
+    chunks.append(text[start:])
+    return chunks
+
+
+def _shift_sentence_ids(conllu: str, offset: int) -> str:
+    """
+    Increase sentence numbers of CONLL-U markup.
+
+    Args:
+        conllu (str): CONLL-U markup
+        offset (int): Number to add
+
+    Returns:
+        str: Markup with shifted sentence numbers
+    """
+    return SENT_ID_PATTERN.sub(lambda match: f"# sent_id = {int(match.group(1)) + offset}", conllu)
+
+
+def renumber_conllu_sentences(chunks: Iterable[Iterable[str]]) -> Iterator[str]:
+    """
+    Number sentences of text chunks through the whole text.
+
+    Tokens are numbered within sentences, so only sentence numbers change.
+
+    Args:
+        chunks (Iterable[Iterable[str]]): CONLL-U blocks of every chunk in the order of the text,
+            numbered from one within the chunk
+
+    Returns:
+        Iterator[str]: Blocks with sentence numbers of the whole text
+    """
+    offset = 0
+    for blocks in chunks:
+        last = 0
+        for block in blocks:
+            last = max([last, *(int(number) for number in SENT_ID_PATTERN.findall(block))])
+            yield _shift_sentence_ids(block, offset) if offset else block
+        offset += last
+
+
+def join_conllu_chunks(chunks: list[str]) -> str:
+    """
+    Join CONLL-U markup of text chunks, numbering sentences through the whole text.
+
+    Args:
+        chunks (list[str]): Markup of chunks in the order of the text
+
+    Returns:
+        str: Markup of the whole text
+    """
+    filled = [chunk for chunk in chunks if NON_SPACE_PATTERN.search(chunk)]
+    if not filled:
+        return "".join(chunks[:1])
+    return "".join(renumber_conllu_sentences([chunk] for chunk in filled))
@@ -0,0 +1,145 @@
+"""
+Serializers for Article meta information.
+"""
+
+# pylint: disable=too-few-public-methods
+import json
+from typing import Protocol
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+class MetaSerializer(Protocol):
+    """
+    Interface definition for meta information serializers.
+    """
+
+    #: Serializer name
+    name: str
+
+    def dumps(self, meta: dict, compact: bool = False) -> bytes:
+        """
+        Serialize meta information.
+
+        Args:
+            meta (dict): Meta information
+            compact (bool): Whether to skip indentation
+
+        Returns:
+            bytes: UTF-8 encoded JSON document
+        """
+
+    def loads(self, content: bytes) -> dict:
+        """
+        Deserialize meta information.
+
+        Args:
+            content (bytes): UTF-8 encoded JSON document
+
+        Returns:
+            dict: Meta information
+        """
+
+
+class StdlibSerializer:
+    """
+    Meta information serializer based on the json module.
+    """
+
+    name = "json"
+
+    def dumps(self, meta: dict, compact: bool = False) -> bytes:
+        """
+        Serialize meta information.
+
+        Args:
+            meta (dict): Meta information
+            compact (bool): Whether to skip indentation
+
+        Returns:
+            bytes: UTF-8 encoded JSON document
+        """
+        if compact:
+            return json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return json.dumps(meta, indent=4, ensure_ascii=False, separators=(",", ": ")).encode(
+            "utf-8"
+        )
+
+    def loads(self, content: bytes) -> dict:
+        """
+        Deserialize meta information.
+
+        Args:
+            content (bytes): UTF-8 encoded JSON document
+
+        Returns:
+            dict: Meta information
+        """
+        meta: dict = json.loads(content.decode("utf-8"))
+        return meta
+
+
+class OrjsonSerializer(StdlibSerializer):
+    """
+    Meta information serializer based on the orjson library.
+
+    orjson only supports two-space indentation, so pretty documents are still
+    produced by the json module to keep the existing four-space format.
+    Non-string keys, e.g. integer ones, are converted to strings in both
+    formats, as the json module does.
+    """
+
+    name = "orjson"
+
+    def dumps(self, meta: dict, compact: bool = False) -> bytes:
+        """
+        Serialize meta information.
+
+        Args:
+            meta (dict): Meta information
+            compact (bool): Whether to skip indentation
+
+        Returns:
+            bytes: UTF-8 encoded JSON document
+        """
+        if not compact:
+            return super().dumps(meta)
+        content: bytes = orjson.dumps(meta, option=orjson.OPT_NON_STR_KEYS)
+        return content
+
+    def loads(self, content: bytes) -> dict:
+        """
+        Deserialize meta information.
+
+        Args:
+            content (bytes): UTF-8 encoded JSON document
+
+        Returns:
+            dict: Meta information
+        """
+        meta: dict = orjson.loads(content)
+        return meta
+
+
+def get_serializer(name: str | None = None) -> MetaSerializer:
+    """
+    Get a meta information serializer.
+
+    Args:
+        name (str | None): Serializer name, the fastest available one is used by default
+
+    Returns:
+        MetaSerializer: Serializer instance
+    """
+    if name is None:
+        name = "orjson" if orjson is not None else "json"
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("orjson serializer requested, but orjson is not installed")
+        return OrjsonSerializer()
+    if name == "json":
+        return StdlibSerializer()
+    raise ValueError(f"Unknown serializer: {name}")
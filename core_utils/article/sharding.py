@@ -0,0 +1,255 @@
+"""
+Splitting a dataset into shards processed independently and merging their results.
+"""
+
+import enum
+import heapq
+import os
+import pathlib
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Iterable
+
+from core_utils.article.manifest import build_manifest, load_manifest
+from core_utils.article.serialization import get_serializer
+from core_utils.article.sidecars import get_sidecar_path
+
+#: Name of the directory with results of processed shards among files derived from the dataset
+SHARDS_NAME = "shards"
+
+#: Name of the merged result among results of processed shards
+MERGED_NAME = "merged.json"
+
+
+class ShardStrategy(enum.Enum):
+    """
+    Ways to split article ids into shards.
+    """
+
+    #: Contiguous id ranges with the same number of articles
+    RANGE = "range"
+
+    #: Shards with close total text length
+    BALANCED = "balanced"
+
+
+class IncompleteShardsError(Exception):
+    """
+    Results of some shards are missing or do not cover the dataset exactly once
+    """
+
+
+@dataclass
+class ShardResult:
+    """
+    Corpus-level outputs of the pipelines run over one shard.
+    """
+
+    #: Position of the shard in the plan
+    index: int
+
+    #: Number of shards in the plan
+    count: int
+
+    #: Ids of processed articles
+    article_ids: list[int] = field(default_factory=list)
+
+    #: Total frequencies of parts of speech
+    pos_frequencies: dict[str, int] = field(default_factory=dict)
+
+    #: Pattern matches by article id
+    pattern_matches: dict[int, dict] = field(default_factory=dict)
+
+
+def plan_shards(
+    sizes: dict[int, int], count: int, strategy: ShardStrategy = ShardStrategy.RANGE
+) -> list[list[int]]:
+    """
+    Split article ids into shards.
+
+    Balanced shards are filled greedily, the longest article going to the
+    shard with the least total length so far.
+
+    Args:
+        sizes (dict[int, int]): Text lengths by article id
+        count (int): Number of shards
+        strategy (ShardStrategy): Way to split the ids
+
+    Returns:
+        list[list[int]]: Sorted article ids of every shard
+    """
+    if count < 1:
+        raise ValueError(f"Number of shards must be positive, got {count}")
+    article_ids = sorted(sizes)
+    if strategy is ShardStrategy.RANGE:
+        total = len(article_ids)
+        return [
+            article_ids[total * index // count : total * (index + 1) // count]
+            for index in range(count)
+        ]
+
+    shards: list[list[int]] = [[] for _ in range(count)]
+    totals = [(0, index) for index in range(count)]
+    for article_id in sorted(article_ids, key=lambda article_id: -sizes[article_id]):
+        total, index = heapq.heappop(totals)
+        shards[index].append(article_id)
+        heapq.heappush(totals, (total + sizes[article_id], index))
+    return [sorted(shard) for shard in shards]
+
+
+def get_shard_result_path(base: pathlib.Path, index: int, count: int) -> pathlib.Path:
+    """
+    Get path of the result of a shard.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        index (int): Position of the shard in the plan
+        count (int): Number of shards in the plan
+
+    Returns:
+        pathlib.Path: Path to the result file
+    """
+    return get_sidecar_path(base, SHARDS_NAME) / f"{count}_{index}.json"
+
+
+def get_merged_result_path(base: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the result merged from all shards.
+
+    The name differs from names of shard results, so a merge never replaces
+    the result of a single-shard run.
+
+    Args:
+        base (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the merged result file
+    """
+    return get_sidecar_path(base, SHARDS_NAME) / MERGED_NAME
+
+
+def collect_shard(
+    base: pathlib.Path, index: int, count: int, article_ids: Iterable[int]
+) -> ShardResult:
+    """
+    Collect corpus-level outputs from meta files of the shard articles.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        index (int): Position of the shard in the plan
+        count (int): Number of shards in the plan
+        article_ids (Iterable[int]): Ids of the shard articles
+
+    Returns:
+        ShardResult: Outputs of the shard
+    """
+    entries = build_manifest(base, load_manifest(base)).entries
+    serializer = get_serializer()
+    result = ShardResult(index, count, sorted(article_ids))
+    pos_frequencies: Counter = Counter()
+    for article_id in result.article_ids:
+        meta_path = entries[article_id].meta_path
+        if meta_path is None:
+            raise FileNotFoundError(f"Meta file of article {article_id} does not exist")
+        with open(meta_path, "rb") as meta_file:
+            meta = serializer.loads(meta_file.read())
+        pos_frequencies.update(meta.get("pos_frequencies") or {})
+        if meta.get("pattern_matches"):
+            result.pattern_matches[article_id] = meta["pattern_matches"]
+    result.pos_frequencies = dict(pos_frequencies)
+    return result
+
+
+def save_shard_result(
+    base: pathlib.Path, result: ShardResult, merged: bool = False
+) -> pathlib.Path:
+    """
+    Save the result of a shard, replacing the file atomically.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        result (ShardResult): Outputs of the shard
+        merged (bool): Whether the result is merged from all shards, see get_merged_result_path()
+
+    Returns:
+        pathlib.Path: Path to the result file
+    """
+    if merged:
+        path = get_merged_result_path(base)
+    else:
+        path = get_shard_result_path(base, result.index, result.count)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}")
+    with open(temp_path, "wb") as result_file:
+        result_file.write(get_serializer().dumps(asdict(result)))
+    os.replace(temp_path, path)
+    return path
+
+
+def load_shard_result(base: pathlib.Path, index: int, count: int) -> ShardResult | None:
+    """
+    Load the result of a shard.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        index (int): Position of the shard in the plan
+        count (int): Number of shards in the plan
+
+    Returns:
+        ShardResult | None: Outputs of the shard, None if the shard is not processed yet
+    """
+    try:
+        with open(get_shard_result_path(base, index, count), "rb") as result_file:
+            content = get_serializer().loads(result_file.read())
+    except FileNotFoundError:
+        return None
+    content["pattern_matches"] = {
+        int(article_id): matches for article_id, matches in content["pattern_matches"].items()
+    }
+    return ShardResult(**content)
+
+
+def merge_shards(base: pathlib.Path, count: int, article_ids: Iterable[int]) -> ShardResult:
+    """
+    Combine results of all shards into the result of the whole corpus.
+
+    The merged result is saved apart from shard results, see get_merged_result_path().
+
+    Args:
+        base (pathlib.Path): Dataset root
+        count (int): Number of shards in the plan
+        article_ids (Iterable[int]): Ids of all articles of the corpus
+
+    Returns:
+        ShardResult: Outputs of the whole corpus
+    """
+    results = {}
+    for index in range(count):
+        result = load_shard_result(base, index, count)
+        if result is not None:
+            results[index] = result
+    missing_shards = [index for index in range(count) if index not in results]
+    if missing_shards:
+        raise IncompleteShardsError(f"Shards are not processed: {missing_shards}")
+
+    merged = ShardResult(0, 1)
+    pos_frequencies: Counter = Counter()
+    for result in results.values():
+        merged.article_ids.extend(result.article_ids)
+        pos_frequencies.update(result.pos_frequencies)
+        merged.pattern_matches.update(result.pattern_matches)
+    merged.article_ids.sort()
+    merged.pos_frequencies = dict(pos_frequencies)
+
+    expected = sorted(article_ids)
+    if merged.article_ids != expected:
+        counts = Counter(merged.article_ids)
+        duplicated = sorted(article_id for article_id, seen in counts.items() if seen > 1)
+        missing = sorted(set(expected) - counts.keys())
+        unexpected = sorted(counts.keys() - set(expected))
+        raise IncompleteShardsError(
+            f"Shards do not cover the corpus: missing {missing}, "
+            f"processed twice {duplicated}, unknown {unexpected}"
+        )
+    save_shard_result(base, merged, merged=True)
+    return merged
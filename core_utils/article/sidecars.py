@@ -0,0 +1,52 @@
+"""
+Files derived from a dataset, e.g. its manifest and indexes.
+"""
+
+import hashlib
+import pathlib
+import shutil
+
+from core_utils.constants import SIDECARS_PATH
+
+
+def get_sidecar_dir(dataset_path: pathlib.Path) -> pathlib.Path:
+    """
+    Get directory of files derived from the dataset.
+
+    Derived files are kept out of the dataset directory, so listing the
+    dataset gives article files only. Directories of datasets with the same
+    name are told apart by the hash of the dataset path.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Directory of derived files, not created yet
+    """
+    resolved = dataset_path.resolve()
+    digest = hashlib.blake2b(str(resolved).encode("utf-8"), digest_size=4).hexdigest()
+    return SIDECARS_PATH / f"{resolved.name}_{digest}"
+
+
+def get_sidecar_path(dataset_path: pathlib.Path, name: str) -> pathlib.Path:
+    """
+    Get path of a file derived from the dataset.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+        name (str): Name of the file or directory
+
+    Returns:
+        pathlib.Path: Path within the directory of derived files
+    """
+    return get_sidecar_dir(dataset_path) / name
+
+
+def remove_sidecars(dataset_path: pathlib.Path) -> None:
+    """
+    Remove all files derived from the dataset.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+    """
+    shutil.rmtree(get_sidecar_dir(dataset_path), ignore_errors=True)
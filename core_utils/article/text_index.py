@@ -0,0 +1,493 @@
+"""
+Inverted full-text index over cleaned texts of articles.
+"""
+
+import pathlib
+import sqlite3
+import zlib
+from array import array
+from collections import defaultdict
+from itertools import accumulate, chain
+from operator import sub
+from typing import Iterable, Optional
+
+from core_utils.article.article import Article, clean_text
+from core_utils.article.sidecars import get_sidecar_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (id INTEGER PRIMARY KEY, segment INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    segment INTEGER NOT NULL,
+    ids BLOB NOT NULL,
+    counts BLOB NOT NULL,
+    positions BLOB NOT NULL,
+    PRIMARY KEY (term, segment)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_segment ON postings (segment);
+CREATE TABLE IF NOT EXISTS removed (
+    id INTEGER NOT NULL,
+    segment INTEGER NOT NULL,
+    PRIMARY KEY (id, segment)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS raw_files (
+    id INTEGER PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+"""
+
+#: Name of the index among files derived from the dataset
+INDEX_NAME = "text_index.sqlite"
+
+#: Compression level of postings, favours indexing speed
+ZLIB_LEVEL = 1
+
+#: Size, modification time and content hash of a raw text nothing is known about
+UNKNOWN_STATE = (-1, -1, "")
+
+#: Number of articles in a segment, bounds memory taken by postings built at once
+SEGMENT_SIZE = 1000
+
+#: Number of segments above which all of them are merged into one
+MAX_SEGMENTS = 16
+
+
+def get_text_index_path(dataset_path: pathlib.Path) -> pathlib.Path:
+    """
+    Get path of the full-text index for the dataset.
+
+    Args:
+        dataset_path (pathlib.Path): Dataset root
+
+    Returns:
+        pathlib.Path: Path to the index database
+    """
+    return get_sidecar_path(dataset_path, INDEX_NAME)
+
+
+def _deltas(values: list[int]) -> Iterable[int]:
+    """
+    Get differences between neighbouring integers.
+
+    Args:
+        values (list[int]): Ascending integers
+
+    Returns:
+        Iterable[int]: The first integer followed by the differences
+    """
+    return map(sub, values, [0, *values[:-1]])
+
+
+def _pack(values: Iterable[int]) -> bytes:
+    """
+    Compress a sequence of non-negative integers.
+
+    Args:
+        values (Iterable[int]): Integers
+
+    Returns:
+        bytes: Compressed integers
+    """
+    return zlib.compress(array("I", values).tobytes(), ZLIB_LEVEL)
+
+
+def _unpack(blob: bytes, delta: bool = True) -> array:
+    """
+    Decompress a sequence of integers.
+
+    Args:
+        blob (bytes): Compressed integers
+        delta (bool): Whether differences between neighbours were stored
+
+    Returns:
+        array: Integers
+    """
+    unpacked = array("I")
+    unpacked.frombytes(zlib.decompress(blob))
+    return array("I", accumulate(unpacked)) if delta else unpacked
+
+
+def _pack_postings(by_id: dict[int, list[int]]) -> tuple[bytes, bytes, bytes]:
+    """
+    Compress postings of a term.
+
+    Args:
+        by_id (dict[int, list[int]]): Positions of the term by ascending article id
+
+    Returns:
+        tuple[bytes, bytes, bytes]: Compressed article ids, term counts and positions
+    """
+    return (
+        _pack(_deltas(list(by_id))),
+        _pack(map(len, by_id.values())),
+        _pack(chain.from_iterable(by_id.values())),
+    )
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into index terms.
+
+    Args:
+        text (str): Text to split
+
+    Returns:
+        list[str]: Terms in the order of occurrence
+    """
+    return clean_text(text).split()
+
+
+class InvertedIndex:
+    """
+    Positional inverted index stored in SQLite.
+
+    Every SEGMENT_SIZE added articles become a new segment with zlib-compressed
+    postings: delta-encoded article ids, term counts and positions of the term
+    in each article. Adding articles does not rewrite existing segments until
+    there are more than MAX_SEGMENTS of them, then all segments are merged into
+    one, see merge(). Removed articles are skipped in their old segments until
+    the segments are merged or every article of a segment is removed and the
+    segment is dropped.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """
+        Initialize an instance of the InvertedIndex class.
+
+        Args:
+            path (pathlib.Path): Path to the index database
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "InvertedIndex":
+        """
+        Enter the runtime context.
+
+        Returns:
+            InvertedIndex: The index itself
+        """
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """
+        Close the database on exit from the runtime context.
+
+        Args:
+            *args (object): Exception details
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Commit changes and close the database.
+        """
+        self._connection.commit()
+        self._connection.close()
+
+    def get_ids(self) -> set[int]:
+        """
+        Get ids of indexed articles.
+
+        Returns:
+            set[int]: Article ids
+        """
+        return {row[0] for row in self._connection.execute("SELECT id FROM documents")}
+
+    def get_raw_states(self) -> dict[int, tuple[int, int, str]]:
+        """
+        Get states of raw texts the indexed articles were read from.
+
+        Returns:
+            dict[int, tuple[int, int, str]]: Size, modification time and content hash
+                by article id, unknown for articles indexed without them
+        """
+        return {
+            article_id: (size, mtime_ns, digest)
+            for article_id, size, mtime_ns, digest in self._connection.execute(
+                "SELECT id, COALESCE(size, -1), COALESCE(mtime_ns, -1), COALESCE(hash, '') "
+                "FROM documents LEFT JOIN raw_files USING (id)"
+            )
+        }
+
+    def update_raw_states(self, raw_states: dict[int, tuple[int, int, str]]) -> None:
+        """
+        Record new states of raw texts whose content did not change, e.g. touched ones.
+
+        Args:
+            raw_states (dict[int, tuple[int, int, str]]): Size, modification time
+                and content hash of raw texts by article id
+        """
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO raw_files (id, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                [(article_id, *state) for article_id, state in raw_states.items()],
+            )
+
+    def add(
+        self,
+        articles: Iterable[Article],
+        raw_states: Optional[dict[int, tuple[int, int, str]]] = None,
+    ) -> int:
+        """
+        Index articles as new segments, skipping already indexed ones.
+
+        Args:
+            articles (Iterable[Article]): Articles to index
+            raw_states (Optional[dict[int, tuple[int, int, str]]]): Size, modification time
+                and content hash of raw texts by article id
+
+        Returns:
+            int: Number of indexed articles
+        """
+        raw_states = raw_states or {}
+        indexed = self.get_ids()
+        added = 0
+        documents: dict[int, list[str]] = {}
+        for article in articles:
+            if article.article_id in indexed or article.article_id in documents:
+                continue
+            documents[article.article_id] = tokenize(article.text)
+            if len(documents) >= SEGMENT_SIZE:
+                added += self._add_segment(documents, raw_states)
+                indexed.update(documents)
+                documents = {}
+        added += self._add_segment(documents, raw_states)
+        if self._count_segments() > MAX_SEGMENTS:
+            self.merge()
+        return added
+
+    def _get_next_segment(self) -> int:
+        """
+        Get number of a segment that is not used yet.
+
+        Returns:
+            int: Segment number
+        """
+        return int(
+            self._connection.execute(
+                "SELECT MAX((SELECT COALESCE(MAX(segment), 0) FROM documents), "
+                "(SELECT COALESCE(MAX(segment), 0) FROM removed)) + 1"
+            ).fetchone()[0]
+        )
+
+    def _count_segments(self) -> int:
+        """
+        Get number of segments with indexed articles.
+
+        Returns:
+            int: Number of segments
+        """
+        return int(
+            self._connection.execute("SELECT COUNT(DISTINCT segment) FROM documents").fetchone()[0]
+        )
+
+    def _add_segment(
+        self, documents: dict[int, list[str]], raw_states: dict[int, tuple[int, int, str]]
+    ) -> int:
+        """
+        Store terms of articles as a new segment.
+
+        Args:
+            documents (dict[int, list[str]]): Terms of articles by article id
+            raw_states (dict[int, tuple[int, int, str]]): Size, modification time
+                and content hash of raw texts by article id
+
+        Returns:
+            int: Number of indexed articles
+        """
+        if not documents:
+            return 0
+
+        postings: defaultdict[str, dict[int, list[int]]] = defaultdict(dict)
+        for article_id in sorted(documents):
+            for position, term in enumerate(documents[article_id]):
+                postings[term].setdefault(article_id, []).append(position)
+
+        segment = self._get_next_segment()
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO documents (id, segment) VALUES (?, ?)",
+                [(article_id, segment) for article_id in documents],
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO raw_files (id, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                [
+                    (article_id, *raw_states.get(article_id, UNKNOWN_STATE))
+                    for article_id in documents
+                ],
+            )
+            self._connection.executemany(
+                "INSERT INTO postings (term, segment, ids, counts, positions) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(term, segment, *_pack_postings(by_id)) for term, by_id in postings.items()],
+            )
+        return len(documents)
+
+    def merge(self) -> None:
+        """
+        Merge all segments into one, dropping postings of removed articles.
+
+        Postings are merged term by term, so only the postings of one term
+        are kept in memory at once.
+        """
+        removed = self._get_removed()
+        segment = self._get_next_segment()
+        terms = [row[0] for row in self._connection.execute("SELECT DISTINCT term FROM postings")]
+        with self._connection:
+            for term in terms:
+                by_id = self._get_positions(term, removed)
+                if by_id:
+                    self._connection.execute(
+                        "INSERT INTO postings (term, segment, ids, counts, positions) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (term, segment, *_pack_postings(dict(sorted(by_id.items())))),
+                    )
+            self._connection.execute("DELETE FROM postings WHERE segment != ?", (segment,))
+            self._connection.execute("UPDATE documents SET segment = ?", (segment,))
+            self._connection.execute("DELETE FROM removed")
+
+    def remove(self, article_ids: Iterable[int]) -> None:
+        """
+        Remove articles from the index, e.g. to add their changed texts again.
+
+        Args:
+            article_ids (Iterable[int]): Ids of articles to remove
+        """
+        rows = [(article_id,) for article_id in article_ids]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO removed (id, segment) "
+                "SELECT id, segment FROM documents WHERE id = ?",
+                rows,
+            )
+            self._connection.executemany("DELETE FROM documents WHERE id = ?", rows)
+            self._connection.executemany("DELETE FROM raw_files WHERE id = ?", rows)
+            emptied = [
+                row
+                for row in self._connection.execute("SELECT DISTINCT segment FROM removed")
+                if self._connection.execute(
+                    "SELECT 1 FROM documents WHERE segment = ? LIMIT 1", row
+                ).fetchone()
+                is None
+            ]
+            self._connection.executemany("DELETE FROM postings WHERE segment = ?", emptied)
+            self._connection.executemany("DELETE FROM removed WHERE segment = ?", emptied)
+
+    def _get_removed(self) -> set[tuple[int, int]]:
+        """
+        Get removed articles whose segments are still kept.
+
+        Returns:
+            set[tuple[int, int]]: Pairs of article id and segment
+        """
+        return set(self._connection.execute("SELECT id, segment FROM removed"))
+
+    def _get_ids(self, term: str, removed: set[tuple[int, int]]) -> set[int]:
+        """
+        Collect ids of articles containing the term from all segments.
+
+        Args:
+            term (str): Index term
+            removed (set[tuple[int, int]]): Removed articles with their segments, see _get_removed()
+
+        Returns:
+            set[int]: Article ids
+        """
+        ids: set[int] = set()
+        for segment, blob in self._connection.execute(
+            "SELECT segment, ids FROM postings WHERE term = ?", (term,)
+        ):
+            ids.update(
+                article_id for article_id in _unpack(blob) if (article_id, segment) not in removed
+            )
+        return ids
+
+    def _get_positions(self, term: str, removed: set[tuple[int, int]]) -> dict[int, list[int]]:
+        """
+        Collect positions of the term from all segments.
+
+        Args:
+            term (str): Index term
+            removed (set[tuple[int, int]]): Removed articles with their segments, see _get_removed()
+
+        Returns:
+            dict[int, list[int]]: Positions of the term by article id
+        """
+        postings: dict[int, list[int]] = {}
+        for segment, ids, counts, positions in self._connection.execute(
+            "SELECT segment, ids, counts, positions FROM postings WHERE term = ?", (term,)
+        ):
+            unpacked = _unpack(positions, delta=False)
+            start = 0
+            for article_id, count in zip(_unpack(ids), _unpack(counts, delta=False)):
+                if (article_id, segment) not in removed:
+                    postings[article_id] = unpacked[start : start + count].tolist()
+                start += count
+        return postings
+
+    def _search_terms(self, terms: set[str], removed: set[tuple[int, int]]) -> set[int]:
+        """
+        Find articles containing all the terms.
+
+        Args:
+            terms (set[str]): Index terms
+            removed (set[tuple[int, int]]): Removed articles with their segments, see _get_removed()
+
+        Returns:
+            set[int]: Ids of matching articles
+        """
+        found: set[int] | None = None
+        for term in terms:
+            ids = self._get_ids(term, removed)
+            found = ids if found is None else found & ids
+            if not found:
+                return set()
+        return found or set()
+
+    def search(self, query: str) -> set[int]:
+        """
+        Find articles containing all terms of the query.
+
+        Args:
+            query (str): Space separated terms
+
+        Returns:
+            set[int]: Ids of matching articles
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return set()
+        return self._search_terms(terms, self._get_removed())
+
+    def search_phrase(self, phrase: str) -> set[int]:
+        """
+        Find articles containing the terms of the phrase in a row.
+
+        Args:
+            phrase (str): Phrase to search
+
+        Returns:
+            set[int]: Ids of matching articles
+        """
+        terms = tokenize(phrase)
+        if not terms:
+            return set()
+        removed = self._get_removed()
+        candidates = self._search_terms(set(terms), removed)
+        if len(terms) < 2 or not candidates:
+            return candidates
+
+        starts: dict[int, set[int]] = {}
+        for offset, term in enumerate(terms):
+            postings = self._get_positions(term, removed)
+            for article_id in list(candidates):
+                shifted = {position - offset for position in postings[article_id]}
+                starts[article_id] = starts[article_id] & shifted if offset else shifted
+                if not starts[article_id]:
+                    candidates.discard(article_id)
+        return candidates
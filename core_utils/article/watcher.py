@@ -0,0 +1,413 @@
+"""
+Following a dataset while articles are being written to it.
+"""
+
+# pylint: disable=too-many-instance-attributes
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import pathlib
+import select
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from core_utils.article.article import Article
+from core_utils.article.codecs import strip_codec_suffix
+from core_utils.article.io import from_meta, from_raw
+from core_utils.article.layout import is_shard_dir, is_shard_name, iter_dataset_entries
+from core_utils.article.manifest import is_article_file, META_SUFFIX, RAW_SUFFIX
+
+#: File was closed after writing
+IN_CLOSE_WRITE = 0x00000008
+
+#: File was moved into the watched directory, e.g. by an atomic rename
+IN_MOVED_TO = 0x00000080
+
+#: File or directory was created in the watched directory
+IN_CREATE = 0x00000100
+
+#: Events were dropped because the kernel queue was full
+IN_Q_OVERFLOW = 0x00004000
+
+#: Watch was removed, e.g. because its directory was deleted
+IN_IGNORED = 0x00008000
+
+#: Event refers to a directory
+IN_ISDIR = 0x40000000
+
+#: Events the watcher subscribes to
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+#: Files found when watching starts that were modified this recently may still be written,
+#: they are complete only once their size and modification time stay unchanged for a poll
+SETTLE_DELAY_NS = 1_000_000_000
+
+#: Header of an inotify event: watch descriptor, mask, cookie and name length
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify:
+    """
+    Minimal ctypes binding of the Linux inotify API.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the Inotify class.
+        """
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.descriptor = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.descriptor < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._directories: dict[int, str] = {}
+
+    def add_watch(self, directory: str) -> None:
+        """
+        Start watching a directory.
+
+        Args:
+            directory (str): Path to the directory
+        """
+        watch = self._libc.inotify_add_watch(self.descriptor, os.fsencode(directory), WATCH_MASK)
+        if watch < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+        self._directories[watch] = directory
+
+    def read(self, timeout: float) -> list[tuple[str, str, int]]:
+        """
+        Wait for events.
+
+        Args:
+            timeout (float): Maximal number of seconds to wait
+
+        Returns:
+            list[tuple[str, str, int]]: Directory, file name and mask of every event
+        """
+        ready, _, _ = select.select([self.descriptor], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.descriptor, 65536)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset < len(data):
+            watch, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0").decode("utf-8")
+            offset += length
+            if mask & IN_IGNORED:
+                # the descriptor may be reused by a watch added later
+                self._directories.pop(watch, None)
+                continue
+            events.append((self._directories.get(watch, ""), name, mask))
+        return events
+
+    def close(self) -> None:
+        """
+        Stop watching.
+        """
+        os.close(self.descriptor)
+
+
+class CorpusWatcher:
+    """
+    Iterator over articles that appear in the dataset.
+
+    An article is yielded once both its raw text and its meta file are
+    completely written. On Linux completion is signalled by inotify: a file is
+    complete when its writer closes it or when it is renamed into place, as
+    GroupCommitWriter does. Elsewhere, or if inotify is unavailable, the
+    dataset is polled and a file is complete once its size and modification
+    time stay unchanged between two polls. Files present when watching starts
+    are considered complete if they were not modified for SETTLE_DELAY_NS,
+    others once they are closed, renamed into place or stay unchanged for a poll.
+
+    If the dataset root is removed and created again, e.g. by prepare_environment,
+    the watcher starts over in the new root: articles of the removed dataset
+    are forgotten, so articles with the same ids are yielded again.
+
+    The watcher supports both blocking and asynchronous iteration.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path: pathlib.Path,
+        storage: Optional[dict[int, Article]] = None,
+        poll_interval: float = 0.5,
+        idle_timeout: Optional[float] = None,
+        use_inotify: bool = True,
+    ) -> None:
+        """
+        Initialize an instance of the CorpusWatcher class.
+
+        Args:
+            path (pathlib.Path): Dataset root
+            storage (Optional[dict[int, Article]]): Known articles, new ones are added to it
+            poll_interval (float): Seconds between polls or inotify wake-ups
+            idle_timeout (Optional[float]): Seconds without new articles before
+                iteration stops, None to follow the dataset until stop() is called
+            use_inotify (bool): Whether to use inotify when it is available
+        """
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._storage = storage if storage is not None else {}
+        self._poll_interval = poll_interval
+        self._idle_timeout = idle_timeout
+        self._raw: dict[int, str] = {}
+        self._meta: dict[int, str] = {}
+        self._ready: deque[Article] = deque()
+        self._observed: dict[str, tuple[int, int]] = {}
+        self._unsettled: set[str] = set()
+        self._stopped = threading.Event()
+        self._last_article = time.monotonic()
+        self._root: Optional[int] = None
+        self._open_root()
+
+        self._inotify: Optional[Inotify] = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self._inotify = Inotify()
+            except OSError:
+                self._inotify = None
+        self._scan(str(self.path), watch=self._inotify is not None)
+
+    @property
+    def uses_inotify(self) -> bool:
+        """
+        Check whether the watcher is driven by inotify.
+
+        Returns:
+            bool: True for inotify, False for polling
+        """
+        return self._inotify is not None
+
+    def _open_root(self) -> None:
+        """
+        Keep the dataset root open, so a root created in its place never gets its inode.
+        """
+        if os.name != "nt":
+            self._root = os.open(self.path, os.O_RDONLY)
+
+    def _follow_root(self) -> bool:
+        """
+        Start over if the dataset root was removed and created again.
+
+        Returns:
+            bool: Whether the dataset root exists
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        if self._root is None or os.path.samestat(os.fstat(self._root), stat):
+            return True
+
+        os.close(self._root)
+        self._open_root()
+        self._raw.clear()
+        self._meta.clear()
+        self._observed.clear()
+        self._unsettled.clear()
+        self._ready.clear()
+        self._storage.clear()
+        if self._inotify is not None:
+            # watches of the removed directories are gone with them
+            self._scan(str(self.path), watch=True)
+        return True
+
+    def _scan(self, directory: str, watch: bool) -> None:
+        """
+        Register complete files of a directory and its shards.
+
+        Args:
+            directory (str): Path to the directory
+            watch (bool): Whether to add inotify watches for the directories
+        """
+        if watch and self._inotify:
+            # the watch is added before listing, so no file is missed in between
+            self._inotify.add_watch(directory)
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if is_shard_dir(entry):
+                    self._scan(entry.path, watch)
+                elif entry.is_file() and is_article_file(entry.name):
+                    stat = entry.stat()
+                    self._observed[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                    if stat.st_size and stat.st_mtime_ns < time.time_ns() - SETTLE_DELAY_NS:
+                        self._complete(entry.path)
+                    else:
+                        self._unsettled.add(entry.path)
+
+    def _settle(self) -> None:
+        """
+        Register files found by a scan once they stay unchanged since the previous poll.
+        """
+        for path in list(self._unsettled):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                self._unsettled.discard(path)
+                continue
+            state = (stat.st_size, stat.st_mtime_ns)
+            if self._observed.get(path) == state and stat.st_size:
+                self._complete(path)
+            self._observed[path] = state
+
+    def _complete(self, path: str) -> None:
+        """
+        Register a completely written file, loading the article once both its files are there.
+
+        Args:
+            path (str): Path to the file
+        """
+        self._unsettled.discard(path)
+        name = os.path.basename(path)
+        try:
+            article_id = int(name.split("_")[0])
+        except ValueError:
+            # not an article file of the dataset, e.g. "draft_raw.txt"
+            return
+        if article_id in self._storage:
+            return
+        if name.endswith(META_SUFFIX):
+            self._meta[article_id] = path
+        elif strip_codec_suffix(name).endswith(RAW_SUFFIX):
+            self._raw[article_id] = path
+        if article_id not in self._raw or article_id not in self._meta:
+            return
+
+        try:
+            article = from_meta(self._meta[article_id])
+        except ValueError:
+            # meta file is still being written, wait for the next event
+            return
+        from_raw(self._raw[article_id], article)
+        del self._raw[article_id], self._meta[article_id]
+        self._storage[article_id] = article
+        self._ready.append(article)
+        self._last_article = time.monotonic()
+
+    def _poll(self, timeout: float) -> None:
+        """
+        Wait for changes of the dataset and register completed files.
+
+        Args:
+            timeout (float): Maximal number of seconds to wait
+        """
+        if self._inotify is None:
+            if self._stopped.wait(timeout) or not self._follow_root():
+                return
+            try:
+                for entry in iter_dataset_entries(self.path):
+                    if not is_article_file(entry.name):
+                        continue
+                    stat = entry.stat()
+                    state = (stat.st_size, stat.st_mtime_ns)
+                    if self._observed.get(entry.path) == state and stat.st_size:
+                        self._complete(entry.path)
+                    self._observed[entry.path] = state
+            except FileNotFoundError:
+                # the dataset is being removed, the next poll sees what replaces it
+                pass
+            return
+
+        for directory, name, mask in self._inotify.read(timeout):
+            if mask & IN_Q_OVERFLOW:
+                self._scan(str(self.path), watch=False)
+            elif mask & IN_ISDIR:
+                path = os.path.join(directory, name)
+                if is_shard_name(name) and os.path.isdir(path):
+                    self._scan(path, watch=True)
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO) and is_article_file(name):
+                self._complete(os.path.join(directory, name))
+        self._settle()
+        self._follow_root()
+
+    def _next(self) -> Optional[Article]:
+        """
+        Wait for the next complete article.
+
+        Returns:
+            Optional[Article]: Article, None once the watcher is stopped or idle for too long
+        """
+        while not self._ready:
+            if self._stopped.is_set():
+                return None
+            timeout = self._poll_interval
+            if self._idle_timeout is not None:
+                left = self._last_article + self._idle_timeout - time.monotonic()
+                if left <= 0:
+                    return None
+                timeout = min(timeout, left)
+            self._poll(timeout)
+        return self._ready.popleft()
+
+    def __iter__(self) -> "CorpusWatcher":
+        """
+        Get the blocking iterator.
+
+        Returns:
+            CorpusWatcher: The watcher itself
+        """
+        return self
+
+    def __next__(self) -> Article:
+        """
+        Wait for the next complete article.
+
+        Returns:
+            Article: Article with meta information and raw text
+        """
+        article = self._next()
+        if article is None:
+            self.close()
+            raise StopIteration
+        return article
+
+    def __aiter__(self) -> "CorpusWatcher":
+        """
+        Get the asynchronous iterator.
+
+        Returns:
+            CorpusWatcher: The watcher itself
+        """
+        return self
+
+    async def __anext__(self) -> Article:
+        """
+        Wait for the next complete article without blocking the event loop.
+
+        Returns:
+            Article: Article with meta information and raw text
+        """
+        article = await asyncio.to_thread(self._next)
+        if article is None:
+            self.close()
+            raise StopAsyncIteration
+        return article
+
+    def stop(self) -> None:
+        """
+        Stop iteration once the articles found so far are consumed, safe to call from any thread.
+        """
+        self._stopped.set()
+
+    def close(self) -> None:
+        """
+        Stop iteration and release the inotify descriptor.
+        """
+        self._stopped.set()
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+        if self._root is not None:
+            os.close(self._root)
+            self._root = None
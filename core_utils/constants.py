@@ -6,6 +6,10 @@ from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 ASSETS_PATH = PROJECT_ROOT / "tmp" / "articles"
+# number of hash-derived directory levels for article files, 0 keeps the flat layout
+ASSETS_SHARD_DEPTH = 0
+# files derived from datasets, such as manifests and indexes, one directory per dataset
+SIDECARS_PATH = PROJECT_ROOT / "tmp" / "sidecars"
 CRAWLER_CONFIG_PATH = PROJECT_ROOT / "lab_5_scraper" / "scraper_config.json"
 PROJECT_CONFIG_PATH = PROJECT_ROOT / "project_config.json"
 
@@ -0,0 +1,129 @@
+"""
+Process-wide registry of loaded analyzer models.
+"""
+
+import json
+import os
+import pathlib
+import threading
+import weakref
+from typing import Any, Callable, Hashable, TypeVar
+
+_Model = TypeVar("_Model")
+
+#: Registries of the process, their locks are replaced in forked children
+_REGISTRIES: "weakref.WeakSet[ModelRegistry]" = weakref.WeakSet()
+
+
+def get_model_key(path: pathlib.Path, config: dict) -> tuple[str, str]:
+    """
+    Get registry key of a model.
+
+    Args:
+        path (pathlib.Path): Path to the model
+        config (dict): Configuration the model is set up with
+
+    Returns:
+        tuple[str, str]: Resolved model path and canonical configuration
+    """
+    return str(path.resolve()), json.dumps(config, sort_keys=True)
+
+
+class ModelRegistry:
+    """
+    Models loaded at most once per process.
+
+    Models are loaded on the first request. Processes forked afterwards
+    inherit loaded models and share their memory with the parent until it is
+    written to, so workers should be forked after preload().
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the ModelRegistry class.
+        """
+        self._models: dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        #: Number of models loaded by this process
+        self.loads = 0
+        _REGISTRIES.add(self)
+
+    def reset_locks(self) -> None:
+        """
+        Replace locks in a forked child, they may be held by threads that do not exist there.
+        """
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.loads = 0
+
+    def get(self, key: Hashable, loader: Callable[[], _Model]) -> _Model:
+        """
+        Get a model, loading it if no thread has done it yet.
+
+        Threads requesting a model being loaded wait for it, while other
+        models can be loaded at the same time.
+
+        Args:
+            key (Hashable): Model key, see get_model_key()
+            loader (Callable[[], _Model]): Function loading the model
+
+        Returns:
+            _Model: Loaded model
+        """
+        model = self._models.get(key)
+        if model is not None:
+            return model  # type: ignore[no-any-return]
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            model = self._models.get(key)
+            if model is None:
+                model = loader()
+                self._models[key] = model
+                self.loads += 1
+        return model  # type: ignore[no-any-return]
+
+    def preload(self, key: Hashable, loader: Callable[[], Any]) -> None:
+        """
+        Load a model before forking workers, so they share it.
+
+        Args:
+            key (Hashable): Model key, see get_model_key()
+            loader (Callable[[], Any]): Function loading the model
+        """
+        self.get(key, loader)
+
+    def is_loaded(self, key: Hashable) -> bool:
+        """
+        Check whether a model is loaded.
+
+        Args:
+            key (Hashable): Model key
+
+        Returns:
+            bool: True if the model is loaded
+        """
+        return key in self._models
+
+    def clear(self) -> None:
+        """
+        Forget all loaded models.
+        """
+        with self._lock:
+            self._models.clear()
+            self._key_locks.clear()
+
+
+def _reset_after_fork() -> None:
+    """
+    Replace locks of all registries in a forked child.
+    """
+    for registry in _REGISTRIES:
+        registry.reset_locks()
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+#: Registry shared by all analyzers of the process
+MODEL_REGISTRY = ModelRegistry()
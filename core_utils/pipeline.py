@@ -3,10 +3,15 @@ Interface definitions for text processing pipelines.
 """
 
 # pylint: disable=too-few-public-methods, unused-argument
+import itertools
+import sys
+import threading
+from array import array
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Iterable, Iterator, Protocol, Sequence
 
-from core_utils.article.article import Article
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.sentences import SentenceView
 
 
 class PipelineProtocol(Protocol):
@@ -38,7 +43,7 @@ class CoNLLUDocument(UDPipeDocument, StanzaDocument, Protocol):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ConLLUWord:
     """
     Interface definition for word class of unified analyzer document.
@@ -51,7 +56,7 @@ class ConLLUWord:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ConLLUSentence:
     """
     Interface definition for sentence class of unified analyzer document.
@@ -60,7 +65,7 @@ class ConLLUSentence:
     words: list[ConLLUWord]
 
 
-@dataclass
+@dataclass(slots=True)
 class UnifiedCoNLLUDocument:
     """
     Interface definition for sentence class of unified analyzer document.
@@ -69,6 +74,248 @@ class UnifiedCoNLLUDocument:
     sentences: list[ConLLUSentence]
 
 
+#: Head stored for words without syntactic annotation
+NO_HEAD = -1
+
+#: Array type code of token ids and heads, 4 byte integers
+INDEX_TYPE = "i"
+
+#: Array type code of offsets into columns and string buffers, 8 byte integers
+OFFSET_TYPE = "q"
+
+#: Array type code of vocabulary codes of parts of speech and relations, 2 byte integers
+CODE_TYPE = "H"
+
+
+class TagVocabulary:
+    """
+    Tags coded by small integers, e.g. parts of speech and dependency relations.
+
+    Every tag is stored once, so decoded tags of all words are the same
+    string objects. New tags are added under a lock, so a vocabulary is
+    shared by threads safely, decoding takes no lock.
+    """
+
+    def __init__(self, tags: Iterable[str] = ()) -> None:
+        """
+        Initialize an instance of the TagVocabulary class.
+
+        Args:
+            tags (Iterable[str]): Tags to code first, their codes do not depend on the data
+        """
+        self.tags: list[str] = []
+        self._codes: dict[str, int] = {}
+        self._lock = threading.Lock()
+        for tag in tags:
+            self.encode(tag)
+
+    def encode(self, tag: str) -> int:
+        """
+        Get the code of a tag, adding the tag if it is new.
+
+        Args:
+            tag (str): Tag
+
+        Returns:
+            int: Code
+        """
+        code = self._codes.get(tag)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(tag)
+                if code is None:
+                    # the tag is stored before its code is published, so decode() finds it
+                    self.tags.append(sys.intern(tag))
+                    code = self._codes[tag] = len(self.tags) - 1
+        return code
+
+    def decode(self, code: int) -> str:
+        """
+        Get the tag of a code.
+
+        Args:
+            code (int): Code
+
+        Returns:
+            str: Tag
+        """
+        return self.tags[code]
+
+    def __getstate__(self) -> list[str]:
+        """
+        Get the state for pickling without the lock.
+
+        Returns:
+            list[str]: Tags in the order of their codes
+        """
+        return self.tags
+
+    def __setstate__(self, state: list[str]) -> None:
+        """
+        Restore the vocabulary from a pickled state.
+
+        Args:
+            state (list[str]): Tags in the order of their codes, see __getstate__()
+        """
+        self.tags = [sys.intern(tag) for tag in state]
+        self._codes = {tag: code for code, tag in enumerate(self.tags)}
+        self._lock = threading.Lock()
+
+
+#: Vocabulary of compact sentences, seeded with the universal parts of speech
+TAG_VOCABULARY = TagVocabulary(
+    "ADJ ADP ADV AUX CCONJ DET INTJ NOUN NUM PART PRON PROPN PUNCT SCONJ SYM VERB X".split()
+)
+
+
+@dataclass(slots=True)
+class CompactConLLUWord:
+    """
+    Word with integer id and head and shared tag strings.
+    """
+
+    id: int
+    upos: str
+    head: int
+    deprel: str
+    text: str
+
+    @classmethod
+    def from_word(cls, word: ConLLUWord) -> "CompactConLLUWord":
+        """
+        Create a compact copy of a word of a unified document.
+
+        Args:
+            word (ConLLUWord): Word
+
+        Returns:
+            CompactConLLUWord: Compact word
+        """
+        return cls(
+            id=int(word.id),
+            upos=sys.intern(word.upos),
+            head=int(word.head) if word.head.isdigit() else NO_HEAD,
+            deprel=sys.intern(word.deprel),
+            text=word.text,
+        )
+
+
+class CompactConLLUSentence:
+    """
+    Sentence storing its words in typed arrays.
+
+    Columns are laid out as in ConlluColumns: ids and heads are integer
+    arrays, tags are codes of TAG_VOCABULARY and word texts are concatenated
+    into one string. Words are created on access: one by one by indexing or
+    iterating over the sentence, all at once by the words attribute, as in
+    ConLLUSentence.
+    """
+
+    __slots__ = ("ids", "heads", "upos", "deprels", "_texts", "_text_offsets")
+
+    def __init__(self, words: Iterable[ConLLUWord | CompactConLLUWord]) -> None:
+        """
+        Initialize an instance of the CompactConLLUSentence class.
+
+        Args:
+            words (Iterable[ConLLUWord | CompactConLLUWord]): Words of the sentence
+        """
+        compact = [
+            word if isinstance(word, CompactConLLUWord) else CompactConLLUWord.from_word(word)
+            for word in words
+        ]
+        # arrays are created at once, so they take no spare room for appending
+        self.ids = array(INDEX_TYPE, [word.id for word in compact])
+        self.heads = array(INDEX_TYPE, [word.head for word in compact])
+        self.upos = array(CODE_TYPE, [TAG_VOCABULARY.encode(word.upos) for word in compact])
+        self.deprels = array(CODE_TYPE, [TAG_VOCABULARY.encode(word.deprel) for word in compact])
+        self._text_offsets = array(
+            OFFSET_TYPE, [0, *itertools.accumulate(len(word.text) for word in compact)]
+        )
+        self._texts = "".join(word.text for word in compact)
+
+    @property
+    def words(self) -> list[CompactConLLUWord]:
+        """
+        Get words of the sentence.
+
+        Every access creates a new list of word copies, index the sentence
+        or iterate over it to get single words.
+
+        Returns:
+            list[CompactConLLUWord]: Words in the order of the sentence
+        """
+        return list(self)
+
+    def __getitem__(self, index: int) -> CompactConLLUWord:
+        """
+        Get a word by its position in the sentence.
+
+        Args:
+            index (int): Position of the word, negative ones count from the end
+
+        Returns:
+            CompactConLLUWord: Copy of the word
+        """
+        position = range(len(self.ids))[index]
+        return CompactConLLUWord(
+            id=self.ids[position],
+            upos=TAG_VOCABULARY.decode(self.upos[position]),
+            head=self.heads[position],
+            deprel=TAG_VOCABULARY.decode(self.deprels[position]),
+            text=self._texts[self._text_offsets[position] : self._text_offsets[position + 1]],
+        )
+
+    def __iter__(self) -> Iterator[CompactConLLUWord]:
+        """
+        Iterate over words of the sentence.
+
+        Yields:
+            CompactConLLUWord: Copy of the next word
+        """
+        for index in range(len(self.ids)):
+            yield self[index]
+
+    def __len__(self) -> int:
+        """
+        Get the number of words.
+
+        Returns:
+            int: Number of words
+        """
+        return len(self.ids)
+
+    def __getstate__(self) -> tuple:
+        """
+        Get the state for pickling with tags instead of codes.
+
+        Codes depend on the order tags were met in, which differs between
+        processes.
+
+        Returns:
+            tuple: State of the sentence
+        """
+        return (
+            self.ids,
+            self.heads,
+            [TAG_VOCABULARY.decode(code) for code in self.upos],
+            [TAG_VOCABULARY.decode(code) for code in self.deprels],
+            self._texts,
+            self._text_offsets,
+        )
+
+    def __setstate__(self, state: tuple) -> None:
+        """
+        Restore the sentence from a pickled state.
+
+        Args:
+            state (tuple): State of the sentence, see __getstate__()
+        """
+        self.ids, self.heads, upos, deprels, self._texts, self._text_offsets = state
+        self.upos = array(CODE_TYPE, [TAG_VOCABULARY.encode(tag) for tag in upos])
+        self.deprels = array(CODE_TYPE, [TAG_VOCABULARY.encode(tag) for tag in deprels])
+
+
 class AbstractCoNLLUAnalyzer(Protocol):
     """
     Mock definition of library-specific entity.
@@ -104,6 +351,9 @@ class LibraryWrapper(Protocol):
 
     _analyzer: AbstractCoNLLUAnalyzer
 
+    #: Kind of artifacts written by to_conllu
+    artifact_type: ArtifactType
+
     def _bootstrap(self) -> AbstractCoNLLUAnalyzer:
         """
         Bootstrap analyzer with required models and settings.
@@ -112,12 +362,12 @@ class LibraryWrapper(Protocol):
             AbstractCoNLLUAnalyzer: Instance of analyzer.
         """
 
-    def analyze(self, texts: list[str]) -> list[CoNLLUDocument | str]:
+    def analyze(self, texts: Sequence[str | SentenceView]) -> list[CoNLLUDocument | str]:
         """
         Analyze given texts.
 
         Args:
-            texts (list[str]): Texts to analyze.
+            texts (Sequence[str | SentenceView]): Texts or sentence views to analyze.
 
         Returns:
             list[CoNLLUDocument | str]: Collection of processed documents.
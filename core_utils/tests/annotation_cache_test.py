@@ -0,0 +1,74 @@
+"""
+Tests for the persistent cache of analyzer markup.
+"""
+
+import shutil
+import unittest
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.annotation_cache import AnnotationCache, get_annotation_keys
+
+
+class AnnotationCacheTest(unittest.TestCase):
+    """
+    Class for testing AnnotationCache implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for AnnotationCacheTest class.
+        """
+        TEST_PATH.mkdir(exist_ok=True)
+        self.path = TEST_PATH / "annotations.sqlite"
+
+    @pytest.mark.core_utils
+    def test_keys_depend_on_text_and_model(self) -> None:
+        """
+        Ensure that keys change with the text, the model and the formatter config.
+        """
+        config = {"include_headers": True}
+        texts = ["Мама мыла раму.", "Папа"]
+        keys = get_annotation_keys(texts, "udpipe", "abc", config)
+        self.assertEqual(len(set(keys)), 2)
+        self.assertEqual(keys, get_annotation_keys(texts, "udpipe", "abc", dict(config)))
+        for analyzer, model_hash, other_config in (
+            ("udpipe", "abd", config),
+            ("stanza", "abc", config),
+            ("udpipe", "abc", {}),
+        ):
+            other_keys = get_annotation_keys(texts, analyzer, model_hash, other_config)
+            self.assertNotEqual(keys[0], other_keys[0])
+
+    @pytest.mark.core_utils
+    def test_markup_survives_reopening(self) -> None:
+        """
+        Ensure that stored markup is found after the cache is reopened.
+        """
+        with AnnotationCache(self.path) as cache:
+            cache.put_many({"a": "# text = Мама\n1\tМама\n", "b": "1\tраму\n"})
+        with AnnotationCache(self.path) as cache:
+            self.assertEqual(cache.get_many(["a", "c", "a"]), {"a": "# text = Мама\n1\tМама\n"})
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    @pytest.mark.core_utils
+    def test_least_recently_used_markup_is_evicted(self) -> None:
+        """
+        Ensure that the least recently used markup is removed once the cache is full.
+        """
+        markup = "1\tМама\tмама\tNOUN\n" * 10
+        with AnnotationCache(self.path) as cache:
+            cache.put_many({"a": markup})
+            cache.put_many({"b": markup})
+            cache.max_bytes = cache.get_size()
+            cache.get_many(["a"])
+            cache.put_many({"c": markup})
+            self.assertEqual(set(cache.get_many(["a", "b", "c"])), {"a", "c"})
+            self.assertLessEqual(cache.get_size(), cache.max_bytes)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for AnnotationCacheTest class.
+        """
+        shutil.rmtree(TEST_PATH)
@@ -0,0 +1,142 @@
+"""
+Tests for annotation of texts by a pool of worker processes.
+"""
+
+# pylint: disable=too-few-public-methods
+import os
+import pathlib
+import shutil
+import unittest
+from typing import Iterator
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.annotation_pool import AnnotationPool
+
+
+class FakeAnalyzer:
+    """
+    Analyzer marking texts with the process that annotated them.
+    """
+
+    def __init__(self, crash_flag: pathlib.Path | None = None) -> None:
+        """
+        Initialize an instance of the FakeAnalyzer class.
+
+        Args:
+            crash_flag (pathlib.Path | None): File created by the only crash of a worker
+        """
+        self._crash_flag = crash_flag
+        self.loads = 0
+        self.calls = 0
+
+    @property
+    def _analyzer(self) -> str:
+        """
+        Load the model.
+
+        Returns:
+            str: Model
+        """
+        self.loads += 1
+        return "model"
+
+    def analyze(self, texts: list[str]) -> list[str]:
+        """
+        Annotate texts, crashing the worker on the first batch with a crashing text.
+
+        Args:
+            texts (list[str]): Texts to analyze
+
+        Returns:
+            list[str]: Texts with the number of model loads by the worker
+                and the size of the batch
+        """
+        if self._crash_flag and "crash" in texts and not self._crash_flag.exists():
+            self._crash_flag.touch()
+            os._exit(1)  # pylint: disable=protected-access
+        return [f"{text}\t{self.loads}\t{len(texts)}" for text in texts]
+
+
+class AnnotationPoolTest(unittest.TestCase):
+    """
+    Class for testing AnnotationPool implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for AnnotationPoolTest class.
+        """
+        TEST_PATH.mkdir(exist_ok=True)
+
+    @pytest.mark.core_utils
+    def test_results_keep_order_of_texts(self) -> None:
+        """
+        Ensure that results follow the texts and every worker loads the model once.
+        """
+        texts = [f"Текст {index}" * (index % 7 + 1) for index in range(50)]
+        with AnnotationPool(FakeAnalyzer(), 3, 1) as pool:  # type: ignore[arg-type]
+            results = pool.analyze(texts)
+            self.assertEqual(pool.analyze(["Мама"]), ["Мама\t1\t1"])
+        self.assertEqual(results, [f"{text}\t1\t1" for text in texts])
+
+    @pytest.mark.core_utils
+    def test_texts_are_sent_in_batches(self) -> None:
+        """
+        Ensure that workers annotate texts in batches of the given size.
+        """
+        texts = [f"Текст {index}" for index in range(10)]
+        with AnnotationPool(FakeAnalyzer(), 2, 4) as pool:  # type: ignore[arg-type]
+            results = pool.analyze(texts)
+        self.assertEqual([result.split("\t")[0] for result in results], texts)
+        self.assertEqual(
+            sorted(int(result.split("\t")[2]) for result in results), [2] * 2 + [4] * 8
+        )
+
+    @pytest.mark.core_utils
+    def test_imap_keeps_order_of_windows(self) -> None:
+        """
+        Ensure that imap() yields markup window by window, submitting the next window first.
+        """
+        windows = [[f"Окно {window} текст {index}" for index in range(5)] for window in range(4)]
+        consumed: list[int] = []
+
+        def iter_windows() -> Iterator[list[str]]:
+            for number, window in enumerate(windows):
+                consumed.append(number)
+                yield window
+
+        with AnnotationPool(FakeAnalyzer(), 2, 2) as pool:  # type: ignore[arg-type]
+            for number, results in enumerate(pool.imap(iter_windows())):
+                self.assertEqual(consumed[-1], min(number + 1, len(windows) - 1))
+                self.assertEqual([result.split("\t")[0] for result in results], windows[number])
+
+    @pytest.mark.core_utils
+    def test_crashed_worker_is_retried(self) -> None:
+        """
+        Ensure that texts are annotated again once a crashed worker is replaced.
+        """
+        analyzer = FakeAnalyzer(TEST_PATH / "crashed")
+        with AnnotationPool(analyzer, 2, 1) as pool:  # type: ignore[arg-type]
+            results = pool.analyze(["Мама", "crash", "мыла раму"])
+            self.assertEqual(pool.restarts, 1)
+        self.assertEqual(results, ["Мама\t1\t1", "crash\t1\t1", "мыла раму\t1\t1"])
+
+    @pytest.mark.core_utils
+    def test_crash_restarts_pool_once_for_queued_windows(self) -> None:
+        """
+        Ensure that batches of the queued window broken by a crash are submitted again.
+        """
+        analyzer = FakeAnalyzer(TEST_PATH / "crashed")
+        windows = [["Мама", "crash"], ["мыла", "раму"]]
+        with AnnotationPool(analyzer, 2, 1) as pool:  # type: ignore[arg-type]
+            results = list(pool.imap(windows))
+            self.assertEqual(pool.restarts, 1)
+        self.assertEqual(results, [[f"{text}\t1\t1" for text in window] for window in windows])
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for AnnotationPoolTest class.
+        """
+        shutil.rmtree(TEST_PATH)
@@ -18,7 +18,17 @@ from core_utils.article.article import (
     date_from_meta,
     get_article_id_from_filepath,
 )
-from core_utils.article.io import from_meta, from_raw, to_cleaned, to_meta, to_raw
+from core_utils.article.io import (
+    bulk_from_meta,
+    bulk_from_raw,
+    from_meta,
+    from_raw,
+    to_cleaned,
+    to_meta,
+    to_raw,
+)
+from core_utils.article.layout import iter_dataset_files
+from core_utils.article.serialization import get_serializer
 from core_utils.tests.utils import universal_setup
 
 
@@ -191,6 +201,26 @@ class ArticleTest(unittest.TestCase):
         with self.assertRaises(AttributeError):
             self.article.get_file_path(kind)
 
+    @pytest.mark.core_utils
+    def test_article_sharded_paths(self) -> None:
+        """
+        Ensure that all Article paths share the same shard directory.
+        """
+        article.ASSETS_SHARD_DEPTH = 2
+        try:
+            paths = (
+                self.article.get_raw_text_path(),
+                self.article.get_meta_file_path(),
+                self.article.get_file_path(ArtifactType.CLEANED),
+            )
+            to_raw(self.article)
+        finally:
+            article.ASSETS_SHARD_DEPTH = 0
+
+        self.assertEqual(len({path.parent for path in paths}), 1)
+        self.assertEqual(len(paths[0].relative_to(TEST_PATH).parts), 3)
+        self.assertIn(paths[0], list(iter_dataset_files(TEST_PATH)))
+
     # pylint: disable=protected-access
     @pytest.mark.core_utils
     def test_article_sets_pos_info(self) -> None:
@@ -272,6 +302,70 @@ class IOTest(unittest.TestCase):
         to_meta(self.article)
         self.assertTrue(self.article.get_meta_file_path().is_file(), error_msg)
 
+    @pytest.mark.core_utils
+    def test_compact_meta_file_is_loaded(self) -> None:
+        """
+        Ensure that compact metafile is loaded in the same way as the pretty one.
+        """
+        expected = from_meta(self.article.get_meta_file_path()).get_meta()
+        to_meta(from_meta(self.article.get_meta_file_path()), compact=True)
+        with open(self.article.get_meta_file_path(), encoding="utf-8") as file:
+            self.assertEqual(len(file.readlines()), 1)
+
+        for name in (None, "json"):
+            loaded = from_meta(self.article.get_meta_file_path(), serializer=get_serializer(name))
+            self.assertEqual(expected, loaded.get_meta())
+
+    @pytest.mark.core_utils
+    def test_bulk_from_meta_keeps_order(self) -> None:
+        """
+        Ensure that bulk_from_meta() loads articles in the order of given paths.
+        """
+        for article_id in (2, 3):
+            sample = from_meta(TEST_PATH / "1_meta.json")
+            sample.article_id = article_id
+            to_meta(sample)
+        paths = [TEST_PATH / f"{article_id}_meta.json" for article_id in (3, 1, 2)]
+        articles = bulk_from_meta(paths, max_workers=2)
+        self.assertEqual([loaded.article_id for loaded in articles], [3, 1, 2])
+        self.assertEqual(
+            [from_meta(path).get_meta() for path in paths],
+            [loaded.get_meta() for loaded in articles],
+        )
+
+    @pytest.mark.core_utils
+    def test_serializers_convert_non_string_keys(self) -> None:
+        """
+        Ensure that every available serializer writes integer keys as the json module does.
+        """
+        meta = {"id": 1, "pos_frequencies": {1: 2, "NOUN": 3}}
+        names = ["json"] + (["orjson"] if get_serializer().name == "orjson" else [])
+        for name in names:
+            serializer = get_serializer(name)
+            for compact in (False, True):
+                content = serializer.dumps(meta, compact=compact)
+                self.assertEqual(content, get_serializer("json").dumps(meta, compact=compact))
+                self.assertEqual(
+                    serializer.loads(content), {"id": 1, "pos_frequencies": {"1": 2, "NOUN": 3}}
+                )
+
+    @pytest.mark.core_utils
+    def test_bulk_from_raw_keeps_order(self) -> None:
+        """
+        Ensure that bulk_from_raw() loads texts in the order of given paths.
+        """
+        for article_id in (2, 3):
+            sample = Article(url=None, article_id=article_id)
+            sample.text = f"Текст {article_id}"
+            to_raw(sample)
+        paths = [TEST_PATH / f"{article_id}_raw.txt" for article_id in (3, 1, 2)]
+        for prefetch in (False, True):
+            articles = bulk_from_raw(paths, max_workers=2, prefetch=prefetch)
+            self.assertEqual([loaded.article_id for loaded in articles], [3, 1, 2])
+            self.assertEqual(
+                [loaded.text for loaded in articles], [from_raw(path).text for path in paths]
+            )
+
     def tearDown(self) -> None:
         """
         Define final instructions for IOTest class.
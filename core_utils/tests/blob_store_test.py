@@ -0,0 +1,79 @@
+"""
+Tests for the content-addressed store of artifacts.
+"""
+
+import shutil
+import unittest
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.blob_store import BlobStore, get_blob_store_path
+from core_utils.article.io import to_cleaned
+from core_utils.article.sidecars import remove_sidecars
+
+
+class BlobStoreTest(unittest.TestCase):
+    """
+    Class for testing BlobStore implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for BlobStoreTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+        self.store = BlobStore(get_blob_store_path(TEST_PATH))
+        self.articles = [Article(url=None, article_id=article_id) for article_id in (1, 2)]
+        for duplicate in self.articles:
+            duplicate.text = "Мама мыла раму."
+
+    @pytest.mark.core_utils
+    def test_duplicates_are_stored_once(self) -> None:
+        """
+        Ensure that identical artifacts of different articles share one blob.
+        """
+        for duplicate in self.articles:
+            to_cleaned(duplicate, writer=self.store)
+
+        paths = [duplicate.get_file_path(ArtifactType.CLEANED) for duplicate in self.articles]
+        self.assertTrue(paths[0].samefile(paths[1]))
+        self.assertEqual(paths[0].read_text(encoding="utf-8"), "мама мыла раму")
+        self.assertEqual(self.store.stats.dedup_ratio, 2.0)
+
+    @pytest.mark.core_utils
+    def test_unchanged_write_is_skipped(self) -> None:
+        """
+        Ensure that rewriting unchanged content does not touch the disk.
+        """
+        to_cleaned(self.articles[0], writer=self.store)
+        to_cleaned(self.articles[0], writer=self.store)
+        self.assertEqual(self.store.stats.skipped, 1)
+
+        self.articles[0].text = "Папа мыл раму."
+        to_cleaned(self.articles[0], writer=self.store)
+        path = self.articles[0].get_file_path(ArtifactType.CLEANED)
+        self.assertEqual(path.read_text(encoding="utf-8"), "папа мыл раму")
+
+    @pytest.mark.core_utils
+    def test_direct_write_keeps_blob_intact(self) -> None:
+        """
+        Ensure that writing without the store does not modify shared blobs.
+        """
+        for duplicate in self.articles:
+            to_cleaned(duplicate, writer=self.store)
+        self.articles[0].text = "Папа мыл раму."
+        to_cleaned(self.articles[0])
+
+        path = self.articles[1].get_file_path(ArtifactType.CLEANED)
+        self.assertEqual(path.read_text(encoding="utf-8"), "мама мыла раму")
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for BlobStoreTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
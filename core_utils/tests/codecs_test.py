@@ -0,0 +1,112 @@
+"""
+Tests for compression codecs of article artifacts.
+"""
+
+import gzip
+import shutil
+import unittest
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article, codecs
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.codecs import Codec, detect_codec, open_text_reader
+from core_utils.article.io import from_raw, open_artifact, open_artifact_writer, to_artifact, to_raw
+from core_utils.tests.utils import universal_setup
+
+
+class CodecsTest(unittest.TestCase):
+    """
+    Class for testing compressed artifacts.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CodecsTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        universal_setup()
+        self.article = from_raw(TEST_PATH / "1_raw.txt")
+        self.codecs = [Codec.PLAIN, Codec.GZIP]
+        if codecs.zstandard is not None:
+            self.codecs.append(Codec.ZSTD)
+
+    @pytest.mark.core_utils
+    def test_raw_text_round_trip(self) -> None:
+        """
+        Ensure that raw text saved with any codec is loaded unchanged.
+        """
+        for codec in self.codecs:
+            to_raw(self.article, codec)
+            stored = list(TEST_PATH.glob("1_raw.txt*"))
+            self.assertEqual(len(stored), 1, "Other variants of the artifact must be removed")
+            self.assertEqual(detect_codec(stored[0]), codec)
+            self.assertEqual(from_raw(stored[0]).text, self.article.text)
+
+    @pytest.mark.core_utils
+    def test_codec_is_detected_by_magic_bytes(self) -> None:
+        """
+        Ensure that compressed artifacts without codec suffix are readable.
+        """
+        for codec in self.codecs:
+            path = codecs.write_text(TEST_PATH / "2_raw.txt", self.article.text, codec)
+            path.rename(TEST_PATH / "2_raw.txt")
+            with open_text_reader(TEST_PATH / "2_raw.txt") as file:
+                self.assertEqual(file.read(), self.article.text)
+
+    @pytest.mark.core_utils
+    def test_conllu_artifact_is_streamed(self) -> None:
+        """
+        Ensure that compressed CONLL-U artifacts are read line by line.
+        """
+        conllu = "# sent_id = 1\n# text = Мама\n1\tМама\tмама\tNOUN\t_\t_\t0\troot\t_\t_\n\n"
+        self.article.set_conllu_info(conllu)
+        for codec in self.codecs:
+            to_artifact(self.article, ArtifactType.UDPIPE_CONLLU, codec)
+            with open_artifact(Article(url=None, article_id=1), ArtifactType.UDPIPE_CONLLU) as file:
+                self.assertEqual(list(file), conllu.splitlines(keepends=True))
+
+    @pytest.mark.core_utils
+    def test_conllu_artifact_is_written_by_blocks(self) -> None:
+        """
+        Ensure that an artifact written block by block is stored as if it were written whole.
+        """
+        blocks = ["# sent_id = 1\n1\tМама\n\n", "# sent_id = 2\n1\tПапа\n\n"]
+        self.article.set_conllu_info("".join(blocks))
+        path = self.article.get_file_path(ArtifactType.UDPIPE_CONLLU)
+        for codec in self.codecs:
+            to_artifact(self.article, ArtifactType.UDPIPE_CONLLU, codec)
+            with open_text_reader(codecs.resolve_artifact(path)) as file:
+                expected = file.read()
+            with open_artifact_writer(self.article, ArtifactType.UDPIPE_CONLLU, codec) as file:
+                for block in blocks:
+                    file.write(block)
+            self.assertEqual(len(list(path.parent.glob(f"{path.name}*"))), 1)
+            with open_artifact(self.article, ArtifactType.UDPIPE_CONLLU) as file:
+                self.assertEqual(file.read(), expected)
+
+    @pytest.mark.core_utils
+    def test_writers_keep_line_endings(self) -> None:
+        """
+        Ensure that every codec stores the same content, line endings included.
+        """
+        text = "Мама мыла раму.\r\nПапа читал.\n"
+        decompress = {Codec.PLAIN: bytes, Codec.GZIP: gzip.decompress}
+        if codecs.zstandard is not None:
+            decompress[Codec.ZSTD] = lambda data: (
+                codecs.zstandard.ZstdDecompressor().decompressobj().decompress(data)
+            )
+        for codec in self.codecs:
+            with codecs.open_text_writer(TEST_PATH / "2_cleaned.txt", codec) as file:
+                file.write(text)
+            stored = codecs.get_codec_path(TEST_PATH / "2_cleaned.txt", codec).read_bytes()
+            self.assertEqual(decompress[codec](stored), text.encode("utf-8"))
+            path = codecs.write_text(TEST_PATH / "2_cleaned.txt", text, codec)
+            self.assertEqual(decompress[codec](path.read_bytes()), text.encode("utf-8"))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CodecsTest class.
+        """
+        shutil.rmtree(TEST_PATH)
@@ -0,0 +1,105 @@
+"""
+Tests for the columnar export of the corpus.
+"""
+
+import datetime
+import unittest
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article.article import Article
+from core_utils.article.columns import ColumnStore, get_columns_path, get_date
+from core_utils.article.sidecars import remove_sidecars
+
+
+class ColumnStoreTest(unittest.TestCase):
+    """
+    Class for testing ColumnStore implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ColumnStoreTest class.
+        """
+        self.path = get_columns_path(TEST_PATH)
+        self.articles = []
+        for article_id in (1, 2):
+            sample = Article(url=f"https://example.com/{article_id}", article_id=article_id)
+            sample.title = f"Статья {article_id}"
+            sample.text = "Мама мыла раму." * article_id
+            sample.author = ["Красивая Мама"] * article_id
+            sample.topics = []
+            sample.pos_frequencies = {"NOUN": article_id}
+            self.articles.append(sample)
+        self.articles[0].date = datetime.datetime(1999, 11, 16, 12, 30)
+
+    @pytest.mark.core_utils
+    def test_columns_round_trip(self) -> None:
+        """
+        Ensure that stored columns are read back unchanged.
+        """
+        self.assertEqual(ColumnStore(self.path).append(self.articles), 2)
+
+        store = ColumnStore(self.path)
+        columns = store.load()
+        self.assertEqual(list(columns["id"]), [1, 2])
+        self.assertEqual(columns["url"], ["https://example.com/1", "https://example.com/2"])
+        self.assertEqual(columns["title"], ["Статья 1", "Статья 2"])
+        self.assertEqual(columns["author"], [["Красивая Мама"], ["Красивая Мама"] * 2])
+        self.assertEqual(columns["topics"], [[], []])
+        self.assertEqual(list(columns["pos.NOUN"]), [1, 2])
+        self.assertEqual(
+            [get_date(date) for date in columns["date"]],
+            [datetime.datetime(1999, 11, 16, 12, 30), None],
+        )
+        self.assertEqual(store.get_text(1), "Мама мыла раму.Мама мыла раму.")
+
+    @pytest.mark.core_utils
+    def test_append_new_ids(self) -> None:
+        """
+        Ensure that append skips stored ids and fills new frequency columns.
+        """
+        ColumnStore(self.path).append(self.articles[:1])
+        self.articles[1].pos_frequencies = {"VERB": 3}
+        self.assertEqual(ColumnStore(self.path).append(self.articles), 1)
+
+        store = ColumnStore(self.path)
+        columns = store.load()
+        self.assertEqual(store.rows, 2)
+        self.assertEqual(list(columns["pos.NOUN"]), [1, 0])
+        self.assertEqual(list(columns["pos.VERB"]), [0, 3])
+        self.assertEqual(columns["author"], [["Красивая Мама"], ["Красивая Мама"] * 2])
+        self.assertEqual(store.get_text(0), "Мама мыла раму.")
+
+    @pytest.mark.core_utils
+    def test_remove_keeps_other_rows(self) -> None:
+        """
+        Ensure that removed articles can be appended again and other rows are kept.
+        """
+        ColumnStore(self.path).append(self.articles, {1: (1, 1, "first"), 2: (2, 2, "second")})
+        self.articles[0].title = "Новый заголовок"
+
+        store = ColumnStore(self.path)
+        self.assertEqual(store.remove([1, 3]), 1)
+        self.assertEqual(store.get_meta_states(), {2: (2, 2, "second")})
+        self.assertEqual(store.append(self.articles, {1: (3, 3, "changed")}), 1)
+
+        store = ColumnStore(self.path)
+        columns = store.load()
+        self.assertEqual(store.get_meta_states(), {1: (3, 3, "changed"), 2: (2, 2, "second")})
+        self.assertEqual(list(columns["id"]), [2, 1])
+        self.assertEqual(columns["title"], ["Статья 2", "Новый заголовок"])
+        self.assertEqual(columns["author"], [["Красивая Мама"] * 2, ["Красивая Мама"]])
+        self.assertEqual(list(columns["pos.NOUN"]), [2, 1])
+        self.assertEqual(
+            [get_date(date) for date in columns["date"]],
+            [None, datetime.datetime(1999, 11, 16, 12, 30)],
+        )
+        self.assertEqual(store.get_text(0), "Мама мыла раму.Мама мыла раму.")
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ColumnStoreTest class.
+        """
+        remove_sidecars(TEST_PATH)
@@ -0,0 +1,89 @@
+"""
+Tests for compact representations of unified document words and sentences.
+"""
+
+import pickle
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from core_utils.pipeline import (
+    CompactConLLUSentence,
+    CompactConLLUWord,
+    ConLLUWord,
+    NO_HEAD,
+    TagVocabulary,
+)
+
+
+class CompactConLLUSentenceTest(unittest.TestCase):
+    """
+    Class for testing CompactConLLUSentence implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CompactConLLUSentenceTest class.
+        """
+        self.words = [
+            ConLLUWord(id="1", upos="NOUN", head="2", deprel="nsubj", text="Мама"),
+            ConLLUWord(id="2", upos="VERB", head="0", deprel="ROOT", text="мыла"),
+            ConLLUWord(id="3", upos="NOUN", head="_", deprel="_", text="раму"),
+        ]
+
+    @pytest.mark.core_utils
+    def test_words_are_kept(self) -> None:
+        """
+        Ensure that words are stored with integer ids and heads and shared tags.
+        """
+        sentence = CompactConLLUSentence(self.words)
+        self.assertEqual(len(sentence), 3)
+        self.assertEqual(
+            sentence.words[0],
+            CompactConLLUWord(id=1, upos="NOUN", head=2, deprel="nsubj", text="Мама"),
+        )
+        self.assertEqual(sentence.words[2].head, NO_HEAD)
+        self.assertIs(sentence.words[0].upos, sentence.words[2].upos)
+        self.assertFalse(hasattr(sentence.words[0], "__dict__"))
+        self.assertEqual(CompactConLLUSentence(sentence.words).words, sentence.words)
+
+    @pytest.mark.core_utils
+    def test_words_are_accessed_one_by_one(self) -> None:
+        """
+        Ensure that indexing and iteration give the same words as the words attribute.
+        """
+        sentence = CompactConLLUSentence(self.words)
+        self.assertEqual(list(sentence), sentence.words)
+        self.assertEqual(sentence[1], sentence.words[1])
+        self.assertEqual(sentence[-1], sentence.words[2])
+        with self.assertRaises(IndexError):
+            sentence[3]  # pylint: disable=pointless-statement
+
+    @pytest.mark.core_utils
+    def test_pickled_sentence_keeps_tags(self) -> None:
+        """
+        Ensure that a sentence is pickled with tags, as codes differ between processes.
+        """
+        sentence = CompactConLLUSentence(self.words)
+        self.assertEqual(sentence.__getstate__()[3], ["nsubj", "ROOT", "_"])
+        restored = pickle.loads(pickle.dumps(sentence))
+        self.assertEqual(
+            [(word.upos, word.deprel) for word in restored.words],
+            [(word.upos, word.deprel) for word in self.words],
+        )
+
+    @pytest.mark.core_utils
+    def test_vocabulary_is_shared_by_threads(self) -> None:
+        """
+        Ensure that threads adding the same tags get one code per tag.
+        """
+        vocabulary = TagVocabulary()
+        tags = [f"TAG{number}" for number in range(200)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            codes = list(executor.map(lambda _: [vocabulary.encode(tag) for tag in tags], range(8)))
+        self.assertEqual(len(vocabulary.tags), len(tags))
+        self.assertTrue(all(thread_codes == codes[0] for thread_codes in codes))
+        self.assertEqual([vocabulary.decode(code) for code in codes[0]], tags)
+        restored = pickle.loads(pickle.dumps(vocabulary))
+        self.assertEqual(restored.encode("TAG5"), vocabulary.encode("TAG5"))
@@ -0,0 +1,84 @@
+"""
+Tests for the columnar CONLL-U reader.
+"""
+
+import shutil
+import unittest
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article.codecs import Codec, get_codec_path, write_text
+from core_utils.article.conllu import parse_conllu, read_conllu
+from core_utils.pipeline import ConLLUWord
+
+
+class ConlluReaderTest(unittest.TestCase):
+    """
+    Class for testing the columnar CONLL-U reader.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ConlluReaderTest class.
+        """
+        TEST_PATH.mkdir(exist_ok=True)
+        self.conllu = (
+            "# sent_id = 1\n"
+            "# text = Мама мыла раму.\n"
+            "1\tМама\tмама\tNOUN\t_\t_\t2\tnsubj\t_\t_\n"
+            "2\tмыла\tмыть\tVERB\t_\t_\t0\tROOT\t_\t_\n"
+            "3\tраму\tрама\tNOUN\t_\t_\t2\tobj\t_\tSpaceAfter=No\n"
+            "4\t.\t.\tPUNCT\t_\t_\t2\tpunct\t_\t_\n"
+            "\n"
+            "# sent_id = 2\n"
+            "# text = Ура\n"
+            "1-2\tУра\t_\t_\t_\t_\t_\t_\t_\t_\n"
+            "1\tУ\tу\tINTJ\t_\t_\t0\tROOT\t_\t_\n"
+            "1.1\tра\tра\tX\t_\t_\t_\t_\t_\t_\n"
+            "2\tра\tра\tINTJ\t_\t_\t_\t_\t_\t_\n"
+            "\n"
+        )
+
+    @pytest.mark.core_utils
+    def test_words_match_markup(self) -> None:
+        """
+        Ensure that word views give the columns of the markup.
+        """
+        document = parse_conllu(self.conllu)
+        sentences = document.sentences
+        self.assertEqual([len(sentence.words) for sentence in sentences], [4, 2])
+        word = sentences[0].words[2]
+        self.assertIsInstance(word, ConLLUWord)
+        self.assertFalse(hasattr(word, "__dict__"))
+        self.assertFalse(hasattr(sentences[0], "__dict__"))
+        self.assertFalse(hasattr(document, "__dict__"))
+        self.assertEqual(
+            (word.id, word.upos, word.head, word.deprel, word.text),
+            ("3", "NOUN", "2", "obj", "раму"),
+        )
+        word = sentences[1].words[1]
+        self.assertEqual((word.text, word.lemma, word.head, word.deprel), ("ра", "ра", "_", "_"))
+        self.assertEqual(
+            document.get_pos_frequencies(), {"NOUN": 2, "VERB": 1, "PUNCT": 1, "INTJ": 2}
+        )
+
+    @pytest.mark.core_utils
+    def test_compressed_artifact_is_read(self) -> None:
+        """
+        Ensure that compressed artifacts are read into the same columns.
+        """
+        path = TEST_PATH / "1_udpipe_conllu.conllu"
+        write_text(path, self.conllu, Codec.GZIP)
+        document = read_conllu(get_codec_path(path, Codec.GZIP))
+        expected = parse_conllu(self.conllu)
+        self.assertEqual(
+            [sentence.words for sentence in document.sentences],
+            [sentence.words for sentence in expected.sentences],
+        )
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ConlluReaderTest class.
+        """
+        shutil.rmtree(TEST_PATH)
@@ -0,0 +1,60 @@
+"""
+Tests for date parsing.
+"""
+
+import datetime
+import unittest
+
+import pytest
+
+from core_utils.article.dates import parse_date, parse_iso_datetime, parse_russian_date
+
+
+class DatesTest(unittest.TestCase):
+    """
+    Class for testing date parsing functions.
+    """
+
+    @pytest.mark.core_utils
+    def test_parse_iso_datetime_matches_strptime(self) -> None:
+        """
+        Ensure that the fast path gives the same result as strptime.
+        """
+        for date_txt in ("2022-11-06 16:30:00", "1999-01-31 00:00:59", "2022-1-6 1:3:0"):
+            expected = datetime.datetime.strptime(date_txt, "%Y-%m-%d %H:%M:%S")
+            self.assertEqual(parse_iso_datetime(date_txt), expected)
+
+    @pytest.mark.core_utils
+    def test_parse_iso_datetime_rejects_malformed(self) -> None:
+        """
+        Ensure that malformed dates raise ValueError as strptime does.
+        """
+        for date_txt in ("2022-13-06 16:30:00", "2022-11-06T16:30:00", "06.11.2022"):
+            with self.assertRaises(ValueError):
+                parse_iso_datetime(date_txt)
+
+    @pytest.mark.core_utils
+    def test_parse_russian_date(self) -> None:
+        """
+        Ensure that dates with Russian month names are parsed.
+        """
+        expected = {
+            "16 мая 2025, 14:30": datetime.datetime(2025, 5, 16, 14, 30),
+            "1 января 2024 г.": datetime.datetime(2024, 1, 1),
+            "3 авг. 2023 в 09:05": datetime.datetime(2023, 8, 3, 9, 5),
+            "Опубликовано 7 Декабря 2022": datetime.datetime(2022, 12, 7),
+            "16.05.2025 14:30": datetime.datetime(2025, 5, 16, 14, 30),
+        }
+        for date_txt, date in expected.items():
+            self.assertEqual(parse_russian_date(date_txt), date)
+        with self.assertRaises(ValueError):
+            parse_russian_date("вчера")
+
+    @pytest.mark.core_utils
+    def test_parse_date_any_format(self) -> None:
+        """
+        Ensure that parse_date() handles every supported format.
+        """
+        expected = datetime.datetime(2025, 5, 16, 14, 30)
+        for date_txt in ("2025-05-16 14:30:00", "2025-05-16T14:30:00+03:00", " 16 мая 2025, 14:30"):
+            self.assertEqual(parse_date(date_txt), expected)
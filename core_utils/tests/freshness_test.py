@@ -0,0 +1,110 @@
+"""
+Tests for tracking freshness of article artifacts.
+"""
+
+import os
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.freshness import ArtifactState
+from core_utils.article.io import to_cleaned, to_raw
+from core_utils.article.manifest import build_manifest, load_manifest, save_manifest
+from core_utils.article.sidecars import remove_sidecars
+
+
+class ArtifactStateTest(unittest.TestCase):
+    """
+    Class for testing ArtifactState implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ArtifactStateTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+        self.kinds = [ArtifactType.CLEANED]
+        for article_id in (1, 2, 3):
+            sample = Article(url=None, article_id=article_id)
+            sample.text = f"Текст статьи {article_id}."
+            to_raw(sample)
+            to_cleaned(sample)
+
+    def record_all(self) -> None:
+        """
+        Record the current raw texts of all articles and save the state.
+        """
+        state = ArtifactState(TEST_PATH)
+        for article_id, entry in build_manifest(TEST_PATH).entries.items():
+            state.record(entry, article_id, self.kinds)
+        state.save()
+
+    def get_stale_ids(self) -> list[int]:
+        """
+        Get ids of articles with stale artifacts according to the saved state.
+
+        Returns:
+            list[int]: Article ids
+        """
+        state = ArtifactState(TEST_PATH)
+        return sorted(
+            article_id
+            for article_id, entry in build_manifest(TEST_PATH).entries.items()
+            if not state.is_fresh(entry, article_id, self.kinds)
+        )
+
+    @pytest.mark.core_utils
+    def test_unrecorded_artifacts_are_stale(self) -> None:
+        """
+        Ensure that artifacts are stale until they are recorded.
+        """
+        self.assertEqual(self.get_stale_ids(), [1, 2, 3])
+        self.record_all()
+        self.assertEqual(self.get_stale_ids(), [])
+
+    @pytest.mark.core_utils
+    def test_changed_raw_texts_and_missing_artifacts_are_stale(self) -> None:
+        """
+        Ensure that changed raw texts and removed artifacts are detected, touched texts are not.
+        """
+        self.record_all()
+        sample = Article(url=None, article_id=1)
+        sample.text = "Новый текст статьи."
+        to_raw(sample)
+        os.utime(sample.get_raw_text_path().with_name("2_raw.txt"), ns=(1, 1))
+        sample.article_id = 3
+        sample.get_file_path(ArtifactType.CLEANED).unlink()
+        self.assertEqual(self.get_stale_ids(), [1, 3])
+
+    @pytest.mark.core_utils
+    def test_raw_texts_edited_in_place_are_stale(self) -> None:
+        """
+        Ensure that a raw text rewritten in place is detected with a cached manifest.
+        """
+        self.record_all()
+        save_manifest(TEST_PATH, build_manifest(TEST_PATH))
+        path = Article(url=None, article_id=2).get_raw_text_path()
+        with open(path, "w", encoding="utf-8") as raw_file:
+            raw_file.write("Текст статьи два.")
+        state = ArtifactState(TEST_PATH)
+        with mock.patch("core_utils.article.manifest.RACY_WINDOW_NS", 0):
+            entries = build_manifest(TEST_PATH, load_manifest(TEST_PATH)).entries
+        stale = [
+            article_id
+            for article_id, entry in entries.items()
+            if not state.is_fresh(entry, article_id, self.kinds)
+        ]
+        self.assertEqual(stale, [2])
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ArtifactStateTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
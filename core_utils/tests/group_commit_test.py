@@ -0,0 +1,178 @@
+"""
+Tests for the atomic group-commit writer of artifacts.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.codecs import Codec, get_codec_path
+from core_utils.article.group_commit import GroupCommitWriter, remove_uncommitted
+from core_utils.article.io import to_cleaned, to_meta
+from core_utils.constants import PROJECT_ROOT
+
+#: Child process rewriting files until it is killed
+CRASHING_WRITER = """
+import pathlib
+import sys
+
+from core_utils.article.group_commit import GroupCommitWriter
+
+base = pathlib.Path(sys.argv[1])
+writer = GroupCommitWriter(max_files=7, max_delay=60)
+generation = 1
+while True:
+    for index in range(20):
+        writer.write(base / f"{index}.txt", bytes([65 + generation % 26]) * (1000 + index))
+    generation += 1
+"""
+
+
+class GroupCommitWriterTest(unittest.TestCase):
+    """
+    Class for testing GroupCommitWriter implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for GroupCommitWriterTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+        self.article = Article(url="https://example.com", article_id=1)
+        self.article.text = "Мама мыла раму."
+
+    @pytest.mark.core_utils
+    def test_artifacts_appear_on_commit(self) -> None:
+        """
+        Ensure that artifacts are moved to their paths only on commit.
+        """
+        with GroupCommitWriter(max_delay=60) as writer:
+            to_cleaned(self.article, writer=writer)
+            to_meta(self.article, writer=writer)
+            cleaned_path = self.article.get_file_path(ArtifactType.CLEANED)
+            self.assertFalse(cleaned_path.exists())
+
+        self.assertEqual(cleaned_path.read_text(encoding="utf-8"), "мама мыла раму")
+        self.assertTrue(self.article.get_meta_file_path().exists())
+        self.assertEqual(writer.commits, 1)
+        self.assertEqual(remove_uncommitted(TEST_PATH), 0)
+
+    @pytest.mark.core_utils
+    def test_commit_triggers(self) -> None:
+        """
+        Ensure that commits happen by the number of files and by timer.
+        """
+        writer = GroupCommitWriter(max_files=2, max_delay=0.01)
+        writer.write(TEST_PATH / "1.txt", b"1")
+        writer.write(TEST_PATH / "2.txt", b"2")
+        self.assertEqual(writer.commits, 1)
+
+        writer.write(TEST_PATH / "3.txt", b"3")
+        deadline = time.monotonic() + 5
+        while writer.commits == 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual((TEST_PATH / "3.txt").read_bytes(), b"3")
+        writer.close()
+        self.assertEqual(writer.commits, 2)
+
+    @pytest.mark.core_utils
+    def test_rewrite_of_pending_artifact(self) -> None:
+        """
+        Ensure that rewriting a pending artifact keeps one temporary file with the new content.
+        """
+        with GroupCommitWriter(max_delay=60) as writer:
+            writer.write(TEST_PATH / "1.txt", b"old")
+            writer.write(TEST_PATH / "1.txt", b"new")
+            self.assertEqual(len(list(TEST_PATH.glob(".*"))), 1)
+
+        self.assertEqual((TEST_PATH / "1.txt").read_bytes(), b"new")
+        self.assertEqual(len(list(TEST_PATH.glob(".*"))), 0)
+
+    @pytest.mark.core_utils
+    def test_other_variants_are_removed_on_commit(self) -> None:
+        """
+        Ensure that a variant stored with another codec stays until the new one is committed.
+        """
+        to_cleaned(self.article)
+        cleaned_path = self.article.get_file_path(ArtifactType.CLEANED)
+        with GroupCommitWriter(max_delay=60) as writer:
+            to_cleaned(self.article, codec=Codec.GZIP, writer=writer)
+            self.assertTrue(cleaned_path.exists())
+
+        self.assertFalse(cleaned_path.exists())
+        self.assertTrue(get_codec_path(cleaned_path, Codec.GZIP).exists())
+
+    @pytest.mark.core_utils
+    def test_files_of_running_writer_are_kept(self) -> None:
+        """
+        Ensure that only temporary files untouched for a while are removed.
+        """
+        with GroupCommitWriter(max_delay=60) as writer:
+            writer.write(TEST_PATH / "1.txt", b"1")
+            writer.write(TEST_PATH / "2.txt", b"2")
+            stale = next(TEST_PATH.glob(".1.txt.*"))
+            os.utime(stale, (0, 0))
+            self.assertEqual(remove_uncommitted(TEST_PATH), 1)
+            self.assertFalse(stale.exists())
+            self.assertEqual(len(list(TEST_PATH.glob(".2.txt.*"))), 1)
+            writer.write(TEST_PATH / "1.txt", b"1")
+
+        self.assertEqual((TEST_PATH / "2.txt").read_bytes(), b"2")
+
+    @pytest.mark.core_utils
+    def test_background_commit_error_is_raised(self) -> None:
+        """
+        Ensure that a failed commit by timer is reported by the next write.
+        """
+        writer = GroupCommitWriter(max_delay=0.01)
+        with mock.patch("os.fsync", side_effect=OSError("disk failure")):
+            writer.write(TEST_PATH / "1.txt", b"1")
+            for thread in threading.enumerate():
+                if isinstance(thread, threading.Timer):
+                    thread.join(5)
+
+        with self.assertRaises(OSError):
+            writer.write(TEST_PATH / "2.txt", b"2")
+        writer.write(TEST_PATH / "3.txt", b"3")
+        writer.close()
+        self.assertFalse((TEST_PATH / "1.txt").exists())
+        self.assertEqual((TEST_PATH / "3.txt").read_bytes(), b"3")
+
+    @pytest.mark.core_utils
+    def test_crash_leaves_complete_files(self) -> None:
+        """
+        Ensure that a writer killed at any moment never leaves truncated artifacts.
+        """
+        for delay in (0.05, 0.1, 0.2, 0.3):
+            with subprocess.Popen(
+                [sys.executable, "-c", CRASHING_WRITER, str(TEST_PATH)], cwd=PROJECT_ROOT
+            ) as child:
+                time.sleep(delay)
+                child.kill()
+
+            for index in range(20):
+                path = TEST_PATH / f"{index}.txt"
+                if not path.exists():
+                    continue
+                content = path.read_bytes()
+                generation = content[:1]
+                self.assertEqual(content, generation * (1000 + index))
+            remove_uncommitted(TEST_PATH, max_age=0)
+            self.assertEqual(len(list(TEST_PATH.glob(".*"))), 0)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for GroupCommitWriterTest class.
+        """
+        shutil.rmtree(TEST_PATH)
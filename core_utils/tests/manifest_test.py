@@ -0,0 +1,152 @@
+"""
+Tests for the manifest of dataset files.
+"""
+
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article
+from core_utils.article.codecs import Codec
+from core_utils.article.io import to_meta, to_raw
+from core_utils.article.manifest import (
+    build_manifest,
+    get_manifest_path,
+    load_manifest,
+    save_manifest,
+)
+from core_utils.article.sidecars import remove_sidecars
+
+
+class ManifestTest(unittest.TestCase):
+    """
+    Class for testing build_manifest implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ManifestTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+
+    @pytest.mark.core_utils
+    def test_manifest_collects_sharded_files(self) -> None:
+        """
+        Ensure that raw and meta files are collected from shards with their sizes.
+        """
+        with mock.patch.object(article, "ASSETS_SHARD_DEPTH", 1):
+            for article_id in (1, 2):
+                sample = Article(url=None, article_id=article_id)
+                sample.text = "Мама мыла раму." * article_id
+                to_raw(sample, Codec.GZIP if article_id == 2 else Codec.PLAIN)
+                to_meta(sample)
+        (TEST_PATH / "notes.md").write_text("", encoding="utf-8")
+
+        manifest = build_manifest(TEST_PATH)
+        self.assertFalse(manifest.is_empty)
+        self.assertEqual((manifest.raw_count, manifest.meta_count), (2, 2))
+        self.assertEqual(sorted(manifest.get_raw_ids()), [1, 2])
+        self.assertEqual(sorted(manifest.get_meta_ids()), [1, 2])
+        self.assertTrue(manifest.entries[2].raw_path.endswith("2_raw.txt.gz"))
+        self.assertEqual(manifest.entries[1].raw_size, len("Мама мыла раму.".encode("utf-8")))
+
+    @pytest.mark.core_utils
+    def test_shard_depth_of_dataset(self) -> None:
+        """
+        Ensure that the shard depth is taken from the dataset and mixed layouts are reported.
+        """
+        self.assertEqual(build_manifest(TEST_PATH).get_shard_depth(), 0)
+        sample = Article(url=None, article_id=1)
+        with mock.patch.object(article, "ASSETS_SHARD_DEPTH", 2):
+            to_meta(sample)
+        self.assertEqual(build_manifest(TEST_PATH).get_shard_depth(), 2)
+
+        with mock.patch.object(article, "ASSETS_SHARD_DEPTH", 0):
+            to_raw(sample)
+        with self.assertRaises(ValueError):
+            build_manifest(TEST_PATH).get_shard_depth()
+
+    @pytest.mark.core_utils
+    def test_manifest_of_empty_directory(self) -> None:
+        """
+        Ensure that an empty dataset root is reported.
+        """
+        manifest = build_manifest(TEST_PATH)
+        self.assertTrue(manifest.is_empty)
+        self.assertEqual(manifest.entries, {})
+
+    @pytest.mark.core_utils
+    def test_cached_manifest_revalidates_changes(self) -> None:
+        """
+        Ensure that only changed directories are listed and hashes of changed files dropped.
+        """
+        with mock.patch.object(article, "ASSETS_SHARD_DEPTH", 1):
+            samples = []
+            for article_id in (1, 2):
+                sample = Article(url=None, article_id=article_id)
+                sample.text = "Мама мыла раму."
+                to_raw(sample)
+                samples.append(sample)
+            manifest = build_manifest(TEST_PATH)
+            self.assertEqual([files.raw_hash for files in manifest.entries.values()], ["", ""])
+            for files in manifest.entries.values():
+                files.get_raw_hash()
+            save_manifest(TEST_PATH, manifest)
+            self.assertTrue(get_manifest_path(TEST_PATH).exists())
+
+            with mock.patch("core_utils.article.manifest.RACY_WINDOW_NS", 0):
+                cached = build_manifest(TEST_PATH, load_manifest(TEST_PATH))
+                self.assertEqual(cached.listed, 0)
+                self.assertEqual(cached.entries, manifest.entries)
+
+                samples[0].text = "Папа мыл раму."
+                to_raw(samples[0])
+                changed = build_manifest(TEST_PATH, load_manifest(TEST_PATH))
+        self.assertEqual(changed.listed, 1)
+        self.assertEqual(changed.entries[1].raw_hash, "")
+        self.assertNotEqual(changed.entries[1].get_raw_hash(), manifest.entries[1].raw_hash)
+        self.assertEqual(changed.entries[2], manifest.entries[2])
+
+    @pytest.mark.core_utils
+    def test_recent_directories_are_listed(self) -> None:
+        """
+        Ensure that directories changed right before the save are listed again.
+        """
+        sample = Article(url=None, article_id=1)
+        sample.text = "Мама мыла раму."
+        to_raw(sample)
+        save_manifest(TEST_PATH, build_manifest(TEST_PATH))
+        cached = build_manifest(TEST_PATH, load_manifest(TEST_PATH))
+        self.assertEqual(cached.listed, 1)
+        self.assertFalse(cached.is_empty)
+
+    @pytest.mark.core_utils
+    def test_files_rewritten_in_place_are_detected(self) -> None:
+        """
+        Ensure that files of unchanged directories are stat-ed, e.g. after a truncation.
+        """
+        sample = Article(url=None, article_id=1)
+        sample.text = "Мама мыла раму."
+        to_raw(sample)
+        manifest = build_manifest(TEST_PATH)
+        manifest.entries[1].get_raw_hash()
+        save_manifest(TEST_PATH, manifest)
+        with open(sample.get_raw_text_path(), "w", encoding="utf-8"):
+            pass
+        with mock.patch("core_utils.article.manifest.RACY_WINDOW_NS", 0):
+            cached = build_manifest(TEST_PATH, load_manifest(TEST_PATH))
+        self.assertEqual(cached.listed, 0)
+        self.assertEqual(cached.entries[1].raw_size, 0)
+        self.assertEqual(cached.entries[1].raw_hash, "")
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ManifestTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
@@ -0,0 +1,130 @@
+"""
+Tests for the meta index of articles.
+"""
+
+import datetime
+import os
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.io import from_meta, to_meta
+from core_utils.article.manifest import build_manifest, hash_file
+from core_utils.article.meta_index import get_index_path, MetaIndex, rebuild_index
+from core_utils.article.sidecars import remove_sidecars
+from core_utils.tests.utils import universal_setup
+
+
+class MetaIndexTest(unittest.TestCase):
+    """
+    Class for testing MetaIndex implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for MetaIndexTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        universal_setup()
+        self.index_path = get_index_path(TEST_PATH)
+
+    @pytest.mark.core_utils
+    def test_rebuild_index_finds_article(self) -> None:
+        """
+        Ensure that the rebuilt index answers queries on every indexed field.
+        """
+        self.assertEqual(rebuild_index(TEST_PATH), 1)
+        with MetaIndex(self.index_path) as index:
+            self.assertEqual(index.find_ids(date=datetime.date(1999, 11, 16)), {1})
+            self.assertEqual(index.find_ids(date=datetime.date(1999, 11, 17)), set())
+            self.assertEqual(index.find_ids(author="Красивая Мама", url="test"), {1})
+            self.assertEqual(index.find_ids(pos="NOUN", min_frequency=6), {1})
+            self.assertEqual(index.find_ids(pos="NOUN", min_frequency=7), set())
+            self.assertEqual(index.find_ids(topic="политика"), set())
+
+    @pytest.mark.core_utils
+    def test_sync_picks_up_saved_meta_files(self) -> None:
+        """
+        Ensure that meta files saved by to_meta() are indexed by the next sync only.
+        """
+        rebuild_index(TEST_PATH)
+        loaded = from_meta(TEST_PATH / "1_meta.json")
+        loaded.article_id = 2
+        loaded.author = ["Новый Автор"]
+        loaded.topics = ["политика"]
+        to_meta(loaded)
+
+        with MetaIndex(self.index_path) as index:
+            self.assertEqual(index.find_ids(author="Новый Автор"), set())
+            self.assertEqual(index.sync(build_manifest(TEST_PATH)), 1)
+            self.assertEqual(index.find_ids(author="Новый Автор"), {2})
+            self.assertEqual(index.find_ids(topic="политика"), {2})
+            self.assertEqual(index.find_ids(pos="NOUN"), {1, 2})
+
+    @pytest.mark.core_utils
+    def test_to_meta_does_not_create_index(self) -> None:
+        """
+        Ensure that to_meta() does not build the index on its own.
+        """
+        to_meta(from_meta(TEST_PATH / "1_meta.json"))
+        self.assertFalse(self.index_path.exists())
+
+    @pytest.mark.core_utils
+    def test_sync_removes_articles_of_recreated_dataset(self) -> None:
+        """
+        Ensure that articles missing from a recreated dataset are removed from the index.
+        """
+        rebuild_index(TEST_PATH)
+        loaded = from_meta(TEST_PATH / "1_meta.json")
+        loaded.article_id = 2
+        to_meta(loaded)
+        shutil.rmtree(TEST_PATH)
+        universal_setup()
+
+        with MetaIndex(self.index_path) as index:
+            self.assertEqual(index.sync(build_manifest(TEST_PATH)), 0)
+            self.assertEqual(index.find_ids(pos="NOUN"), {1})
+
+    @pytest.mark.core_utils
+    def test_sync_reads_changed_meta_files(self) -> None:
+        """
+        Ensure that meta files changed bypassing to_meta() are indexed again.
+        """
+        rebuild_index(TEST_PATH)
+        meta_path = TEST_PATH / "1_meta.json"
+        meta_path.write_text(
+            meta_path.read_text(encoding="utf-8").replace("Красивая Мама", "Новый Автор"),
+            encoding="utf-8",
+        )
+
+        with MetaIndex(self.index_path) as index:
+            self.assertEqual(index.sync(build_manifest(TEST_PATH)), 1)
+            self.assertEqual(index.find_ids(author="Новый Автор"), {1})
+            self.assertEqual(index.sync(build_manifest(TEST_PATH)), 0)
+
+    @pytest.mark.core_utils
+    def test_sync_hashes_only_changed_meta_files(self) -> None:
+        """
+        Ensure that sync hashes meta files with a changed size or modification time only.
+        """
+        rebuild_index(TEST_PATH)
+        meta_path = TEST_PATH / "1_meta.json"
+        os.utime(meta_path, ns=(1, 1))
+
+        with MetaIndex(self.index_path) as index:
+            with mock.patch("core_utils.article.manifest.hash_file", wraps=hash_file) as hashed:
+                self.assertEqual(index.sync(build_manifest(TEST_PATH)), 0)
+                self.assertEqual(hashed.call_count, 1)
+                self.assertEqual(index.sync(build_manifest(TEST_PATH)), 0)
+                self.assertEqual(hashed.call_count, 1)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for MetaIndexTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
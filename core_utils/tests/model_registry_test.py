@@ -0,0 +1,77 @@
+"""
+Tests for the registry of loaded analyzer models.
+"""
+
+import multiprocessing
+import pathlib
+import threading
+import time
+import unittest
+
+import pytest
+
+from core_utils.model_registry import get_model_key, ModelRegistry
+
+#: Registry inherited by forked workers in the tests
+FORKED_REGISTRY = ModelRegistry()
+
+
+def count_loads_in_worker(key: tuple[str, str]) -> tuple[int, int]:
+    """
+    Get a model in a forked worker.
+
+    Args:
+        key (tuple[str, str]): Model key
+
+    Returns:
+        tuple[int, int]: Number of models loaded by the worker and id of the model
+    """
+    model = FORKED_REGISTRY.get(key, object)
+    return FORKED_REGISTRY.loads, id(model)
+
+
+class ModelRegistryTest(unittest.TestCase):
+    """
+    Class for testing ModelRegistry implementation.
+    """
+
+    @pytest.mark.core_utils
+    def test_model_is_loaded_once(self) -> None:
+        """
+        Ensure that concurrent requests of a model load it once and only when requested.
+        """
+        registry = ModelRegistry()
+        key = get_model_key(pathlib.Path("model.udpipe"), {"b": 1, "a": [2]})
+        self.assertEqual(key, get_model_key(pathlib.Path("model.udpipe"), {"a": [2], "b": 1}))
+        self.assertFalse(registry.is_loaded(key))
+
+        def load() -> object:
+            time.sleep(0.05)
+            return object()
+
+        models = []
+        threads = [
+            threading.Thread(target=lambda: models.append(registry.get(key, load)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(registry.loads, 1)
+        self.assertEqual(len({id(model) for model in models}), 1)
+        registry.get(get_model_key(pathlib.Path("model.udpipe"), {}), object)
+        self.assertEqual(registry.loads, 2)
+
+    @pytest.mark.core_utils
+    def test_forked_workers_share_preloaded_model(self) -> None:
+        """
+        Ensure that workers forked after preloading do not load the model again.
+        """
+        key = get_model_key(pathlib.Path("model.udpipe"), {})
+        FORKED_REGISTRY.preload(key, object)
+        model_id = id(FORKED_REGISTRY.get(key, object))
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            results = pool.map(count_loads_in_worker, [key] * 4)
+        self.assertEqual(results, [(0, model_id)] * 4)
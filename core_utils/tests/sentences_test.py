@@ -0,0 +1,128 @@
+"""
+Tests for sentence views.
+"""
+
+import re
+import unittest
+
+import pytest
+
+from core_utils.article.article import Article, split_by_sentence
+from core_utils.article.sentences import (
+    iter_sentences,
+    join_conllu_chunks,
+    SentenceView,
+    split_into_chunks,
+)
+
+
+class SentenceViewTest(unittest.TestCase):
+    """
+    Class for testing SentenceView implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for SentenceViewTest class.
+        """
+        self.text = (
+            "Мама мыла раму. Т.е. окно было чистым! Ура. "
+            "Вчера в г. Москве прошёл дождь? Да, прошёл."
+        )
+
+    @pytest.mark.core_utils
+    def test_views_match_split_by_sentence(self) -> None:
+        """
+        Ensure that views give the same sentences as split_by_sentence.
+        """
+        views = list(iter_sentences(self.text))
+        self.assertEqual([str(view) for view in views], split_by_sentence(self.text))
+        self.assertTrue(all(view.buffer is self.text for view in views))
+
+    @pytest.mark.core_utils
+    def test_line_breaks_end_sentences(self) -> None:
+        """
+        Ensure that a line break ends a sentence without adding characters.
+        """
+        sample = Article(url=None, article_id=1)
+        sample.text = "Первая строка текста\nвторая строка текста"
+        self.assertEqual(
+            list(sample.iter_sentences()), ["Первая строка текста", "вторая строка текста"]
+        )
+
+    @pytest.mark.core_utils
+    def test_search_inside_view(self) -> None:
+        """
+        Ensure that patterns are matched within the sentence bounds only.
+        """
+        first, second = list(iter_sentences(self.text))[:2]
+        pattern = re.compile(r"\w+л[ао]")
+        self.assertEqual([match[0] for match in first.finditer(pattern)], ["мыла"])
+        self.assertEqual(second.search(pattern)[0], "было")
+        self.assertIsNone(SentenceView(self.text, 0, 4).search(pattern))
+
+    @pytest.mark.core_utils
+    def test_conllu_sentences(self) -> None:
+        """
+        Ensure that CONLL-U information is split into sentence blocks.
+        """
+        sample = Article(url=None, article_id=1)
+        sample.set_conllu_info("# sent_id = 1\n1\tА\n\n# sent_id = 2\n1\tБ\n\n")
+        self.assertEqual(
+            list(sample.iter_conllu_sentences()), ["# sent_id = 1\n1\tА", "# sent_id = 2\n1\tБ"]
+        )
+
+    @pytest.mark.core_utils
+    def test_chunks_cover_text(self) -> None:
+        """
+        Ensure that chunks fit the limit and cover the whole text.
+        """
+        text = "А. С. Пушкин родился в г. Москве.\nОн писал | стихи.\n\nИ прозу."
+        for max_length in (10, 40, 1000):
+            chunks = split_into_chunks(text, max_length)
+            self.assertEqual("".join(chunks), text)
+            self.assertTrue(all(len(chunk) <= max_length for chunk in chunks))
+        self.assertEqual(
+            split_into_chunks(text, 40),
+            ["А. С. Пушкин родился в г. Москве.\n", "Он писал | стихи.\n\nИ прозу."],
+        )
+        self.assertEqual(
+            split_into_chunks(self.text, 40),
+            [
+                "Мама мыла раму. Т.е. окно было чистым! ",
+                "Ура. Вчера в г. Москве прошёл дождь? ",
+                "Да, прошёл.",
+            ],
+        )
+
+    @pytest.mark.core_utils
+    def test_long_lines_are_split(self) -> None:
+        """
+        Ensure that a line longer than the limit is split at sentences, then at spaces.
+        """
+        text = "А. С. Пушкин родился в г. Москве. Он писал стихи. " + "а" * 35 + " конец."
+        self.assertEqual(
+            split_into_chunks(text, 40),
+            [
+                "А. С. Пушкин родился в г. Москве. ",
+                "Он писал стихи. ",
+                "а" * 35 + " ",
+                "конец.",
+            ],
+        )
+        self.assertEqual(split_into_chunks("а" * 25, 10), ["а" * 10, "а" * 10, "а" * 5])
+
+    @pytest.mark.core_utils
+    def test_join_conllu_chunks(self) -> None:
+        """
+        Ensure that sentences of joined chunks are numbered through the whole text.
+        """
+        chunks = [
+            "# sent_id = 1\n1\tА\n\n# sent_id = 2\n1\tБ\n\n",
+            "\n",
+            "# sent_id = 1\n1\tВ\n\n",
+        ]
+        self.assertEqual(
+            join_conllu_chunks(chunks),
+            "# sent_id = 1\n1\tА\n\n# sent_id = 2\n1\tБ\n\n# sent_id = 3\n1\tВ\n\n",
+        )
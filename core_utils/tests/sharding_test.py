@@ -0,0 +1,120 @@
+"""
+Tests for splitting a dataset into shards and merging their results.
+"""
+
+import pathlib
+import shutil
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article
+from core_utils.article.io import to_meta, to_raw
+from core_utils.article.sharding import (
+    collect_shard,
+    get_merged_result_path,
+    get_shard_result_path,
+    IncompleteShardsError,
+    merge_shards,
+    plan_shards,
+    save_shard_result,
+    ShardStrategy,
+)
+from core_utils.article.sidecars import remove_sidecars
+
+
+def process_shard(base: pathlib.Path, index: int, count: int, article_ids: list[int]) -> None:
+    """
+    Save the result of a shard as a separate worker would.
+
+    Args:
+        base (pathlib.Path): Dataset root
+        index (int): Position of the shard in the plan
+        count (int): Number of shards in the plan
+        article_ids (list[int]): Ids of the shard articles
+    """
+    save_shard_result(base, collect_shard(base, index, count, article_ids))
+
+
+class ShardingTest(unittest.TestCase):
+    """
+    Class for testing plan_shards and merge_shards implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ShardingTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+
+    @pytest.mark.core_utils
+    def test_range_shards(self) -> None:
+        """
+        Ensure that range shards are contiguous and of the same size.
+        """
+        sizes = {article_id: 1 for article_id in range(1, 11)}
+        shards = plan_shards(sizes, 3)
+        self.assertEqual(shards, [[1, 2, 3], [4, 5, 6], [7, 8, 9, 10]])
+        self.assertEqual(plan_shards({1: 1}, 2), [[], [1]])
+        with self.assertRaises(ValueError):
+            plan_shards(sizes, 0)
+
+    @pytest.mark.core_utils
+    def test_balanced_shards(self) -> None:
+        """
+        Ensure that balanced shards cover every article once and have close total lengths.
+        """
+        sizes = {1: 100, 2: 10, 3: 10, 4: 10, 5: 90, 6: 10, 7: 30}
+        shards = plan_shards(sizes, 2, ShardStrategy.BALANCED)
+        self.assertEqual(sorted(sum(shards, [])), sorted(sizes))
+        totals = sorted(sum(sizes[article_id] for article_id in shard) for shard in shards)
+        self.assertEqual(totals, [130, 130])
+
+    @pytest.mark.core_utils
+    def test_merge_results_of_processes(self) -> None:
+        """
+        Ensure that results of shards processed by separate processes are combined.
+        """
+        for article_id in range(1, 7):
+            sample = Article(url=None, article_id=article_id)
+            sample.text = "Мама мыла раму."
+            sample.set_pos_info({"NOUN": article_id, "VERB": 1})
+            if article_id % 2:
+                sample.set_patterns_info({"VERB": [article_id]})
+            to_raw(sample)
+            to_meta(sample)
+
+        shards = plan_shards({article_id: 1 for article_id in range(1, 7)}, 3)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            for future in [
+                executor.submit(process_shard, TEST_PATH, index, 3, shard)
+                for index, shard in enumerate(shards[:2])
+            ]:
+                future.result()
+
+        with self.assertRaises(IncompleteShardsError):
+            merge_shards(TEST_PATH, 3, range(1, 7))
+        process_shard(TEST_PATH, 2, 3, shards[1])
+        with self.assertRaises(IncompleteShardsError):
+            merge_shards(TEST_PATH, 3, range(1, 7))
+
+        process_shard(TEST_PATH, 2, 3, shards[2])
+        merged = merge_shards(TEST_PATH, 3, range(1, 7))
+        self.assertEqual(merged.article_ids, list(range(1, 7)))
+        self.assertEqual(merged.pos_frequencies, {"NOUN": 21, "VERB": 6})
+        self.assertEqual(
+            merged.pattern_matches, {1: {"VERB": [1]}, 3: {"VERB": [3]}, 5: {"VERB": [5]}}
+        )
+        self.assertTrue(get_merged_result_path(TEST_PATH).exists())
+        self.assertFalse(get_shard_result_path(TEST_PATH, 0, 1).exists())
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ShardingTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
@@ -0,0 +1,141 @@
+"""
+Tests for the full-text index of articles.
+"""
+
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import text_index
+from core_utils.article.article import Article
+from core_utils.article.text_index import InvertedIndex
+
+
+class InvertedIndexTest(unittest.TestCase):
+    """
+    Class for testing InvertedIndex implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for InvertedIndexTest class.
+        """
+        TEST_PATH.mkdir(exist_ok=True)
+        self.index = InvertedIndex(TEST_PATH / "text_index.sqlite")
+        texts = ("Мама мыла раму.", "Рама мыла маму!", "Мама, мама, мыла раму красиво.")
+        self.articles = []
+        for article_id, text in enumerate(texts, start=1):
+            self.articles.append(Article(url=None, article_id=article_id))
+            self.articles[-1].text = text
+
+    @pytest.mark.core_utils
+    def test_search_finds_all_terms(self) -> None:
+        """
+        Ensure that search() finds articles containing every term of the query.
+        """
+        self.assertEqual(self.index.add(self.articles), 3)
+        self.assertEqual(self.index.search("мыла"), {1, 2, 3})
+        self.assertEqual(self.index.search("Мама раму"), {1, 3})
+        self.assertEqual(self.index.search("мама папа"), set())
+
+    @pytest.mark.core_utils
+    def test_search_phrase_respects_order(self) -> None:
+        """
+        Ensure that search_phrase() takes positions of terms into account.
+        """
+        self.index.add(self.articles)
+        self.assertEqual(self.index.search_phrase("мама мыла раму"), {1, 3})
+        self.assertEqual(self.index.search_phrase("раму мыла"), set())
+        self.assertEqual(self.index.search_phrase("мама мама"), {3})
+
+    @pytest.mark.core_utils
+    def test_articles_are_added_incrementally(self) -> None:
+        """
+        Ensure that new articles are added as a new segment and old ones are skipped.
+        """
+        self.index.add(self.articles[:1])
+        self.assertEqual(self.index.add(self.articles), 2)
+        self.assertEqual(self.index.get_ids(), {1, 2, 3})
+        self.assertEqual(self.index.search_phrase("мама мыла"), {1, 3})
+
+    @pytest.mark.core_utils
+    def test_changed_articles_are_indexed_again(self) -> None:
+        """
+        Ensure that removed articles are not found and can be added with a new text.
+        """
+        self.index.add(self.articles)
+        self.index.remove([1])
+        self.assertEqual(self.index.get_ids(), {2, 3})
+        self.assertEqual(self.index.search("мыла"), {2, 3})
+
+        self.articles[0].text = "Папа мыл раму."
+        self.assertEqual(self.index.add(self.articles[:1], {1: (14, 1, "changed")}), 1)
+        self.assertEqual(
+            self.index.get_raw_states(),
+            {1: (14, 1, "changed"), 2: (-1, -1, ""), 3: (-1, -1, "")},
+        )
+        self.assertEqual(self.index.search("папа"), {1})
+        self.assertEqual(self.index.search_phrase("мама мыла раму"), {3})
+
+    @pytest.mark.core_utils
+    def test_segment_is_dropped_with_its_last_article(self) -> None:
+        """
+        Ensure that postings of a segment are dropped once all its articles are removed.
+        """
+        self.index.add(self.articles[:1])
+        self.index.add(self.articles)
+        self.index.remove([1])
+        # pylint: disable=protected-access
+        count = self.index._connection.execute("SELECT COUNT(*) FROM postings WHERE segment = 1")
+        self.assertEqual(count.fetchone()[0], 0)
+        self.assertEqual(self.index.search("раму"), {3})
+
+    @pytest.mark.core_utils
+    def test_articles_are_split_into_segments(self) -> None:
+        """
+        Ensure that articles are indexed by segments of bounded size.
+        """
+        with mock.patch.object(text_index, "SEGMENT_SIZE", 2):
+            self.assertEqual(self.index.add(iter(self.articles)), 3)
+        # pylint: disable=protected-access
+        self.assertEqual(self.index._count_segments(), 2)
+        self.assertEqual(self.index.search_phrase("мама мыла раму"), {1, 3})
+
+    @pytest.mark.core_utils
+    def test_merge_drops_removed_articles(self) -> None:
+        """
+        Ensure that merged segments keep postings of indexed articles only.
+        """
+        for loaded in self.articles:
+            self.index.add([loaded])
+        self.index.remove([1])
+        self.index.merge()
+
+        # pylint: disable=protected-access
+        self.assertEqual(self.index._count_segments(), 1)
+        self.assertEqual(self.index._get_removed(), set())
+        self.assertEqual(self.index.search("мыла"), {2, 3})
+        self.assertEqual(self.index.search_phrase("мама мыла раму"), {3})
+        self.assertEqual(self.index.search_phrase("мыла маму"), {2})
+
+    @pytest.mark.core_utils
+    def test_segments_are_merged_above_the_limit(self) -> None:
+        """
+        Ensure that adding a segment above the limit merges all segments.
+        """
+        with mock.patch.object(text_index, "MAX_SEGMENTS", 2):
+            for loaded in self.articles:
+                self.index.add([loaded])
+        # pylint: disable=protected-access
+        self.assertEqual(self.index._count_segments(), 1)
+        self.assertEqual(self.index.search("мама"), {1, 3})
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for InvertedIndexTest class.
+        """
+        self.index.close()
+        shutil.rmtree(TEST_PATH)
@@ -0,0 +1,200 @@
+"""
+Tests for following a dataset while it is being written.
+"""
+
+import asyncio
+import shutil
+import threading
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article
+from core_utils.article.group_commit import GroupCommitWriter
+from core_utils.article.io import to_meta, to_raw
+from core_utils.article.watcher import CorpusWatcher
+
+
+def write_articles(article_ids: range, writer: GroupCommitWriter | None = None) -> None:
+    """
+    Write raw texts and meta files of articles.
+
+    Args:
+        article_ids (range): Ids of articles
+        writer (GroupCommitWriter | None): Writer to use, files are written directly by default
+    """
+    for article_id in article_ids:
+        sample = Article(url=f"https://example.com/{article_id}", article_id=article_id)
+        sample.text = f"Текст статьи {article_id}"
+        to_raw(sample, writer=writer)
+        to_meta(sample, writer=writer)
+
+
+class CorpusWatcherTest(unittest.TestCase):
+    """
+    Class for testing CorpusWatcher implementation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CorpusWatcherTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+
+    def check_following(self, use_inotify: bool) -> None:
+        """
+        Ensure that existing and new complete articles are yielded once.
+
+        Args:
+            use_inotify (bool): Whether to use inotify
+        """
+        write_articles(range(1, 3))
+        raw_only = Article(url=None, article_id=10)
+        raw_only.text = "Статья без метаинформации"
+        to_raw(raw_only)
+
+        storage: dict[int, Article] = {}
+        watcher = CorpusWatcher(
+            TEST_PATH, storage, poll_interval=0.05, idle_timeout=1, use_inotify=use_inotify
+        )
+        self.assertEqual(watcher.uses_inotify, use_inotify)
+        thread = threading.Timer(0.2, write_articles, (range(3, 5),))
+        thread.start()
+        articles = list(watcher)
+        thread.join()
+
+        self.assertEqual(sorted(loaded.article_id for loaded in articles), [1, 2, 3, 4])
+        self.assertEqual(sorted(storage), [1, 2, 3, 4])
+        self.assertEqual(storage[3].text, "Текст статьи 3")
+        self.assertEqual(storage[3].url, "https://example.com/3")
+
+    @pytest.mark.core_utils
+    def test_inotify_watcher(self) -> None:
+        """
+        Ensure that the inotify watcher follows the dataset.
+        """
+        self.check_following(use_inotify=True)
+
+    @pytest.mark.core_utils
+    def test_polling_watcher(self) -> None:
+        """
+        Ensure that the polling watcher follows the dataset.
+        """
+        self.check_following(use_inotify=False)
+
+    def check_recreation(self, use_inotify: bool) -> None:
+        """
+        Ensure that articles of a dataset removed and created again are yielded.
+
+        Args:
+            use_inotify (bool): Whether to use inotify
+        """
+        write_articles(range(1, 2))
+
+        def recreate() -> None:
+            shutil.rmtree(TEST_PATH)
+            TEST_PATH.mkdir()
+            write_articles(range(1, 3))
+
+        storage: dict[int, Article] = {}
+        watcher = CorpusWatcher(
+            TEST_PATH, storage, poll_interval=0.05, idle_timeout=1, use_inotify=use_inotify
+        )
+        self.assertEqual(next(watcher).article_id, 1)
+        thread = threading.Timer(0.2, recreate)
+        thread.start()
+        articles = list(watcher)
+        thread.join()
+
+        self.assertEqual(sorted(loaded.article_id for loaded in articles), [1, 2])
+        self.assertEqual(sorted(storage), [1, 2])
+
+    @pytest.mark.core_utils
+    def test_inotify_watcher_follows_recreated_dataset(self) -> None:
+        """
+        Ensure that the inotify watcher follows the dataset removed and created again.
+        """
+        self.check_recreation(use_inotify=True)
+
+    @pytest.mark.core_utils
+    def test_polling_watcher_follows_recreated_dataset(self) -> None:
+        """
+        Ensure that the polling watcher follows the dataset removed and created again.
+        """
+        self.check_recreation(use_inotify=False)
+
+    def check_files_being_written(self, use_inotify: bool) -> None:
+        """
+        Ensure that a file being written when watching starts is loaded once it is complete.
+
+        Args:
+            use_inotify (bool): Whether to use inotify
+        """
+        sample = Article(url="https://example.com/1", article_id=1)
+        to_meta(sample)
+        raw_path = sample.get_raw_text_path()
+        with open(raw_path, "w", encoding="utf-8") as raw_file:
+            raw_file.write("Начало ")
+            raw_file.flush()
+            watcher = CorpusWatcher(
+                TEST_PATH, poll_interval=0.05, idle_timeout=1, use_inotify=use_inotify
+            )
+            raw_file.write("и конец статьи")
+
+        self.assertEqual([loaded.text for loaded in watcher], ["Начало и конец статьи"])
+
+    @pytest.mark.core_utils
+    def test_inotify_watcher_waits_for_files_being_written(self) -> None:
+        """
+        Ensure that the inotify watcher waits for files being written when watching starts.
+        """
+        self.check_files_being_written(use_inotify=True)
+
+    @pytest.mark.core_utils
+    def test_polling_watcher_waits_for_files_being_written(self) -> None:
+        """
+        Ensure that the polling watcher waits for files being written when watching starts.
+        """
+        self.check_files_being_written(use_inotify=False)
+
+    @pytest.mark.core_utils
+    def test_async_iteration_over_shards(self) -> None:
+        """
+        Ensure that articles committed to new shards are yielded by the async iterator.
+        """
+
+        async def collect(watcher: CorpusWatcher) -> list[int]:
+            return [loaded.article_id async for loaded in watcher]
+
+        def write() -> None:
+            with GroupCommitWriter(max_delay=0.01) as writer:
+                write_articles(range(1, 6), writer)
+
+        with mock.patch.object(article, "ASSETS_SHARD_DEPTH", 1):
+            watcher = CorpusWatcher(TEST_PATH, poll_interval=0.05, idle_timeout=1)
+            thread = threading.Timer(0.1, write)
+            thread.start()
+            article_ids = asyncio.run(collect(watcher))
+            thread.join()
+        self.assertEqual(sorted(article_ids), [1, 2, 3, 4, 5])
+
+    @pytest.mark.core_utils
+    def test_files_without_id_are_skipped(self) -> None:
+        """
+        Ensure that files whose names do not start with an article id are skipped.
+        """
+        write_articles(range(1, 2))
+        (TEST_PATH / "draft_raw.txt").write_text("Черновик", encoding="utf-8")
+
+        watcher = CorpusWatcher(TEST_PATH, poll_interval=0.05, idle_timeout=0.2)
+        self.assertEqual([loaded.article_id for loaded in watcher], [1])
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CorpusWatcherTest class.
+        """
+        shutil.rmtree(TEST_PATH)
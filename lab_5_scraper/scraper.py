@@ -16,6 +16,8 @@ import requests
 from bs4 import BeautifulSoup
 
 from core_utils.article.article import Article
+from core_utils.article.dates import parse_date
+from core_utils.article.group_commit import GroupCommitWriter
 from core_utils.article.io import to_meta, to_raw
 from core_utils.config_dto import ConfigDTO
 from core_utils.constants import ASSETS_PATH, CRAWLER_CONFIG_PATH
@@ -340,6 +342,15 @@ class HTMLParser:
             self.article.author = [author[-1].get_text(strip=True)]
         else:
             self.article.author = ["NOT FOUND"]
+        date_tag = article_soup.find('time')
+        if date_tag:
+            date_value = date_tag.get('datetime')
+            if not isinstance(date_value, str) or not date_value:
+                date_value = date_tag.get_text(strip=True)
+            try:
+                self.article.date = self.unify_date_format(date_value)
+            except ValueError:
+                self.article.date = None
 
     def unify_date_format(self, date_str: str) -> datetime.datetime:
         """
@@ -351,6 +362,7 @@ class HTMLParser:
         Returns:
             datetime.datetime: Datetime object
         """
+        return parse_date(date_str)
 
     def parse(self) -> Union[Article, bool, list]:
         """
@@ -389,12 +401,13 @@ def main() -> None:
     prepare_environment(ASSETS_PATH)
     crawler = Crawler(config=configuration)
     crawler.find_articles()
-    for i, full_url in enumerate(crawler.urls):
-        parser = HTMLParser(full_url=full_url, article_id=i + 1, config=configuration)
-        article = parser.parse()
-        if isinstance(article, Article):
-            to_raw(article)
-            to_meta(article)
+    with GroupCommitWriter() as writer:
+        for i, full_url in enumerate(crawler.urls):
+            parser = HTMLParser(full_url=full_url, article_id=i + 1, config=configuration)
+            article = parser.parse()
+            if isinstance(article, Article):
+                to_raw(article, writer=writer)
+                to_meta(article, writer=writer)
 
 if __name__ == "__main__":
     main()
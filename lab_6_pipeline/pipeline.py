@@ -3,14 +3,57 @@ Pipeline for CONLL-U formatting.
 """
 
 # pylint: disable=too-few-public-methods, undefined-variable, too-many-nested-blocks
+import argparse
+import contextlib
+import itertools
+import os
 import pathlib
+from collections import deque
+from typing import Iterable, Iterator, Sequence
 
 import spacy_udpipe
 from networkx import DiGraph
+from spacy_conll.parser import ConllParser
 
+from core_utils.annotation_cache import (
+    AnnotationCache,
+    get_annotation_cache_path,
+    get_annotation_keys,
+    get_model_hash,
+)
+from core_utils.annotation_pool import AnnotationPool
+from core_utils.article import article as article_module
 from core_utils.article.article import Article, ArtifactType
-from core_utils.article.io import from_raw, to_cleaned
+from core_utils.article.codecs import Codec, resolve_artifact
+from core_utils.article.conllu import ConlluDocument, parse_conllu, read_conllu
+from core_utils.article.corpus import BATCH_SIZE, CorpusQueries
+from core_utils.article.freshness import ArtifactState
+from core_utils.article.group_commit import remove_uncommitted
+from core_utils.article.io import (
+    ArtifactWriter,
+    bulk_from_raw,
+    from_raw,
+    open_artifact,
+    open_artifact_writer,
+    to_artifact,
+    to_cleaned,
+)
+from core_utils.article.manifest import (
+    build_manifest,
+    DatasetManifest,
+    load_manifest,
+    ManifestEntry,
+    save_manifest,
+)
+from core_utils.article.sentences import (
+    join_conllu_chunks,
+    renumber_conllu_sentences,
+    SentenceView,
+    split_into_chunks,
+)
+from core_utils.article.watcher import CorpusWatcher
 from core_utils.constants import ASSETS_PATH, PROJECT_ROOT
+from core_utils.model_registry import get_model_key, MODEL_REGISTRY
 from core_utils.pipeline import (
     AbstractCoNLLUAnalyzer,
     CoNLLUDocument,
@@ -22,6 +65,17 @@ from core_utils.pipeline import (
     UnifiedCoNLLUDocument,
 )
 
+#: Path to the UDPipe model
+UDPIPE_MODEL_PATH = (
+    PROJECT_ROOT / "lab_6_pipeline" / "assets" / "model" / "russian-syntagrus-ud-2.0-170801.udpipe"
+)
+
+#: Length of text pieces given to the model at most
+MAX_CHUNK_LENGTH = 50_000
+
+#: Configuration of the CoNLL-U formatter added to the UDPipe model
+CONLL_FORMATTER_CONFIG = {"conversion_maps": {"XPOS": {"": "_"}}, "include_headers": True}
+
 
 class EmptyDirectoryError(Exception):
     """
@@ -40,22 +94,41 @@ class EmptyFileError(Exception):
     An article file is empty
     """
 
-class CorpusManager:
+class CorpusManager(CorpusQueries):
     """
     Work with articles and store them.
     """
 
-    def __init__(self, path_to_raw_txt_data: pathlib.Path) -> None:
+    def __init__(
+        self,
+        path_to_raw_txt_data: pathlib.Path,
+        max_workers: int = 1,
+        readahead: bool = False,
+        live: bool = False,
+        lazy: bool = False,
+    ) -> None:
         """
         Initialize an instance of the CorpusManager class.
 
         Args:
             path_to_raw_txt_data (pathlib.Path): Path to raw txt data
+            max_workers (int): Number of threads reading raw texts
+            readahead (bool): Whether to ask the kernel to prefetch raw texts before reading
+            live (bool): Whether the dataset is still being written, in this case it is
+                neither validated nor scanned and articles are registered by watch()
+            lazy (bool): Whether to read raw texts only when articles are requested,
+                see iter_articles()
         """
         self.path = path_to_raw_txt_data
         self._storage = {}
-        self._validate_dataset()
-        self._scan_dataset()
+        self._raw_paths: dict[int, str] = {}
+        self._manifest = DatasetManifest()
+        self._max_workers = max_workers
+        self._readahead = readahead
+        self._lazy = lazy
+        if not live:
+            self._validate_dataset()
+            self._scan_dataset()
 
     def _validate_dataset(self) -> None:
         """
@@ -65,68 +138,191 @@ class CorpusManager:
             raise FileNotFoundError(f'Directory {self.path} does not exist')
         if not self.path.is_dir():
             raise NotADirectoryError(f'{self.path} is not a directory')
-        if not any(self.path.iterdir()):
+        manifest = build_manifest(self.path, load_manifest(self.path))
+        self._manifest = manifest
+        if manifest.is_empty:
             raise EmptyDirectoryError
 
-        raw = [f.name for f in self.path.iterdir() if f.is_file() and f.name.endswith('_raw.txt')]
-        meta = [f.name for f in self.path.iterdir() if f.is_file() and f.name.endswith('_meta.json')]
+        if manifest.raw_count != manifest.meta_count:
+            raise InconsistentDatasetError(f'Number of meta and raw files is not equal: {manifest.raw_count} != {manifest.meta_count}')
 
-        if len(raw) != len(meta):
-            raise InconsistentDatasetError(f'Number of meta and raw files is not equal: {len(raw)} != {len(meta)}')
-
-        raw_ids = [int(name.split('_')[0]) for name in raw]
-        expected_raw_ids = list(range(1, len(raw) + 1))
+        raw_ids = manifest.get_raw_ids()
+        expected_raw_ids = list(range(1, len(raw_ids) + 1))
         if sorted(raw_ids) != expected_raw_ids:
             missing_raw = set(expected_raw_ids) - set(raw_ids)
             raise InconsistentDatasetError(f'raw IDs in dataset are not found: {missing_raw}')
 
-        meta_ids = [int(name.split('_')[0]) for name in meta]
-        expected_meta_ids = list(range(1, len(meta) + 1))
+        meta_ids = manifest.get_meta_ids()
+        expected_meta_ids = list(range(1, len(meta_ids) + 1))
         if sorted(meta_ids) != expected_meta_ids:
             missing_meta = set(expected_meta_ids) - set(meta_ids)
             raise InconsistentDatasetError(f'meta IDs in dataset are not found: {missing_meta}')
 
-        for file_raw in self.path.glob('*_raw.txt'):
-            if file_raw.stat().st_size == 0:
-                raise InconsistentDatasetError(f'raw file {file_raw.name} is empty')
+        for files in manifest.entries.values():
+            if files.raw_path and files.raw_size == 0:
+                raise InconsistentDatasetError(f'raw file {os.path.basename(files.raw_path)} is empty')
 
-        for file_meta in self.path.glob('*_meta.json'):
-            if file_meta.stat().st_size == 0:
-                raise InconsistentDatasetError(f'meta file {file_meta.name} is empty')
+        for files in manifest.entries.values():
+            if files.meta_path and files.meta_size == 0:
+                raise InconsistentDatasetError(f'meta file {os.path.basename(files.meta_path)} is empty')
 
     def _scan_dataset(self) -> None:
         """
         Register each dataset entry.
         """
-        for filepath in self.path.glob('*_raw.txt'):
-            filename = filepath.name
+        self._raw_paths = {
+            article_id: files.raw_path
+            for article_id, files in self._manifest.entries.items()
+            if files.raw_path
+        }
+        if self._lazy:
+            return
+        for article in self._load(list(self._raw_paths.values())):
+            self._storage[article.article_id] = article
+
+    def _load(self, paths: list[str]) -> list[Article]:
+        """
+        Read raw texts.
+
+        Args:
+            paths (list[str]): Paths to raw texts
+
+        Returns:
+            list[Article]: Articles in the order of paths
+        """
+        if self._max_workers > 1 or self._readahead:
+            return bulk_from_raw(paths, self._max_workers, self._readahead)
+        return [from_raw(path) for path in paths]
+
+    def _iter_by_ids(self, article_ids: list[int], batch_size: int) -> Iterator[Article]:
+        """
+        Yield articles, reading raw texts of unregistered ones batch by batch.
+
+        Args:
+            article_ids (list[int]): Ids of articles in the order to yield them
+            batch_size (int): Number of raw texts read at once
+
+        Yields:
+            Article: Next article
+        """
+        for start in range(0, len(article_ids), batch_size):
+            batch = article_ids[start : start + batch_size]
+            paths = [
+                self._raw_paths[article_id]
+                for article_id in batch
+                if article_id not in self._storage
+            ]
+            loaded = {article.article_id: article for article in self._load(paths)}
+            for article_id in batch:
+                yield self._storage[article_id] if article_id in self._storage else loaded[article_id]
+
+    def iter_articles(
+        self,
+        start: int | None = None,
+        stop: int | None = None,
+        batch_size: int = BATCH_SIZE,
+        article_ids: Iterable[int] | None = None,
+    ) -> Iterator[Article]:
+        """
+        Iterate over articles in the order of their ids.
+
+        Registered articles are yielded as they are. In the lazy mode other
+        articles are read batch by batch and are not kept, so the corpus is
+        streamed with memory bounded by the batch size.
+
+        Args:
+            start (int | None): Smallest id to yield, from the first article by default
+            stop (int | None): Id to stop before, up to the last article by default
+            batch_size (int): Number of raw texts read at once
+            article_ids (Iterable[int] | None): Ids of articles to yield, all by default
+
+        Yields:
+            Article: Next article
+        """
+        known = self._raw_paths.keys() | self._storage.keys()
+        selected = sorted(
+            article_id
+            for article_id in (known if article_ids is None else known & set(article_ids))
+            if (start is None or article_id >= start) and (stop is None or article_id < stop)
+        )
+        yield from self._iter_by_ids(selected, batch_size)
+
+    def get_manifest(self) -> DatasetManifest:
+        """
+        Get files of the dataset found by the validation.
 
-            if filename.endswith('_raw.txt'):
-                prefix = filename[:-8]
+        Returns:
+            DatasetManifest: Manifest of the dataset, empty in the live mode
+        """
+        return self._manifest
 
-                if prefix.isdigit():
-                    article_id = int(prefix)
-                    article = from_raw(filepath)
-                    self._storage[article_id] = article
+    def save_manifest(self) -> None:
+        """
+        Save the manifest, so the next validation lists unchanged directories
+        and hashes unchanged files no more.
+        """
+        if self._manifest.entries:
+            save_manifest(self.path, self._manifest)
+
+    def get_raw_sizes(self) -> dict[int, int]:
+        """
+        Get sizes of raw text files without reading them.
+
+        Returns:
+            dict[int, int]: File sizes by article id
+        """
+        return {
+            article_id: self._manifest.entries[article_id].raw_size
+            for article_id in self._raw_paths
+        }
+
+    def restrict(self, article_ids: Iterable[int]) -> None:
+        """
+        Keep only the given articles, e.g. the ones of a shard.
+
+        Args:
+            article_ids (Iterable[int]): Ids of articles to keep
+        """
+        kept = set(article_ids)
+        self._raw_paths = {
+            article_id: path for article_id, path in self._raw_paths.items() if article_id in kept
+        }
+        self._storage = {
+            article_id: article
+            for article_id, article in self._storage.items()
+            if article_id in kept
+        }
 
     def get_articles(self) -> dict:
         """
         Get storage params.
 
+        In the lazy mode all raw texts not read yet are read and kept.
+
         Returns:
             dict: Storage params
         """
+        missing = sorted(self._raw_paths.keys() - self._storage.keys())
+        for article in self._load([self._raw_paths[article_id] for article_id in missing]):
+            self._storage[article.article_id] = article
         return self._storage
 
 
-
 class TextProcessingPipeline(PipelineProtocol):
     """
     Preprocess and morphologically annotate sentences into the CONLL-U format.
     """
 
     def __init__(
-        self, corpus_manager: CorpusManager, analyzer: LibraryWrapper | None = None
+        self,
+        corpus_manager: CorpusManager,
+        analyzer: LibraryWrapper | None = None,
+        codec: Codec = Codec.PLAIN,
+        writer: ArtifactWriter | None = None,
+        batch_size: int = BATCH_SIZE,
+        force: bool = False,
+        max_workers: int = 1,
+        incremental: bool = False,
     ) -> None:
         """
         Initialize an instance of the TextProcessingPipeline class.
@@ -134,41 +330,255 @@ class TextProcessingPipeline(PipelineProtocol):
         Args:
             corpus_manager (CorpusManager): CorpusManager instance
             analyzer (LibraryWrapper | None): Analyzer instance
+            codec (Codec): Compression codec for cleaned texts
+            writer (ArtifactWriter | None): Writer for cleaned texts, e.g. a BlobStore
+            batch_size (int): Number of articles handed over to the analyzer at once,
+                to every worker process in the multi-core mode
+            force (bool): Whether to rebuild artifacts that are up to date
+            max_workers (int): Number of processes annotating articles
+            incremental (bool): Whether to track raw texts the artifacts are built from,
+                so later runs process only articles with stale artifacts
         """
         self.corpus_manager = corpus_manager
         self._analyzer = analyzer
+        self._codec = codec
+        self._writer = writer
+        self._batch_size = batch_size
+        self._force = force
+        self._max_workers = max_workers
+        self._incremental = incremental
+        self._pool: AnnotationPool | None = None
 
     def run(self) -> None:
         """
         Perform basic preprocessing and write processed text to files.
+
+        In the incremental mode only articles with artifacts missing or built
+        from another raw text are processed, unless the pipeline is forced.
+        Otherwise all articles are processed and no artifact state is kept.
+        """
+        kinds = [ArtifactType.CLEANED]
+        if self._analyzer:
+            kinds.append(getattr(self._analyzer, "artifact_type", ArtifactType.UDPIPE_CONLLU))
+        state = ArtifactState(self.corpus_manager.path) if self._incremental else None
+        entries = self.corpus_manager.get_manifest().entries
+        article_ids = None
+        if state is not None and not self._force and entries:
+            article_ids = [
+                article_id
+                for article_id, entry in entries.items()
+                if not state.is_fresh(entry, article_id, kinds)
+            ]
+
+        batch_size = self._batch_size
+        if self._analyzer and self._max_workers > 1:
+            # workers forked after the model is loaded share it with the parent
+            preload = getattr(self._analyzer, "preload", None)
+            if preload is not None:
+                preload()
+            self._pool = AnnotationPool(self._analyzer, self._max_workers, self._batch_size)
+            batch_size *= self._max_workers
+
+        batches = self._iter_batches(article_ids, batch_size)
+        try:
+            if self._pool is None:
+                for batch in batches:
+                    self._process(batch)
+                    self._record(state, entries, batch, kinds)
+            else:
+                for batch in self._process_in_pool(self._pool, batches):
+                    self._record(state, entries, batch, kinds)
+        finally:
+            if state is not None:
+                state.save()
+            if self._pool:
+                self._pool.close()
+                self._pool = None
+
+    def _iter_batches(
+        self, article_ids: list[int] | None, batch_size: int
+    ) -> Iterator[list[Article]]:
+        """
+        Read articles batch by batch.
+
+        Args:
+            article_ids (list[int] | None): Ids of articles to read, all by default
+            batch_size (int): Number of articles in a batch
+
+        Yields:
+            list[Article]: Next batch
+        """
+        batch = []
+        for article in self.corpus_manager.iter_articles(
+            batch_size=batch_size, article_ids=article_ids
+        ):
+            batch.append(article)
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _process_in_pool(
+        self, pool: AnnotationPool, batches: Iterable[list[Article]]
+    ) -> Iterator[list[Article]]:
+        """
+        Write cleaned texts and CONLL-U markup of articles annotated by the pool.
+
+        The workers annotate the next batch while markup of the current one is written.
+
+        Args:
+            pool (AnnotationPool): Pool of annotating processes
+            batches (Iterable[list[Article]]): Articles to process, batch by batch
+
+        Yields:
+            list[Article]: Processed batch
+        """
+        if self._analyzer is None:
+            return
+        submitted: deque[list[Article]] = deque()
+
+        def iter_texts() -> Iterator[list[str]]:
+            """
+            Write cleaned texts of batches and hand their texts over to the pool.
+
+            Yields:
+                list[str]: Texts of the next batch
+            """
+            for batch in batches:
+                for article in batch:
+                    to_cleaned(article, self._codec, self._writer)
+                submitted.append(batch)
+                yield [article.text for article in batch]
+
+        for analyzed_texts in pool.imap(iter_texts()):
+            batch = submitted.popleft()
+            for article, analyzed_text in zip(batch, analyzed_texts):
+                article.set_conllu_info(analyzed_text)
+                self._analyzer.to_conllu(article)
+            yield batch
+
+    @staticmethod
+    def _record(
+        state: ArtifactState | None,
+        entries: dict[int, ManifestEntry],
+        articles: list[Article],
+        kinds: list[ArtifactType],
+    ) -> None:
+        """
+        Record raw texts the artifacts of processed articles are built from.
+
+        Args:
+            state (ArtifactState | None): Artifact state of the dataset, None if not tracked
+            entries (dict[int, ManifestEntry]): Files of the dataset by article id
+            articles (list[Article]): Processed articles
+            kinds (list[ArtifactType]): Built artifacts
+        """
+        if state is None:
+            return
+        for article in articles:
+            if article.article_id in entries:
+                state.record(entries[article.article_id], article.article_id, kinds)
+
+    def run_live(self, watcher: CorpusWatcher) -> None:
+        """
+        Process articles as they appear in the dataset, e.g. while it is being scraped.
+
+        Args:
+            watcher (CorpusWatcher): Watcher of the dataset, see CorpusManager.watch()
+        """
+        for article in watcher:
+            self._process([article])
+
+    def _process(self, articles: list[Article]) -> None:
         """
-        articles = [article for _, article in sorted(self.corpus_manager.get_articles().items(), key=lambda x: x[0])]
+        Write cleaned texts and CONLL-U markup of articles.
 
+        Args:
+            articles (list[Article]): Articles to process
+        """
         for article in articles:
-            to_cleaned(article)
-            if self._analyzer:
-                print(article)
-                analyzed_text = self._analyzer.analyze([article.text])
-                if analyzed_text:
-                    analyzed_text = analyzed_text[0]
-                    article.set_conllu_info(analyzed_text)
-                    self._analyzer.to_conllu(article)
+            to_cleaned(article, self._codec, self._writer)
+        if self._analyzer:
+            # analyzers able to save markup as it is produced do so by themselves
+            annotate_to_conllu = getattr(self._analyzer, "annotate_to_conllu", None)
+            if annotate_to_conllu is not None:
+                annotate_to_conllu(articles)
+                return
+            analyzed_texts = self._analyzer.analyze([article.text for article in articles])
+            for article, analyzed_text in zip(articles, analyzed_texts or []):
+                article.set_conllu_info(str(analyzed_text))
+                self._analyzer.to_conllu(article)
 
 
 class UDPipeAnalyzer(LibraryWrapper):
     """
     Wrapper for udpipe library.
+
+    The model is taken from the process-wide registry on first use, so it is
+    loaded once however many analyzers are created.
     """
 
-    #: Analyzer
-    _analyzer: AbstractCoNLLUAnalyzer
+    #: Kind of artifacts written by to_conllu
+    artifact_type = ArtifactType.UDPIPE_CONLLU
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        codec: Codec = Codec.PLAIN,
+        writer: ArtifactWriter | None = None,
+        batch_size: int = BATCH_SIZE,
+        n_process: int = 1,
+        cache: AnnotationCache | None = None,
+        max_chunk_length: int = MAX_CHUNK_LENGTH,
+    ) -> None:
         """
         Initialize an instance of the UDPipeAnalyzer class.
+
+        Args:
+            codec (Codec): Compression codec for CONLL-U artifacts
+            writer (ArtifactWriter | None): Writer for CONLL-U artifacts, e.g. a BlobStore
+            batch_size (int): Number of texts spaCy processes at once
+            n_process (int): Number of processes spaCy analyzes texts in
+            cache (AnnotationCache | None): Cache of markup, texts found there are not analyzed
+            max_chunk_length (int): Length of text pieces the model gets at most,
+                longer texts are split, see split_into_chunks()
+        """
+        self._codec = codec
+        self._writer = writer
+        self._batch_size = batch_size
+        self._n_process = n_process
+        self._cache = cache
+        self._max_chunk_length = max_chunk_length
+        self._model_key = get_model_key(UDPIPE_MODEL_PATH, CONLL_FORMATTER_CONFIG)
+        self._model: AbstractCoNLLUAnalyzer | None = None
+
+    @property
+    def _analyzer(self) -> AbstractCoNLLUAnalyzer:
+        """
+        Get the UDPipe model, loading it on first use.
+
+        Returns:
+            AbstractCoNLLUAnalyzer: Analyzer instance
+        """
+        if self._model is not None:
+            return self._model
+        return MODEL_REGISTRY.get(self._model_key, self._bootstrap)
+
+    @_analyzer.setter
+    def _analyzer(self, analyzer: AbstractCoNLLUAnalyzer) -> None:
         """
-        self._analyzer = self._bootstrap()
-        print("self._analyzer = self._bootstrap()")
+        Use the given model instead of the one from the registry.
+
+        Args:
+            analyzer (AbstractCoNLLUAnalyzer): Analyzer instance
+        """
+        self._model = analyzer
+
+    def preload(self) -> None:
+        """
+        Load the model now, e.g. before forking workers that should share it.
+        """
+        MODEL_REGISTRY.preload(self._model_key, self._bootstrap)
 
     def _bootstrap(self) -> AbstractCoNLLUAnalyzer:
         """
@@ -177,28 +587,138 @@ class UDPipeAnalyzer(LibraryWrapper):
         Returns:
             AbstractCoNLLUAnalyzer: Analyzer instance
         """
-        model_path = (PROJECT_ROOT / "lab_6_pipeline" / "assets" / "model" /
-                      "russian-syntagrus-ud-2.0-170801.udpipe")
-        model = spacy_udpipe.load_from_path(lang="ru", path=str(model_path))
-        model.add_pipe(
-            "conll_formatter",
-            last=True,
-            config={"conversion_maps": {"XPOS": {"": "_"}}, "include_headers": True},
-        )
+        model = spacy_udpipe.load_from_path(lang="ru", path=str(UDPIPE_MODEL_PATH))
+        model.add_pipe("conll_formatter", last=True, config=CONLL_FORMATTER_CONFIG)
         return model
 
-    def analyze(self, texts: list[str]) -> list[UDPipeDocument | str]:
+    def _get_cache_keys(self, texts: list[str]) -> list[str]:
+        """
+        Get cache keys of texts.
+
+        Markup depends on the chunk length too, as the model finds sentences
+        within chunks.
+
+        Args:
+            texts (list[str]): Texts to analyze
+
+        Returns:
+            list[str]: Keys in the order of the texts
+        """
+        return get_annotation_keys(
+            texts,
+            "udpipe",
+            get_model_hash(UDPIPE_MODEL_PATH),
+            {**CONLL_FORMATTER_CONFIG, "max_chunk_length": self._max_chunk_length},
+        )
+
+    def analyze(self, texts: Sequence[str | SentenceView]) -> list[UDPipeDocument | str]:
         """
         Process texts into CoNLL-U formatted markup.
 
+        With a cache, the model is loaded only if some text is not cached.
+
         Args:
-            texts (list[str]): Collection of texts
+            texts (Sequence[str | SentenceView]): Collection of texts or sentence views
 
         Returns:
             list[UDPipeDocument | str]: List of documents
         """
-        return [f'{self._analyzer(text)._.conll_str}\n' for text in texts]
+        plain_texts = [str(text) for text in texts]
+        if self._cache is None:
+            return list(self._annotate(plain_texts))
+
+        keys = self._get_cache_keys(plain_texts)
+        annotations = self._cache.get_many(keys)
+        missing = [index for index, key in enumerate(keys) if key not in annotations]
+        if missing:
+            annotated = self._annotate([plain_texts[index] for index in missing])
+            new = {keys[index]: conllu for index, conllu in zip(missing, annotated)}
+            self._cache.put_many(new)
+            annotations.update(new)
+        return [annotations[key] for key in keys]
+
+    def _annotate(self, texts: list[str]) -> list[str]:
+        """
+        Run the model over texts.
+
+        Long texts are annotated by chunks, which are batched together with
+        other texts, so peak memory does not depend on the longest text.
+
+        Args:
+            texts (list[str]): Texts to analyze
+
+        Returns:
+            list[str]: CoNLL-U markup of the texts
+        """
+        chunked = [split_into_chunks(text, self._max_chunk_length) for text in texts]
+        docs = self._analyzer.pipe(
+            (chunk for chunks in chunked for chunk in chunks),
+            batch_size=self._batch_size,
+            n_process=self._n_process,
+        )
+        markup = (f'{doc._.conll_str}\n' for doc in docs)
+        return [join_conllu_chunks([next(markup) for _ in chunks]) for chunks in chunked]
+
+    def annotate_to_conllu(self, articles: list[Article]) -> None:
+        """
+        Annotate texts of articles and save markup sentence by sentence as it is produced.
+
+        Markup of a document is never joined into one string, the artifacts
+        are the same as written by to_conllu() after analyze(). With a cache,
+        markup of analyzed texts is kept until it is stored in the cache, and
+        the model is loaded only if some text is not cached.
 
+        Args:
+            articles (list[Article]): Articles to annotate
+        """
+        texts = [article.text for article in articles]
+        keys: list[str] = []
+        annotations: dict[str, str] = {}
+        if self._cache is not None:
+            keys = self._get_cache_keys(texts)
+            annotations = self._cache.get_many(keys)
+            for article, key in zip(articles, keys):
+                if key in annotations:
+                    article.set_conllu_info(annotations[key])
+                    self.to_conllu(article)
+
+        missing = [
+            index for index in range(len(articles)) if not keys or keys[index] not in annotations
+        ]
+        if not missing:
+            return
+        chunked = [split_into_chunks(texts[index], self._max_chunk_length) for index in missing]
+        docs = iter(
+            self._analyzer.pipe(
+                (chunk for chunks in chunked for chunk in chunks),
+                batch_size=self._batch_size,
+                n_process=self._n_process,
+            )
+        )
+        new = {}
+        for index, chunks in zip(missing, chunked):
+            blocks = renumber_conllu_sentences(
+                (f'{sentence._.conll_str}\n' for sentence in doc.sents)
+                for doc in itertools.islice(docs, len(chunks))
+            )
+            kept = []
+            written = False
+            with open_artifact_writer(
+                articles[index], self.artifact_type, self._codec, self._writer
+            ) as conllu_file:
+                for block in blocks:
+                    conllu_file.write(block)
+                    written = True
+                    if self._cache is not None:
+                        kept.append(block)
+                if not written:
+                    # markup of a text without sentences is a blank line
+                    conllu_file.write("\n")
+                    kept.append("\n")
+            if self._cache is not None:
+                new[keys[index]] = "".join(kept)
+        if self._cache is not None:
+            self._cache.put_many(new)
 
     def to_conllu(self, article: Article) -> None:
         """
@@ -207,9 +727,7 @@ class UDPipeAnalyzer(LibraryWrapper):
         Args:
             article (Article): Article containing information to save
         """
-        path = article.get_file_path(ArtifactType.UDPIPE_CONLLU)
-        with open(path, 'w', encoding='utf-8') as file:
-            file.write(article.get_conllu_info())
+        to_artifact(article, ArtifactType.UDPIPE_CONLLU, self._codec, self._writer)
 
     def from_conllu(self, article: Article) -> UDPipeDocument:
         """
@@ -221,10 +739,14 @@ class UDPipeAnalyzer(LibraryWrapper):
         Returns:
             UDPipeDocument: Document ready for parsing
         """
-        corpus_manager = CorpusManager(path_to_raw_txt_data=ASSETS_PATH)
-        udpipe_analyzer = UDPipeAnalyzer()
-        pipeline = TextProcessingPipeline(corpus_manager, udpipe_analyzer)
-        pipeline.run()
+        with open_artifact(article, ArtifactType.UDPIPE_CONLLU) as conllu_file:
+            conllu = conllu_file.read()
+        if not conllu:
+            raise EmptyFileError(f'CONLL-U file of article {article.article_id} is empty')
+        parsed: UDPipeDocument = ConllParser(self._analyzer).parse_conll_text_as_spacy(
+            conllu.strip("\n")
+        )
+        return parsed
 
     def get_document(self, doc: UDPipeDocument) -> UnifiedCoNLLUDocument:
         """
@@ -236,6 +758,28 @@ class UDPipeAnalyzer(LibraryWrapper):
         Returns:
             UnifiedCoNLLUDocument: Dictionary of token features within document sentences
         """
+        if isinstance(doc, ConlluDocument):
+            return doc
+        return parse_conllu(doc._.conll_str)
+
+    def read_document(self, article: Article) -> UnifiedCoNLLUDocument:
+        """
+        Load ConLLU content of the article directly into a unified document.
+
+        The artifact is read into columns without the model and spaCy
+        documents, which is much faster and lighter for read-only analysis.
+
+        Args:
+            article (Article): Article to load
+
+        Returns:
+            UnifiedCoNLLUDocument: Document of token features within document sentences
+        """
+        path = resolve_artifact(article.get_file_path(ArtifactType.UDPIPE_CONLLU))
+        document = read_conllu(path)
+        if not document.columns:
+            raise EmptyFileError(f'CONLL-U file of article {article.article_id} is empty')
+        return document
 
 
 class StanzaAnalyzer(LibraryWrapper):
@@ -243,6 +787,9 @@ class StanzaAnalyzer(LibraryWrapper):
     Wrapper for stanza library.
     """
 
+    #: Kind of artifacts written by to_conllu
+    artifact_type = ArtifactType.STANZA_CONLLU
+
     #: Analyzer
     _analyzer: AbstractCoNLLUAnalyzer
 
@@ -259,12 +806,12 @@ class StanzaAnalyzer(LibraryWrapper):
             AbstractCoNLLUAnalyzer: Analyzer instance
         """
 
-    def analyze(self, texts: list[str]) -> list[StanzaDocument]:
+    def analyze(self, texts: Sequence[str | SentenceView]) -> list[StanzaDocument]:
         """
         Process texts into CoNLL-U formatted markup.
 
         Args:
-            texts (list[str]): Collection of texts
+            texts (Sequence[str | SentenceView]): Collection of texts or sentence views
 
         Returns:
             list[StanzaDocument]: List of documents
@@ -394,6 +941,28 @@ def main() -> None:
     """
     Entrypoint for pipeline module.
     """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--force", action="store_true", help="Rebuild up-to-date artifacts")
+    parser.add_argument(
+        "--cache", action="store_true", help="Reuse markup of texts annotated before"
+    )
+    args = parser.parse_args()
+
+    # temporary files of an interrupted writer, files of a running one are kept
+    remove_uncommitted(ASSETS_PATH)
+    corpus_manager = CorpusManager(path_to_raw_txt_data=ASSETS_PATH, lazy=True)
+    # artifacts are stored next to raw texts, in the layout of the dataset
+    article_module.ASSETS_SHARD_DEPTH = corpus_manager.get_manifest().get_shard_depth()
+    with (
+        AnnotationCache(get_annotation_cache_path(ASSETS_PATH))
+        if args.cache
+        else contextlib.nullcontext()
+    ) as cache:
+        pipeline = TextProcessingPipeline(
+            corpus_manager, UDPipeAnalyzer(cache=cache), force=args.force, incremental=True
+        )
+        pipeline.run()
+    corpus_manager.save_manifest()
 
 
 if __name__ == "__main__":
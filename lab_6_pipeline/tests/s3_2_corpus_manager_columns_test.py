@@ -0,0 +1,86 @@
+"""
+Tests for the columnar export of CorpusManager.
+"""
+
+import os
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import PIPE_TEST_FILES_FOLDER, TEST_PATH
+from core_utils.article import article
+from core_utils.article.io import from_meta, to_meta, to_raw
+from core_utils.article.manifest import hash_file
+from core_utils.article.sidecars import remove_sidecars
+from core_utils.constants import PROJECT_ROOT
+from lab_6_pipeline.pipeline import CorpusManager
+
+
+class CorpusManagerColumnsTest(unittest.TestCase):
+    """
+    Tests for export of the corpus into columns.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CorpusManagerColumnsTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+        for article_id in (1, 2):
+            sample = from_meta(PIPE_TEST_FILES_FOLDER / "1_meta.json")
+            sample.article_id = article_id
+            sample.title = f"Статья {article_id}"
+            sample.text = f"Текст статьи номер {article_id}"
+            to_raw(sample)
+            to_meta(sample)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_changed_meta_is_exported_again(self) -> None:
+        """
+        Ensure that meta files are read from the dataset and changed ones are exported again.
+        """
+        article.ASSETS_PATH = PROJECT_ROOT / "missing_assets"
+        store = CorpusManager(TEST_PATH).export_columns()
+        self.assertEqual(store.load()["title"], ["Статья 1", "Статья 2"])
+
+        article.ASSETS_PATH = TEST_PATH
+        sample = from_meta(TEST_PATH / "1_meta.json")
+        sample.title = "Новый заголовок"
+        to_meta(sample)
+        article.ASSETS_PATH = PROJECT_ROOT / "missing_assets"
+
+        store = CorpusManager(TEST_PATH).export_columns()
+        columns = store.load()
+        self.assertEqual(list(columns["id"]), [2, 1])
+        self.assertEqual(columns["title"], ["Статья 2", "Новый заголовок"])
+        self.assertEqual(store.get_text(1), "Текст статьи номер 1")
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_export_hashes_only_changed_meta_files(self) -> None:
+        """
+        Ensure that only meta files with a changed size or modification time are hashed.
+        """
+        CorpusManager(TEST_PATH).export_columns()
+        os.utime(TEST_PATH / "1_meta.json", ns=(1, 1))
+
+        with mock.patch("core_utils.article.manifest.hash_file", wraps=hash_file) as hashed:
+            store = CorpusManager(TEST_PATH).export_columns()
+            self.assertEqual(hashed.call_count, 1)
+            self.assertEqual(store.get_meta_states()[1][1], 1)
+            CorpusManager(TEST_PATH).export_columns()
+            self.assertEqual(hashed.call_count, 1)
+        self.assertEqual(list(store.load()["id"]), [1, 2])
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CorpusManagerColumnsTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
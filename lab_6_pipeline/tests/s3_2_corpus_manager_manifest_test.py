@@ -0,0 +1,69 @@
+"""
+Tests for the manifest of dataset files built by CorpusManager.
+"""
+
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.group_commit import TEMP_SUFFIX
+from core_utils.article.manifest import get_manifest_path
+from core_utils.article.sidecars import get_sidecar_dir, remove_sidecars
+from lab_6_pipeline.pipeline import CorpusManager
+from lab_6_pipeline.tests.utils import articles_setup
+
+
+class CorpusManagerManifestTest(unittest.TestCase):
+    """
+    Tests for collection of dataset files by the validation of CorpusManager.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CorpusManagerManifestTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        self.texts = {article_id: f"Текст статьи номер {article_id}" for article_id in range(1, 6)}
+        articles_setup(self.texts)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_manifest_is_saved_on_request(self) -> None:
+        """
+        Ensure that the validation writes no files and the manifest is saved on request only.
+        """
+        corpus_manager = CorpusManager(TEST_PATH, lazy=True)
+        self.assertFalse(get_sidecar_dir(TEST_PATH).exists())
+        self.assertEqual(
+            sorted(path.name for path in TEST_PATH.parent.glob("test_tmp*")), ["test_tmp"]
+        )
+
+        corpus_manager.save_manifest()
+        self.assertTrue(get_manifest_path(TEST_PATH).exists())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_uncommitted_files_are_kept_by_the_scan(self) -> None:
+        """
+        Ensure that the scan neither removes temporary files of a writer nor lists the dataset.
+        """
+        temp_path = TEST_PATH / f".1_cleaned.txt.1.0{TEMP_SUFFIX}"
+        temp_path.write_text("Мама мыла", encoding="utf-8")
+        with mock.patch("pathlib.Path.rglob") as rglob:
+            corpus_manager = CorpusManager(TEST_PATH, lazy=True)
+        rglob.assert_not_called()
+        self.assertTrue(temp_path.exists())
+        self.assertEqual(sorted(corpus_manager.get_raw_sizes()), list(self.texts))
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CorpusManagerManifestTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
@@ -0,0 +1,60 @@
+"""
+Tests for queries over meta information of CorpusManager.
+"""
+
+import datetime
+import shutil
+import unittest
+
+import pytest
+
+from admin_utils.test_params import PIPE_TEST_FILES_FOLDER, TEST_PATH
+from core_utils.article import article
+from core_utils.article.io import from_meta, to_meta
+from core_utils.article.sidecars import remove_sidecars
+from lab_6_pipeline.pipeline import CorpusManager
+from lab_6_pipeline.tests.utils import articles_setup
+
+
+class CorpusManagerQueryTest(unittest.TestCase):
+    """
+    Tests for search of articles by meta information.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CorpusManagerQueryTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        articles_setup({article_id: f"Текст статьи номер {article_id}" for article_id in (1, 2)})
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_query_finds_meta_saved_after_validation(self) -> None:
+        """
+        Ensure that a query finds meta information saved through the same manager.
+        """
+        corpus_manager = CorpusManager(TEST_PATH)
+        self.assertEqual(corpus_manager.query(topic="политика"), set())
+
+        for article_id, loaded in corpus_manager.get_articles().items():
+            loaded.pos_frequencies = {"NOUN": article_id}
+            loaded.date = datetime.datetime(2024, 1, article_id)
+            to_meta(loaded)
+        added = from_meta(PIPE_TEST_FILES_FOLDER / "1_meta.json")
+        added.article_id = 3
+        added.topics = ["политика"]
+        added.pos_frequencies = {}
+        to_meta(added)
+
+        self.assertEqual(corpus_manager.query(pos="NOUN", min_frequency=2), {2})
+        self.assertEqual(corpus_manager.query(date=datetime.date(2024, 1, 1)), {1})
+        self.assertEqual(corpus_manager.query(topic="политика"), {3})
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CorpusManagerQueryTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
@@ -0,0 +1,54 @@
+"""
+Tests for full-text search of CorpusManager.
+"""
+
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.manifest import hash_file
+from core_utils.article.sidecars import remove_sidecars
+from lab_6_pipeline.pipeline import CorpusManager
+from lab_6_pipeline.tests.utils import articles_setup
+
+
+class CorpusManagerSearchTest(unittest.TestCase):
+    """
+    Tests for search of articles by their raw texts.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CorpusManagerSearchTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        articles_setup(
+            {article_id: f"Текст статьи номер {article_id}" for article_id in range(1, 6)}
+        )
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_search_hashes_only_changed_raw_texts(self) -> None:
+        """
+        Ensure that search reads no raw texts while the full-text index is up to date.
+        """
+        self.assertEqual(CorpusManager(TEST_PATH, lazy=True).search("номер 3"), {3})
+        (TEST_PATH / "2_raw.txt").write_text("Новый текст", encoding="utf-8")
+        with mock.patch("core_utils.article.manifest.hash_file", wraps=hash_file) as hashed:
+            corpus_manager = CorpusManager(TEST_PATH, lazy=True)
+            self.assertEqual(corpus_manager.search("новый текст", phrase=True), {2})
+            self.assertEqual(hashed.call_count, 1)
+            self.assertEqual(CorpusManager(TEST_PATH, lazy=True).search("статьи"), {1, 3, 4, 5})
+            self.assertEqual(hashed.call_count, 1)
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CorpusManagerSearchTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
@@ -0,0 +1,100 @@
+"""
+Tests for streaming articles of CorpusManager.
+"""
+
+# pylint: disable=protected-access
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.sidecars import remove_sidecars
+from lab_6_pipeline.pipeline import CorpusManager
+from lab_6_pipeline.tests.utils import articles_setup
+
+
+class CorpusManagerStreamingTest(unittest.TestCase):
+    """
+    Tests for iteration over articles in the lazy and the default modes.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for CorpusManagerStreamingTest class.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        self.texts = {article_id: f"Текст статьи номер {article_id}" for article_id in range(1, 6)}
+        articles_setup(self.texts)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_lazy_mode_does_not_keep_articles(self) -> None:
+        """
+        Ensure that the lazy mode yields every article without keeping it in _storage.
+        """
+        corpus_manager = CorpusManager(TEST_PATH, lazy=True)
+        self.assertEqual(corpus_manager._storage, {})
+
+        articles = list(corpus_manager.iter_articles(batch_size=2))
+        self.assertEqual([loaded.article_id for loaded in articles], list(self.texts))
+        self.assertEqual([loaded.text for loaded in articles], list(self.texts.values()))
+        self.assertEqual(corpus_manager._storage, {})
+
+        self.assertEqual(sorted(corpus_manager.get_articles()), list(self.texts))
+        self.assertEqual(sorted(corpus_manager._storage), list(self.texts))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_articles_are_selected_by_range_and_ids(self) -> None:
+        """
+        Ensure that start, stop and article_ids select articles yielded in the order of ids.
+        """
+        for lazy in (False, True):
+            corpus_manager = CorpusManager(TEST_PATH, lazy=lazy)
+
+            def get_ids(
+                corpus_manager: CorpusManager = corpus_manager, **kwargs: object
+            ) -> list[int]:
+                return [
+                    loaded.article_id
+                    for loaded in corpus_manager.iter_articles(**kwargs)  # type: ignore[arg-type]
+                ]
+
+            self.assertEqual(get_ids(start=2, stop=4), [2, 3])
+            self.assertEqual(get_ids(start=4), [4, 5])
+            self.assertEqual(get_ids(article_ids=[5, 1, 3]), [1, 3, 5])
+            self.assertEqual(get_ids(start=2, article_ids=[5, 1, 3, 9]), [3, 5])
+            self.assertEqual(get_ids(article_ids=[]), [])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_2_corpus_manager_checks
+    @pytest.mark.lab_6_pipeline
+    def test_raw_texts_are_read_by_batches(self) -> None:
+        """
+        Ensure that the lazy mode reads raw texts batch by batch, the default one up front.
+        """
+        with mock.patch.object(
+            CorpusManager, "_load", autospec=True, side_effect=CorpusManager._load
+        ) as load:
+            corpus_manager = CorpusManager(TEST_PATH, lazy=True)
+            self.assertEqual(load.call_count, 0)
+            list(corpus_manager.iter_articles(batch_size=2))
+            self.assertEqual([len(call.args[1]) for call in load.call_args_list], [2, 2, 1])
+
+            load.reset_mock()
+            corpus_manager = CorpusManager(TEST_PATH)
+            self.assertEqual([len(call.args[1]) for call in load.call_args_list], [5])
+            list(corpus_manager.iter_articles(batch_size=2))
+            self.assertEqual([len(call.args[1]) for call in load.call_args_list], [5, 0, 0, 0])
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for CorpusManagerStreamingTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
@@ -0,0 +1,97 @@
+"""
+Tests batched annotation of texts with a fake UDPipe model.
+"""
+
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.sidecars import remove_sidecars
+from lab_6_pipeline.pipeline import CorpusManager, TextProcessingPipeline, UDPipeAnalyzer
+from lab_6_pipeline.tests.utils import articles_setup, fake_model_setup
+
+
+class UDPipeBatchingTest(unittest.TestCase):
+    """
+    Tests that texts are handed over to the model in batches.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for UDPipeBatchingTest class.
+        """
+        self.model = fake_model_setup(self)
+        self.texts = [f"Мама мыла раму номер {index}." for index in range(1, 6)]
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_analyze_pipes_all_texts_at_once(self) -> None:
+        """
+        Ensure that analyze() gives all texts to one pipe() call with the configured batch size.
+        """
+        batched = UDPipeAnalyzer(batch_size=3).analyze(self.texts)
+        self.assertEqual(self.model.calls, [self.texts])
+        self.assertEqual(self.model.batch_sizes, [3])
+        self.assertEqual(self.model.process_counts, [1])
+
+        one_by_one = [UDPipeAnalyzer(batch_size=1).analyze([text])[0] for text in self.texts]
+        self.assertEqual(batched, one_by_one)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_pipeline_hands_over_batches(self) -> None:
+        """
+        Ensure that the pipeline annotates articles in batches of the given size and in order.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        self.addCleanup(shutil.rmtree, TEST_PATH)
+        self.addCleanup(remove_sidecars, TEST_PATH)
+        articles_setup(dict(enumerate(self.texts, start=1)))
+
+        pipeline = TextProcessingPipeline(
+            CorpusManager(TEST_PATH), UDPipeAnalyzer(batch_size=8), batch_size=2
+        )
+        pipeline.run()
+
+        self.assertEqual(self.model.calls, [self.texts[:2], self.texts[2:4], self.texts[4:]])
+        self.assertEqual(self.model.batch_sizes, [8] * 3)
+        for article_id, text in enumerate(self.texts, start=1):
+            conllu = (
+                Article(url=None, article_id=article_id)
+                .get_file_path(ArtifactType.UDPIPE_CONLLU)
+                .read_text(encoding="utf-8")
+            )
+            self.assertIn(f"# text = {text}\n", conllu)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_model_is_preloaded_before_workers_start(self) -> None:
+        """
+        Ensure that the multi-core mode loads the model in the parent before forking workers.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        self.addCleanup(shutil.rmtree, TEST_PATH)
+        self.addCleanup(remove_sidecars, TEST_PATH)
+        articles_setup(dict(enumerate(self.texts, start=1)))
+
+        pipeline = TextProcessingPipeline(
+            CorpusManager(TEST_PATH), UDPipeAnalyzer(), batch_size=2, max_workers=2
+        )
+        with mock.patch.object(UDPipeAnalyzer, "preload") as preload:
+            pipeline.run()
+        preload.assert_called_once_with()
+        for article_id, text in enumerate(self.texts, start=1):
+            conllu = (
+                Article(url=None, article_id=article_id)
+                .get_file_path(ArtifactType.UDPIPE_CONLLU)
+                .read_text(encoding="utf-8")
+            )
+            self.assertIn(f"# text = {text}\n", conllu)
@@ -0,0 +1,110 @@
+"""
+Tests annotation of long texts by chunks with a fake UDPipe model.
+"""
+
+import re
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.test_params import TEST_PATH
+from core_utils.annotation_cache import AnnotationCache
+from core_utils.article import article
+from core_utils.article.article import Article, ArtifactType
+from lab_6_pipeline.pipeline import UDPipeAnalyzer
+from lab_6_pipeline.tests.utils import FakeModel
+
+
+class UDPipeChunkingTest(unittest.TestCase):
+    """
+    Tests annotation of long texts by chunks.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for UDPipeChunkingTest class.
+        """
+        self.model = FakeModel()
+        patcher = mock.patch.object(
+            UDPipeAnalyzer, "_analyzer", new_callable=mock.PropertyMock, return_value=self.model
+        )
+        self.analyzer_property = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.text = "\n".join(
+            f"А. С. Пушкин написал {number} строк в г. Москве. Их прочли | все."
+            for number in range(20)
+        )
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_chunked_markup_equals_whole_markup(self) -> None:
+        """
+        Ensure that markup of a text split into chunks equals markup of the whole text.
+        """
+        texts = [self.text, "Короткий текст."]
+        whole = UDPipeAnalyzer(max_chunk_length=len(self.text)).analyze(texts)
+        self.assertEqual(self.model.texts, texts)
+
+        self.model.texts.clear()
+        chunked = UDPipeAnalyzer(max_chunk_length=200).analyze(texts)
+        self.assertGreater(len(self.model.texts), 2)
+        self.assertTrue(all(len(text) <= 200 for text in self.model.texts))
+        self.assertTrue(all(text.endswith("\n") for text in self.model.texts[:-2]))
+        self.assertEqual(chunked, whole)
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_long_line_is_split_at_sentences(self) -> None:
+        """
+        Ensure that a single line longer than the chunk length is annotated by chunks.
+        """
+        text = " ".join(f"А. С. Пушкин написал {number} строк в г. Москве." for number in range(20))
+        conllu = UDPipeAnalyzer(max_chunk_length=200).analyze([text])[0]
+        self.assertGreater(len(self.model.texts), 1)
+        self.assertTrue(all(len(chunk) <= 200 for chunk in self.model.texts))
+        self.assertEqual("".join(self.model.texts), text)
+        self.assertEqual(re.findall(r"# sent_id = (\d+)", conllu), [str(n) for n in range(1, 21)])
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_cache_keys_depend_on_chunk_length(self) -> None:
+        """
+        Ensure that markup cached for one chunk length is not used for another one.
+        """
+        TEST_PATH.mkdir(exist_ok=True)
+        self.addCleanup(shutil.rmtree, TEST_PATH)
+        with mock.patch("lab_6_pipeline.pipeline.get_model_hash", return_value="model"):
+            with AnnotationCache(TEST_PATH / "cache.sqlite") as cache:
+                UDPipeAnalyzer(cache=cache, max_chunk_length=200).analyze([self.text])
+                UDPipeAnalyzer(cache=cache, max_chunk_length=200).analyze([self.text])
+                self.assertEqual((cache.hits, cache.misses), (1, 1))
+                UDPipeAnalyzer(cache=cache, max_chunk_length=100).analyze([self.text])
+                self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_cached_articles_do_not_load_model(self) -> None:
+        """
+        Ensure that annotate_to_conllu() does not touch the model if every text is cached.
+        """
+        article.ASSETS_PATH = TEST_PATH
+        TEST_PATH.mkdir(exist_ok=True)
+        self.addCleanup(shutil.rmtree, TEST_PATH)
+        sample = Article(url=None, article_id=1)
+        sample.text = self.text
+        with mock.patch("lab_6_pipeline.pipeline.get_model_hash", return_value="model"):
+            with AnnotationCache(TEST_PATH / "cache.sqlite") as cache:
+                UDPipeAnalyzer(cache=cache).annotate_to_conllu([sample])
+                self.analyzer_property.reset_mock()
+                sample.get_file_path(ArtifactType.UDPIPE_CONLLU).unlink()
+                UDPipeAnalyzer(cache=cache).annotate_to_conllu([sample])
+                self.analyzer_property.assert_not_called()
+
+        conllu = sample.get_file_path(ArtifactType.UDPIPE_CONLLU).read_text(encoding="utf-8")
+        self.assertEqual(conllu, UDPipeAnalyzer().analyze([self.text])[0])
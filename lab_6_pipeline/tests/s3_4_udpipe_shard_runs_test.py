@@ -0,0 +1,76 @@
+"""
+Tests runs of the text pipeline over shards of the dataset with a fake UDPipe model.
+"""
+
+import shutil
+import unittest
+from unittest import mock
+
+import pytest
+
+from admin_utils.run_pipeline_shard import run_shard
+from admin_utils.test_params import TEST_PATH
+from core_utils.article import article
+from core_utils.article.article import Article, ArtifactType
+from core_utils.article.layout import get_article_dir
+from core_utils.article.sharding import ShardStrategy
+from core_utils.article.sidecars import remove_sidecars
+from lab_6_pipeline.tests.utils import articles_setup, fake_model_setup
+
+
+class ShardRunTest(unittest.TestCase):
+    """
+    Tests for processing of a dataset shard by admin_utils/run_pipeline_shard.py.
+    """
+
+    def setUp(self) -> None:
+        """
+        Define start instructions for ShardRunTest class.
+        """
+        self.model = fake_model_setup(self)
+        article.ASSETS_PATH = TEST_PATH
+        self.texts = {article_id: f"Мама мыла раму номер {article_id}." for article_id in (1, 2)}
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_shard_writes_artifacts_in_dataset_layout(self) -> None:
+        """
+        Ensure that a shard run writes artifacts with the shard depth of the dataset.
+        """
+        with mock.patch.object(article, "ASSETS_SHARD_DEPTH", 1):
+            articles_setup(self.texts)
+
+        with mock.patch.object(article, "ASSETS_SHARD_DEPTH", 0):
+            run_shard(TEST_PATH, "text", 1, 0, ShardStrategy.RANGE)
+            self.assertEqual(article.ASSETS_SHARD_DEPTH, 1)
+            for article_id in self.texts:
+                cleaned = Article(url=None, article_id=article_id).get_file_path(
+                    ArtifactType.CLEANED
+                )
+                self.assertEqual(cleaned.parent, get_article_dir(TEST_PATH, article_id, 1))
+                self.assertTrue(cleaned.exists())
+
+    @pytest.mark.mark10
+    @pytest.mark.stage_3_4_student_dataset_validation
+    @pytest.mark.lab_6_pipeline
+    def test_shard_reuses_cached_markup(self) -> None:
+        """
+        Ensure that a shard run with the cache takes markup annotated by an earlier run.
+        """
+        articles_setup(self.texts)
+
+        with mock.patch("lab_6_pipeline.pipeline.get_model_hash", return_value="model"):
+            run_shard(TEST_PATH, "text", 1, 0, ShardStrategy.RANGE, cache=True)
+            self.assertEqual(sum(map(len, self.model.calls)), len(self.texts))
+
+            self.model.calls.clear()
+            run_shard(TEST_PATH, "text", 1, 0, ShardStrategy.RANGE, force=True, cache=True)
+            self.assertEqual(self.model.calls, [])
+
+    def tearDown(self) -> None:
+        """
+        Define final instructions for ShardRunTest class.
+        """
+        shutil.rmtree(TEST_PATH)
+        remove_sidecars(TEST_PATH)
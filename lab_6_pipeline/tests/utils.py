@@ -4,9 +4,16 @@ Utils for lab_6_pipeline tests.
 
 # pylint: disable=too-few-public-methods
 import shutil
+import unittest
+from types import SimpleNamespace
+from typing import Iterable, Iterator
+from unittest import mock
 
 from admin_utils.test_params import PIPE_TEST_FILES_FOLDER, TEST_PATH
 from core_utils.article import article
+from core_utils.article.io import from_meta, to_meta, to_raw
+from core_utils.article.sentences import iter_sentences
+from core_utils.article.sidecars import remove_sidecars
 from core_utils.constants import ASSETS_PATH
 from core_utils.pipeline import LibraryWrapper
 from core_utils.tests.utils import copy_student_data
@@ -19,6 +26,79 @@ class AnalyzerMock(LibraryWrapper):
     """
 
 
+class FakeModel:
+    """
+    Fake UDPipe model marking up every sentence found by iter_sentences() and recording its input.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an instance of the FakeModel class.
+        """
+        self.texts: list[str] = []
+        self.calls: list[list[str]] = []
+        self.batch_sizes: list[int] = []
+        self.process_counts: list[int] = []
+
+    def pipe(self, texts: Iterable[str], batch_size: int, n_process: int) -> Iterator:
+        """
+        Mark up texts lazily, as spaCy does.
+
+        Args:
+            texts (Iterable[str]): Texts to mark up
+            batch_size (int): Number of texts processed at once
+            n_process (int): Number of processes
+
+        Yields:
+            SimpleNamespace: Document with CONLL-U markup of the text and of its sentences
+        """
+        self.batch_sizes.append(batch_size)
+        self.process_counts.append(n_process)
+        self.calls.append([])
+        for text in texts:
+            self.texts.append(text)
+            self.calls[-1].append(text)
+            sentences = []
+            for number, sentence in enumerate(iter_sentences(text), start=1):
+                words = str(sentence).split()
+                sentences.append(
+                    SimpleNamespace(
+                        _=SimpleNamespace(
+                            conll_str=f"# sent_id = {number}\n# text = {sentence}\n"
+                            + "".join(
+                                f"{index}\t{word}\t{word.lower()}\tX\t_\t_\t0\troot\t_\t_\n"
+                                for index, word in enumerate(words, start=1)
+                            )
+                        )
+                    )
+                )
+            yield SimpleNamespace(
+                sents=sentences,
+                _=SimpleNamespace(
+                    conll_str="\n".join(sentence._.conll_str for sentence in sentences)
+                ),
+            )
+
+
+def fake_model_setup(test_case: unittest.TestCase) -> FakeModel:
+    """
+    Make UDPipeAnalyzer use a fake model until the end of the test.
+
+    Args:
+        test_case (unittest.TestCase): Running test
+
+    Returns:
+        FakeModel: Model given to every analyzer
+    """
+    model = FakeModel()
+    patcher = mock.patch.object(
+        UDPipeAnalyzer, "_analyzer", new_callable=mock.PropertyMock, return_value=model
+    )
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+    return model
+
+
 def pipeline_test_files_setup(txt: bool = True, meta: bool = True) -> None:
     """
     Set up TEST_PATH to work with test files.
@@ -34,6 +114,24 @@ def pipeline_test_files_setup(txt: bool = True, meta: bool = True) -> None:
         shutil.copyfile(PIPE_TEST_FILES_FOLDER / "1_meta.json", TEST_PATH / "1_meta.json")
 
 
+def articles_setup(texts: dict[int, str]) -> None:
+    """
+    Set up TEST_PATH with raw texts and meta files of articles.
+
+    Meta information of every article is taken from the test files.
+
+    Args:
+        texts (dict[int, str]): Raw texts by article id
+    """
+    TEST_PATH.mkdir(exist_ok=True)
+    for article_id, text in texts.items():
+        sample = from_meta(PIPE_TEST_FILES_FOLDER / "1_meta.json")
+        sample.article_id = article_id
+        sample.text = text
+        to_raw(sample)
+        to_meta(sample)
+
+
 def pipeline_setup() -> None:
     """
     Set up TEST_PATH for MorphologicalAnalysisPipeline tests.
@@ -46,3 +144,4 @@ def pipeline_setup() -> None:
         corpus_manager = CorpusManager(path_to_raw_txt_data=TEST_PATH)
         pipe = TextProcessingPipeline(corpus_manager, UDPipeAnalyzer())
         pipe.run()
+        remove_sidecars(TEST_PATH)